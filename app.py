@@ -1,14 +1,19 @@
 import tkinter as tk
-from tkinter import ttk, StringVar, messagebox, Text, Scrollbar, Menu, simpledialog, Toplevel
+from tkinter import ttk, StringVar, messagebox, Text, Scrollbar, Menu, simpledialog, Toplevel, filedialog
 import webbrowser, pickle
 import pandas as pd
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import fitz  # PyMuPDF
 from PIL import Image, ImageTk  # Para manejar imágenes en Tkinter
-import io, sys, subprocess
+import io, os, sys, subprocess, threading, queue
 from src.data_operations import DataOperations
+from src.file_cache import ParsedFileCache
+from src.dtype_optimizer import compact_dtypes, format_memory_report
+from src.raw_binary import RAW_EXTENSIONS, find_layout
 from src.regression_analysis import RegressionAnalysis
+from src.recipes import recipe_from_history, save_recipe, load_recipe, apply_recipe
+from src.normalization import NORMALIZATION_METHODS
 
 class LaboratorySoftware:
     """
@@ -86,6 +91,7 @@ class LaboratorySoftware:
         self.main_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
         # Panel izquierdo para la tabla de datos
+        self.max_display_rows = 5000  # Filas máximas a insertar en la tabla
         self.data_frame = ttk.LabelFrame(self.main_frame, text="Datos Cargados", padding="5 5 5 5")
         self.main_frame.add(self.data_frame, weight=3)  # Mayor peso para el panel izquierdo
 
@@ -361,7 +367,7 @@ class LaboratorySoftware:
         style.configure("Treeview", rowheight=20)
         style.configure("Treeview.Heading", font=('Helvetica', 10, 'bold'))
 
-    def update_data_display(self, data: pd.DataFrame):
+    def update_data_display(self, data: pd.DataFrame, preview: bool = False):
         """
         Actualiza la tabla de tipo `Treeview` con los nuevos datos proporcionados en un DataFrame.
 
@@ -371,6 +377,8 @@ class LaboratorySoftware:
         Args:
             data (pd.DataFrame): Un DataFrame con los datos a mostrar. 
                 - Si el DataFrame es `None` o está vacío, se muestra un mensaje de "No hay datos disponibles".
+            preview (bool, optional): Si es True, los datos son la vista previa de un archivo que
+                aún se está cargando y el título del panel lo indica.
 
         Detalles:
             - Se limpia el contenido actual de la tabla antes de insertar nuevos datos.
@@ -380,6 +388,8 @@ class LaboratorySoftware:
 
         Notas:
             - El ancho inicial de las columnas se establece en 100 unidades, pero puede ser ajustado por el usuario.
+            - Solo se insertan las primeras `self.max_display_rows` filas; el título del panel indica
+              cuántas filas tiene el conjunto completo.
             - Se utiliza `self.no_data_label` para mostrar un mensaje de ausencia de datos cuando sea necesario.
 
         Ejemplo:
@@ -412,12 +422,23 @@ class LaboratorySoftware:
                 self.data_table.heading(col, text=col)
                 self.data_table.column(col, width=100)  # Ancho inicial
             
-            # Insertar datos
-            for idx, row in data.iterrows():
+            # Insertar datos (solo las primeras filas: Treeview no escala a millones de filas
+            # y llenarlo bloquearía el bucle de eventos tanto como el propio parseo)
+            for row in data.head(self.max_display_rows).itertuples(index=False):
                 values = [str(value) for value in row]
                 self.data_table.insert('', tk.END, values=values)
+
+            if preview:
+                self.data_frame.configure(
+                    text=f"Vista previa (primeras {len(data):,} filas, cargando el archivo completo...)")
+            elif len(data) > self.max_display_rows:
+                self.data_frame.configure(
+                    text=f"Datos Cargados (primeras {self.max_display_rows:,} de {len(data):,} filas)")
+            else:
+                self.data_frame.configure(text="Datos Cargados")
         else:
             # Mostrar el label de no datos
+            self.data_frame.configure(text="Datos Cargados")
             self.no_data_label.pack(pady=20)
 
     def setup_menus(self):
@@ -444,8 +465,19 @@ class LaboratorySoftware:
         # Menú Archivo
         file_menu = Menu(menubar, tearoff=0)
         file_menu.add_command(label="Importar", 
-                            command=lambda: self.data_ops.load_file(self.update_data_display))
+                            command=lambda: self.data_ops.load_file(
+                                self.update_data_display,
+                                preview_callback=lambda data: self.update_data_display(data, preview=True)))
+        file_menu.add_command(label="Importar lote de corridas", 
+                            command=lambda: self.data_ops.load_batch(self.update_data_display))
+        file_menu.add_command(label="Iniciar lectura en vivo", 
+                            command=lambda: self.data_ops.start_live_ingest(self.update_data_display))
+        file_menu.add_command(label="Detener lectura en vivo", 
+                            command=lambda: self.data_ops.stop_live_ingest(self.update_data_display))
         file_menu.add_command(label="Exportar", command=self.data_ops.export_results)
+        file_menu.add_command(label="Guardar receta", command=self.data_ops.save_recipe)
+        file_menu.add_command(label="Aplicar receta", 
+                            command=lambda: self.data_ops.apply_recipe(self.update_data_display))
         file_menu.add_separator()
         file_menu.add_command(label="Salir", command=self.root.quit)
         menubar.add_cascade(label="Archivo", menu=file_menu)
@@ -453,7 +485,11 @@ class LaboratorySoftware:
         # Menú Edición
         edit_menu = Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Edición", menu=edit_menu)
-        
+        edit_menu.add_command(label="Deshacer", 
+                              command=lambda: self.data_ops.undo(self.update_data_display))
+        edit_menu.add_command(label="Rehacer", 
+                              command=lambda: self.data_ops.redo(self.update_data_display))
+        edit_menu.add_separator()
 
         process_data_menu = Menu(edit_menu, tearoff=0)
         process_data_menu.add_command(label="Eliminar nulos", 
@@ -464,6 +500,17 @@ class LaboratorySoftware:
                                     command=lambda: self.data_ops.normalize_data(self.update_data_display))
         process_data_menu.add_command(label="Rellenar nulos con media", 
                                     command=lambda: self.data_ops.fill_null_with_mean(self.update_data_display))
+        process_data_menu.add_command(label="Optimizar memoria", 
+                                    command=lambda: self.data_ops.optimize_dtypes(self.update_data_display))
+        process_data_menu.add_separator()
+        self.lazy_var = tk.BooleanVar(value=self.data_ops.lazy)
+        process_data_menu.add_checkbutton(label="Ejecución diferida", variable=self.lazy_var,
+                                          command=lambda: setattr(self.data_ops, 'lazy', self.lazy_var.get()))
+        process_data_menu.add_command(label="Aplicar operaciones pendientes", 
+                                    command=lambda: self.data_ops.execute_plan(self.update_data_display))
+        process_data_menu.add_separator()
+        process_data_menu.add_command(label="Restaurar datos originales", 
+                                    command=lambda: self.data_ops.reset_data(self.update_data_display))
         edit_menu.add_cascade(label="Procesar datos", menu=process_data_menu)
 
         # Submenú de regresiones dentro de Edición
@@ -533,9 +580,22 @@ class LaboratorySoftware:
                 messagebox.showerror("Error", "No hay datos para exportar")
                 return False
             
-            # Guardar el DataFrame en un archivo .pkl
+            # Las columnas no cargadas al importar se traen antes de abrir el graficador
+            unloaded = self.data_ops.available_columns()[len(self.data_ops.data.columns):]
+            if unloaded and messagebox.askyesno(
+                    "Columnas sin cargar",
+                    f"Hay {len(unloaded)} columnas sin cargar. ¿Desea agregar algunas antes de graficar?"):
+                self.data_ops.ensure_columns(self.data_ops.select_columns(unloaded) or [])
+                self.update_data_display(self.data_ops.data)
+
+            # Guardar el DataFrame en un archivo .pkl, con el mínimo y el máximo de cada columna
+            # numérica tomados de la caché de estadísticas para los límites de los ejes
+            data = self.data_ops.data.copy(deep=False)
+            stats = self.data_ops.column_statistics()
+            data.attrs = dict(data.attrs, column_limits={col: (row['min'], row['max'])
+                                                         for col, row in stats.iterrows() if row['count'] > 0})
             with open('tmp_graph.pkl', 'wb') as f:
-                pickle.dump(self.data_ops.data, f)
+                pickle.dump(data, f)
 
             # Ejecutar el archivo graficador.py como un proceso independiente
             subprocess.Popen([sys.executable, 'src/graficador.py'])
@@ -671,7 +731,7 @@ class LaboratorySoftware:
             return
 
         # Obtener columnas disponibles
-        columns = list(self.data_ops.data.columns)
+        columns = self.data_ops.available_columns()
         
         # Diálogo para seleccionar variables
         dialog = VariableSelectionDialog(self.root, columns)
@@ -715,7 +775,7 @@ class LaboratorySoftware:
             return
 
         # Obtener columnas disponibles
-        columns = list(self.data_ops.data.columns)
+        columns = self.data_ops.available_columns()
         
         # Diálogo para seleccionar variables
         dialog = VariableSelectionDialog(self.root, columns)
@@ -759,7 +819,7 @@ class LaboratorySoftware:
             return
 
         # Obtener columnas disponibles
-        columns = list(self.data_ops.data.columns)
+        columns = self.data_ops.available_columns()
         
         # Diálogo para seleccionar variables
         dialog = VariableSelectionDialog(self.root, columns)
@@ -882,6 +942,79 @@ class VariableSelectionDialog:
             self.result = (self.var_x.get(), self.var_y.get())
             self.dialog.destroy()
 
+class LoadCancelled(Exception):
+    """Excepción usada para interrumpir una importación cancelada por el usuario."""
+
+
+class LoadProgressDialog:
+    """
+    Ventana no modal que muestra el progreso de una importación en segundo plano.
+
+    Attributes:
+        dialog (tk.Toplevel): Ventana de progreso.
+        progress_bar (ttk.Progressbar): Barra determinada si se conoce la fracción leída,
+                                        o indeterminada mientras no se reciba progreso.
+        status (ttk.Label): Texto con el número de filas o archivos leídos.
+    """
+
+    def __init__(self, parent, description, on_cancel, unit="filas"):
+        """
+        Crea la ventana de progreso.
+
+        Args:
+            parent (tk.Tk): Ventana principal.
+            description (str): Texto que describe la importación en curso.
+            on_cancel (callable): Función a llamar cuando el usuario pulsa "Cancelar".
+            unit (str, optional): Unidad del progreso mostrado ("filas" o "archivos").
+        """
+        self.dialog = tk.Toplevel(parent)
+        self.dialog.title("Importando datos")
+        self.dialog.resizable(False, False)
+        self.dialog.transient(parent)
+        self._on_cancel = on_cancel
+        self.unit = unit
+
+        ttk.Label(self.dialog, text=description).pack(padx=20, pady=(15, 5))
+        self.progress_bar = ttk.Progressbar(self.dialog, length=300, mode='indeterminate', maximum=100)
+        self.progress_bar.pack(padx=20, pady=5)
+        self.progress_bar.start(10)
+        self.status = ttk.Label(self.dialog, text="Leyendo archivo...")
+        self.status.pack(padx=20, pady=5)
+        self.cancel_button = ttk.Button(self.dialog, text="Cancelar", command=self.cancel)
+        self.cancel_button.pack(pady=(5, 15))
+
+        self.dialog.protocol("WM_DELETE_WINDOW", self.cancel)
+
+    def update(self, done, fraction):
+        """
+        Actualiza la barra y el texto de progreso.
+
+        Args:
+            done (int): Filas o archivos leídos hasta el momento.
+            fraction (float): Fracción leída, entre 0 y 1.
+        """
+        if str(self.progress_bar['mode']) != 'determinate':
+            self.progress_bar.stop()
+            self.progress_bar.configure(mode='determinate')
+        self.progress_bar['value'] = fraction * 100
+        self.status.configure(text=f"{self.unit.capitalize()}: {done:,} ({fraction:.0%})")
+
+    def cancel(self):
+        """
+        Solicita la cancelación de la importación y cierra la ventana.
+        """
+        self._on_cancel()
+        self.close()
+
+    def close(self):
+        """
+        Cierra la ventana si aún existe.
+        """
+        if self.dialog.winfo_exists():
+            self.progress_bar.stop()
+            self.dialog.destroy()
+
+
 class DataOperationsWithUI(DataOperations):
     """
     Extensión de DataOperations que integra callbacks para la interfaz de usuario.
@@ -896,30 +1029,360 @@ class DataOperationsWithUI(DataOperations):
         DataOperations: Clase base con operaciones de datos fundamentales.
     """
     
+    # Número de columnas a partir del cual se ofrece cargar solo algunas
+    WIDE_FILE_COLUMNS = 20
+    # Filas de la vista previa que se muestra mientras se carga el archivo completo
+    PREVIEW_ROWS = 2000
+    # Celdas (filas x columnas) a interpolar a partir de las cuales conviene repartir las columnas
+    # entre procesos; por debajo, iniciar los procesos cuesta más de lo que se gana
+    PARALLEL_INTERPOLATION_CELLS = 5_000_000
+
     def __init__(self, ui_container):
         """
-        Inicializa la clase con una referencia al contenedor de UI.
+        Inicializa la clase con una referencia al contenedor de UI y activa la caché de
+        archivos parseados en el directorio de caché del usuario.
         
         Args:
             ui_container: Referencia al objeto que contiene los elementos de la UI.
         """
-        super().__init__()
+        super().__init__(cache=ParsedFileCache())
         self.ui_container = ui_container
+        self._load_thread = None
+        self._live_updates = None
 
-    def load_file(self, ui_callback=None):
+    def load_file(self, ui_callback=None, preview_callback=None, **load_options):
         """
-        Carga un archivo y actualiza la UI si es exitoso.
+        Carga un archivo en un hilo de trabajo y actualiza la UI cuando termina.
+
+        El parseo se ejecuta fuera del hilo principal de Tk, de modo que la ventana sigue
+        respondiendo mientras se lee el archivo. Una ventana de progreso muestra las filas
+        leídas y permite cancelar la importación. El DataFrame terminado se entrega a
+        `ui_callback` desde el bucle de eventos de Tk. Si el archivo es un libro de Excel con
+        varias hojas, antes de leerlo se pregunta cuál cargar.
+
+        Si se indica `preview_callback`, la carga tiene dos fases: primero se leen las primeras
+        `PREVIEW_ROWS` filas y se entregan a `preview_callback` para mostrarlas de inmediato, y
+        luego el archivo completo reemplaza la vista previa al terminar de cargarse.
         
         Args:
             ui_callback (callable, optional): Función a llamar para actualizar la UI con los datos cargados.
+            preview_callback (callable, optional): Función a llamar con la vista previa del archivo.
+            **load_options: Opciones de carga que se pasan a `DataOperations.read_file`
+                (por ejemplo `chunksize`, `memory_limit` o `engine`), además de `keep_original`
+                y `optimize`.
         
         Returns:
-            bool: True si la carga fue exitosa, False en caso contrario
+            bool: True si la importación se inició, False si se canceló la selección del archivo
+            o ya hay otra importación o una lectura en vivo en curso.
+        """
+        if self._load_in_progress() or self._live_ingest_blocks_load():
+            return False
+
+        file_path = load_options.pop('file_path', None) or filedialog.askopenfilename(filetypes=self.LOAD_FILETYPES)
+        if not file_path:
+            return False
+
+        # En libros con varias hojas se pregunta cuál cargar antes de leer las celdas
+        if file_path.endswith(('.xlsx', '.xls')) and 'sheet_name' not in load_options:
+            try:
+                sheets = self.excel_sheets(file_path)
+            except Exception as e:
+                messagebox.showerror("Error", f"No se pudo abrir el libro. Detalles: {e}")
+                return False
+            if len(sheets) > 1:
+                sheet = self.select_option("Seleccionar hoja", sheets, prompt="Seleccione la hoja a cargar:")
+                if sheet not in sheets:
+                    return False
+                load_options['sheet_name'] = sheet
+
+        # Los binarios sin descripción junto al archivo necesitan que se indique su formato
+        if file_path.endswith(RAW_EXTENSIONS) and 'raw_layout' not in load_options and find_layout(file_path) is None:
+            raw_layout = self.ask_raw_layout()
+            if raw_layout is None:
+                return False
+            load_options['raw_layout'] = raw_layout
+
+        # En archivos anchos se ofrece cargar solo algunas columnas; las demás se leen al usarlas
+        if 'usecols' not in load_options and 'columns' not in load_options:
+            try:
+                columns = self.read_columns(file_path, **load_options)
+            except Exception:
+                columns = []
+            if len(columns) > self.WIDE_FILE_COLUMNS and messagebox.askyesno(
+                    "Cargar columnas",
+                    f"El archivo tiene {len(columns)} columnas. ¿Desea cargar solo algunas?\n"
+                    "Las demás se leerán del archivo cuando se necesiten."):
+                usecols = self.select_columns(columns)
+                if usecols:
+                    load_options['usecols'] = usecols
+
+        keep_original = load_options.pop('keep_original', True)
+        optimize = load_options.pop('optimize', False)
+
+        def task(report_progress):
+            # Los archivos de texto y JSON se leen por bloques para poder informar el progreso y cancelar
+            if (self.is_text_file(file_path) and load_options.get('engine', 'c') == 'c') or \
+                    self.is_json_file(file_path):
+                load_options.setdefault('progress_callback', report_progress)
+            data = self.read_file(file_path, **load_options)
+            mensaje = self._load_message()
+            if optimize:
+                data, report = compact_dtypes(data)
+                mensaje += "\n\nMemoria:\n" + format_memory_report(report)
+            return data, lambda: mensaje
+
+        preview_task = None
+        if preview_callback is not None:
+            preview_task = lambda: self.read_preview(file_path, self.PREVIEW_ROWS, **load_options)
+
+        return self._load_in_background(f"Cargando {os.path.basename(file_path)}", task,
+                                        keep_original, ui_callback, source_path=file_path,
+                                        source_options=load_options, preview_task=preview_task,
+                                        preview_callback=preview_callback)
+
+    def load_batch(self, ui_callback=None, **load_options):
+        """
+        Carga en segundo plano todos los archivos de un directorio como un único conjunto de datos.
+
+        Cada archivo se parsea en un proceso independiente y las filas se identifican con la
+        columna `run_id`. Al terminar se muestra el rendimiento total en filas por segundo.
+
+        Args:
+            ui_callback (callable, optional): Función a llamar para actualizar la UI con los datos cargados.
+            **load_options: Opciones de `DataOperations.read_batch` (`pattern`, `max_workers` y
+                opciones de lectura), además de `source` y `keep_original`.
+
+        Returns:
+            bool: True si la importación se inició, False en caso contrario.
+        """
+        if self._load_in_progress() or self._live_ingest_blocks_load():
+            return False
+
+        source = load_options.pop('source', None) or filedialog.askdirectory(title="Seleccione el directorio de corridas")
+        if not source:
+            return False
+
+        keep_original = load_options.pop('keep_original', True)
+
+        def task(report_progress):
+            data, stats = self.read_batch(source, progress_callback=report_progress, **load_options)
+            return data, lambda: self._batch_message(stats)
+
+        return self._load_in_background(f"Cargando lote de {os.path.basename(source) or source}", task,
+                                        keep_original, ui_callback, unit="archivos")
+
+    def start_live_ingest(self, ui_callback=None, **live_options):
         """
-        success = super().load_file()
-        if success and ui_callback:
+        Sigue en vivo un archivo que el software de adquisición está escribiendo.
+
+        La tabla se actualiza con las filas nuevas como mucho cada `refresh_interval`
+        segundos. Las actualizaciones del hilo de lectura se aplican en el hilo de Tk a través
+        de una cola revisada con `root.after`.
+
+        Args:
+            ui_callback (callable, optional): Función a llamar con los datos en cada actualización.
+            **live_options: Opciones de `DataOperations.start_live_ingest` (`max_rows`,
+                `refresh_interval`, `read_options`), además de `file_path`.
+
+        Returns:
+            bool: True si la lectura en vivo se inició, False en caso contrario.
+        """
+        if self._load_in_progress():
+            return False
+        if self.is_live_ingest_running():
+            messagebox.showwarning("Advertencia", "Ya hay una lectura en vivo en curso")
+            return False
+
+        file_path = live_options.pop('file_path', None) or filedialog.askopenfilename(
+            title="Seleccione el archivo en adquisición",
+            filetypes=[("Archivos CSV/TXT", "*.csv *.txt"), ("Todos los archivos", "*")])
+        if not file_path:
+            return False
+
+        updates = queue.Queue()
+        root = self.ui_container.root
+        refresh_ms = int(live_options.get('refresh_interval', 0.5) * 1000)
+        self._live_updates = updates
+
+        def poll():
+            latest = None
+            try:
+                while True:
+                    message = updates.get_nowait()
+                    if message[0] == 'error':
+                        super(DataOperationsWithUI, self).stop_live_ingest()
+                        if ui_callback and self.data is not None:
+                            ui_callback(self.data)
+                        messagebox.showerror("Error", f"Se detuvo la lectura en vivo. Detalles: {message[1]}")
+                        return
+                    latest = message
+            except queue.Empty:
+                pass
+            if latest is not None:
+                super(DataOperationsWithUI, self)._apply_live_data(latest[1], latest[2])
+            if self.is_live_ingest_running():
+                root.after(refresh_ms, poll)
+
+        try:
+            super().start_live_ingest(file_path, callback=ui_callback,
+                                      error_callback=lambda e: updates.put(('error', e)),
+                                      **live_options)
+        except Exception as e:
+            messagebox.showerror("Error", f"No se pudo iniciar la lectura en vivo. Detalles: {e}")
+            return False
+        root.after(refresh_ms, poll)
+        return True
+
+    def _apply_live_data(self, data, callback=None):
+        """
+        Encola una actualización de la lectura en vivo para aplicarla en el hilo de Tk.
+
+        Args:
+            data (pd.DataFrame): Filas del búfer.
+            callback (callable, optional): Función que recibe los datos actualizados.
+        """
+        self._live_updates.put(('data', data, callback))
+
+    def stop_live_ingest(self, ui_callback=None, keep_original=True):
+        """
+        Detiene la lectura en vivo, fija los datos leídos y actualiza la UI.
+
+        Args:
+            ui_callback (callable, optional): Función a llamar con los datos finales.
+            keep_original (bool, optional): Si se guarda la copia de los datos originales.
+
+        Returns:
+            dict: Estadísticas de la lectura, o None si no había una lectura en vivo.
+        """
+        stats = super().stop_live_ingest(keep_original=keep_original)
+        if stats is None:
+            messagebox.showwarning("Advertencia", "No hay una lectura en vivo en curso")
+            return None
+
+        if ui_callback and self.data is not None:
             ui_callback(self.data)
-        return success
+        mensaje = f"Lectura en vivo detenida: {stats['filas']:,} filas leídas, {stats['conservadas']:,} conservadas"
+        if stats['descartadas']:
+            mensaje += f" ({stats['descartadas']:,} filas antiguas descartadas por el límite del búfer)"
+        messagebox.showinfo("Éxito", mensaje)
+        return stats
+
+    def ask_raw_layout(self):
+        """
+        Pregunta al usuario el formato de un archivo binario de adquisición.
+
+        Returns:
+            dict: Descripción del formato para `read_raw_binary`, o None si se cancela.
+        """
+        channels = simpledialog.askstring("Formato binario", "Nombres de los canales, separados por comas:")
+        if not channels:
+            return None
+        dtype = simpledialog.askstring("Formato binario", "Tipo de cada muestra (por ejemplo <f4 para float32):",
+                                       initialvalue="<f4")
+        if not dtype:
+            return None
+        sample_rate = simpledialog.askfloat("Formato binario",
+                                            "Frecuencia de muestreo en Hz (cancelar si no se conoce):",
+                                            minvalue=0)
+        header_bytes = simpledialog.askinteger("Formato binario", "Bytes de encabezado a omitir:",
+                                               initialvalue=0, minvalue=0)
+        return {'dtype': dtype, 'channels': [name.strip() for name in channels.split(',') if name.strip()],
+                'sample_rate': sample_rate, 'header_bytes': header_bytes or 0}
+
+    def _load_in_progress(self):
+        """
+        Indica si ya hay una importación en curso y, en ese caso, avisa al usuario.
+
+        Returns:
+            bool: True si hay una importación en curso.
+        """
+        if self._load_thread is not None and self._load_thread.is_alive():
+            messagebox.showwarning("Advertencia", "Ya hay una importación en curso")
+            return True
+        return False
+
+    def _load_in_background(self, description, task, keep_original, ui_callback, unit="filas",
+                            source_path=None, source_options=None, preview_task=None,
+                            preview_callback=None):
+        """
+        Ejecuta una tarea de carga en un hilo de trabajo con una ventana de progreso.
+
+        El hilo de trabajo solo se comunica con la UI a través de una cola que se revisa con
+        `root.after`, por lo que Tk nunca se usa fuera del hilo principal.
+
+        Args:
+            description (str): Texto a mostrar en la ventana de progreso.
+            task (callable): Función que recibe un callback de progreso y retorna una tupla
+                (DataFrame, función sin argumentos que construye el mensaje de éxito).
+            keep_original (bool): Si se guarda la copia de los datos originales.
+            ui_callback (callable, optional): Función a llamar con los datos cargados.
+            unit (str, optional): Unidad que cuenta el progreso ("filas" o "archivos").
+            source_path (str, optional): Archivo de origen, para traer después columnas no cargadas.
+            source_options (dict, optional): Opciones de lectura usadas con `source_path`.
+            preview_task (callable, optional): Función sin argumentos que lee una vista previa
+                antes de `task`. Si falla, la carga sigue sin vista previa.
+            preview_callback (callable, optional): Función a llamar con la vista previa.
+
+        Returns:
+            bool: True, ya que la importación queda iniciada.
+        """
+        cancel_event = threading.Event()
+        results = queue.Queue()
+
+        def report_progress(done, fraction):
+            if cancel_event.is_set():
+                raise LoadCancelled()
+            results.put(('progress', done, fraction))
+
+        def worker():
+            if preview_task is not None:
+                try:
+                    results.put(('preview', preview_task()))
+                except Exception:
+                    pass  # La vista previa es opcional; la carga completa informará cualquier error
+            try:
+                results.put(('done',) + tuple(task(report_progress)))
+            except LoadCancelled:
+                results.put(('cancelled',))
+            except Exception as e:
+                results.put(('error', e))
+
+        root = self.ui_container.root
+        progress = LoadProgressDialog(root, description, cancel_event.set, unit=unit)
+        previewed = [False]
+
+        def poll():
+            try:
+                while True:
+                    message = results.get_nowait()
+                    if message[0] == 'progress':
+                        progress.update(message[1], message[2])
+                        continue
+                    if message[0] == 'preview':
+                        previewed[0] = True
+                        preview_callback(message[1])
+                        continue
+
+                    progress.close()
+                    if message[0] == 'done' and not cancel_event.is_set():
+                        self._set_loaded_data(message[1], keep_original=keep_original,
+                                              source_path=source_path, source_options=source_options)
+                        if ui_callback:
+                            ui_callback(self.data)
+                        messagebox.showinfo("Éxito", message[2]())
+                    else:
+                        if previewed[0] and ui_callback:
+                            ui_callback(self.data)  # Se retira la vista previa del archivo no cargado
+                        if message[0] == 'error':
+                            messagebox.showerror("Error", f"No se pudo cargar el archivo. Detalles: {message[1]}")
+                    return
+            except queue.Empty:
+                root.after(100, poll)
+
+        self._load_thread = threading.Thread(target=worker, daemon=True)
+        self._load_thread.start()
+        root.after(100, poll)
+        return True
 
     def remove_null_values(self, ui_callback=None):
         """
@@ -929,33 +1392,207 @@ class DataOperationsWithUI(DataOperations):
         ui_callback (callable, optional): Función que se llama para actualizar la UI con los datos modificados, si se proporciona.
         """
         super().remove_null_values()
-        if ui_callback:
-            ui_callback(self.data)
+        self._refresh(ui_callback)
 
     def remove_duplicates(self, ui_callback=None):
         """
         Elimina las filas duplicadas del conjunto de datos y actualiza la UI si se proporciona un callback.
 
+        Pregunta si se comparan solo algunas columnas y con qué tolerancia se comparan las
+        columnas decimales.
+
         Args:
         ui_callback (callable, optional): Función que se llama para actualizar la UI con los datos modificados, si se proporciona.
         """
-        super().remove_duplicates()
+        if self._data is None:
+            messagebox.showwarning("Advertencia", "Primero debes cargar los datos")
+            return
+        subset = None
+        if messagebox.askyesno("Eliminar duplicados", "¿Desea comparar solo algunas columnas?"):
+            subset = self.select_columns()
+            if not subset:
+                return
+        tolerance = simpledialog.askstring(
+            "Eliminar duplicados", "Tolerancia para comparar columnas numéricas (vacío para comparación exacta):")
+        try:
+            tolerance = float(tolerance) if tolerance else None
+            super().remove_duplicates(subset, tolerance)
+        except (KeyError, ValueError) as e:
+            messagebox.showerror("Error", f"No se pudieron eliminar los duplicados. Detalles: {e}")
+            return
+        self._refresh(ui_callback)
+
+    def save_recipe(self, file_path=None):
+        """
+        Guarda las operaciones del historial como una receta JSON para repetirlas en otras corridas.
+
+        La receta se puede aplicar desde este menú o, sin interfaz y en paralelo sobre muchos
+        archivos, con `python -m src.recipes`.
+
+        Args:
+            file_path (str, optional): Ruta de destino. Si es None, se abre un diálogo para elegirla.
+
+        Returns:
+            bool: True si se guardó la receta.
+        """
+        if not self.transformation_history:
+            messagebox.showwarning("Advertencia", "No hay operaciones en el historial")
+            return False
+        try:
+            recipe = recipe_from_history(self.transformation_history)
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return False
+        file_path = file_path or filedialog.asksaveasfilename(
+            defaultextension=".json", filetypes=[("Recetas", "*.json")])
+        if not file_path:
+            return False
+        save_recipe(recipe, file_path)
+        messagebox.showinfo("Éxito", f"Receta de {len(recipe['steps'])} pasos guardada en {file_path}")
+        return True
+
+    def apply_recipe(self, ui_callback=None, file_path=None):
+        """
+        Aplica a los datos cargados las operaciones de una receta guardada.
+
+        Los pasos usan los parámetros guardados en la receta, sin pedir datos al usuario.
+
+        Args:
+            ui_callback (callable, optional): Función que se llama para actualizar la UI con los datos modificados, si se proporciona.
+            file_path (str, optional): Receta a aplicar. Si es None, se abre un diálogo para elegirla.
+
+        Returns:
+            bool: True si se aplicó la receta.
+        """
+        if self._data is None:
+            messagebox.showwarning("Advertencia", "Primero debes cargar los datos")
+            return False
+        file_path = file_path or filedialog.askopenfilename(filetypes=[("Recetas", "*.json")])
+        if not file_path:
+            return False
+
+        self.interactive = False
+        self.notifications = []
+        try:
+            recipe = load_recipe(file_path)
+            apply_recipe(self, recipe)
+            data = self.data
+        except Exception as e:
+            messagebox.showerror("Error", f"No se pudo aplicar la receta. Detalles: {e}")
+            return False
+        finally:
+            self.interactive = True
+
+        problems = [message for kind, _, message in self.notifications if kind != 'info']
+        message = f"Se aplicaron {len(recipe['steps'])} pasos de la receta"
+        if problems:
+            message += ":\n" + "\n".join(problems)
+        messagebox.showinfo("Éxito", message)
         if ui_callback:
+            ui_callback(data)
+        return True
+
+    def _refresh(self, ui_callback=None):
+        """
+        Actualiza la UI tras una operación; en modo diferido solo informa que quedó pendiente.
+
+        Args:
+        ui_callback (callable, optional): Función que se llama para actualizar la UI con los datos modificados, si se proporciona.
+        """
+        if self.has_pending_operations():
+            messagebox.showinfo("Ejecución diferida",
+                                f"Operación agregada al plan ({len(self.pending_operations())} pendientes). "
+                                "Se aplicará al mostrar, graficar o exportar los datos.")
+        elif ui_callback:
+            ui_callback(self.data)
+
+    def execute_plan(self, ui_callback=None):
+        """
+        Ejecuta las operaciones diferidas pendientes y actualiza la UI si se proporciona un callback.
+
+        Args:
+        ui_callback (callable, optional): Función que se llama para actualizar la UI con los datos modificados, si se proporciona.
+        """
+        pending = len(self.pending_operations())
+        if not pending:
+            messagebox.showinfo("Ejecución diferida", "No hay operaciones pendientes")
+            return
+        data = super().execute_plan()
+        details = [entry['details'] for entry in self.transformation_history[-pending:]]
+        messagebox.showinfo("Éxito", "Operaciones aplicadas:\n" + "\n".join(details))
+        if ui_callback:
+            ui_callback(data)
+
+    def undo(self, ui_callback=None):
+        """
+        Deshace la última operación y actualiza la UI si se proporciona un callback.
+
+        Args:
+        ui_callback (callable, optional): Función que se llama para actualizar la UI con los datos modificados, si se proporciona.
+        """
+        if super().undo() and ui_callback:
+            ui_callback(self.data)
+
+    def redo(self, ui_callback=None):
+        """
+        Rehace la última operación deshecha y actualiza la UI si se proporciona un callback.
+
+        Args:
+        ui_callback (callable, optional): Función que se llama para actualizar la UI con los datos modificados, si se proporciona.
+        """
+        if super().redo() and ui_callback:
+            ui_callback(self.data)
+
+    def optimize_dtypes(self, ui_callback=None):
+        """
+        Compacta los tipos de datos y actualiza la UI si se proporciona un callback.
+
+        Antes de compactar, permite elegir las columnas flotantes que pueden guardarse en
+        float32 sin perder la precisión del sensor; si no se elige ninguna, solo se compactan
+        los enteros y las etiquetas de texto.
+
+        Args:
+        ui_callback (callable, optional): Función que se llama para actualizar la UI con los datos modificados, si se proporciona.
+        """
+        if self.data is None:
+            messagebox.showwarning("Advertencia", "Primero debes cargar los datos")
+            return
+
+        float32_columns = []
+        if messagebox.askyesno("Optimizar memoria",
+                               "¿Desea guardar algunas columnas flotantes en float32 (precisión de ~7 cifras)?"):
+            float32_columns = self.select_columns() or []
+
+        if super().optimize_dtypes(float32_columns=float32_columns) is not None and ui_callback:
             ui_callback(self.data)
 
-    def select_columns(self):
+    def reset_data(self, ui_callback=None):
+        """
+        Restaura los datos originales y actualiza la UI si se proporciona un callback.
+
+        Args:
+        ui_callback (callable, optional): Función que se llama para actualizar la UI con los datos restaurados, si se proporciona.
+        """
+        if super().reset_data() and ui_callback:
+            ui_callback(self.data)
+
+    def select_columns(self, columns=None):
         """
         Muestra una ventana emergente con checkboxes para que el usuario seleccione columnas.
 
+        Args:
+            columns (list, optional): Columnas a ofrecer. Por defecto las de los datos cargados.
+
         Returns:
             list: Una lista de las columnas seleccionadas por el usuario. Si no se seleccionan columnas 
             o no hay datos cargados, retorna None.
         """
-        if self.data is None:
-            messagebox.showwarning("Advertencia", "Primero debes cargar los datos.")
-            return None
-
-        columns = list(self.data.columns)
+        if columns is None:
+            # Las operaciones diferidas no cambian las columnas: no hace falta ejecutar el plan
+            if self._data is None:
+                messagebox.showwarning("Advertencia", "Primero debes cargar los datos.")
+                return None
+            columns = list(self._data.columns)
         if not columns:
             messagebox.showwarning("Advertencia", "No hay columnas disponibles.")
             return None
@@ -975,9 +1612,9 @@ class DataOperationsWithUI(DataOperations):
             var = StringVar(value="")
             checkbox = ttk.Checkbutton(
                 popup, 
-                text=col, 
+                text=str(col), 
                 variable=var, 
-                onvalue=col, 
+                onvalue=str(col), 
                 offvalue=""
             )
             checkbox.pack(anchor="w", padx=20, pady=5)
@@ -987,7 +1624,7 @@ class DataOperationsWithUI(DataOperations):
             # Guardar las columnas seleccionadas
             for col, var in column_vars.items():
                 if var.get():
-                    selected_columns.append(var.get())
+                    selected_columns.append(col)
             popup.destroy()
 
         btn_confirm = ttk.Button(popup, text="Confirmar", command=confirm_selection)
@@ -1017,46 +1654,19 @@ class DataOperationsWithUI(DataOperations):
         if not selected_columns:
             return
 
-        methods = ["Min-Max Scaling", "Z-Score Scaling", "Max Abs Scaling"]
-        selected_method = self.select_option("Método de Normalización", methods)
+        selected_method = self.select_option("Método de Normalización", list(NORMALIZATION_METHODS))
 
         if not selected_method:
             return
 
-        # Copia de los datos originales para comparar al final
-        original_data = self.data[selected_columns].copy()
-
-        # Aplicar normalización según el método seleccionado
-        for col in selected_columns:
-            if self.data[col].notnull().any():  # Solo aplica si la columna no está completamente vacía
-                if selected_method == "Min-Max Scaling":
-                    min_val = self.data[col].min()
-                    max_val = self.data[col].max()
-                    if max_val != min_val:
-                        self.data[col] = (self.data[col] - min_val) / (max_val - min_val)
-                    else:
-                        self.data[col] = 0  # Caso especial: todos los valores son iguales
-
-                elif selected_method == "Z-Score Scaling":
-                    mean_val = self.data[col].mean()
-                    std_val = self.data[col].std()
-                    if std_val != 0:
-                        self.data[col] = (self.data[col] - mean_val) / std_val
-                    else:
-                        self.data[col] = 0  # Caso especial: desviación estándar es 0
-
-                elif selected_method == "Max Abs Scaling":
-                    max_abs_val = self.data[col].abs().max()
-                    if max_abs_val != 0:
-                        self.data[col] = self.data[col] / max_abs_val
-                    else:
-                        self.data[col] = 0  # Caso especial: todos los valores son 0
-
-        # Comparar filas afectadas
-        affected_rows = (self.data[selected_columns] != original_data).any(axis=1).sum()
-
-        # Registrar y mostrar el mensaje
-        self._add_to_history('normalize_data', f'Normalizadas las columnas {", ".join(selected_columns)} usando {selected_method}')
+        try:
+            affected_rows = super().normalize_data(selected_columns, selected_method)
+        except (KeyError, ValueError) as e:
+            messagebox.showerror("Error", str(e))
+            return
+        if affected_rows is None:
+            self._refresh(ui_callback)
+            return
         messagebox.showinfo("Éxito", f"Datos normalizados. Se afectaron {affected_rows} filas.")
         if ui_callback:
             ui_callback(self.data)
@@ -1081,16 +1691,8 @@ class DataOperationsWithUI(DataOperations):
         if not selected_columns:
             return
 
-        for col in selected_columns:
-            if self.data[col].isnull().any():
-                self.data[col].fillna(self.data[col].mean(), inplace=True)
-
-        self._add_to_history('fill_null_with_mean',
-                             f'Rellenados valores nulos en columnas: {", ".join(selected_columns)}')
-
-        if ui_callback:
-            ui_callback(self.data)
-        messagebox.showinfo("Éxito", "Valores nulos rellenados con la media.")
+        self.fill_null_values(method='mean', columns=selected_columns)
+        self._refresh(ui_callback)
 
     def fill_null_values_with_dialog(self, ui_callback=None):
         """
@@ -1134,6 +1736,24 @@ class DataOperationsWithUI(DataOperations):
                 return
             degree = int(degree)
 
+        # Por defecto el polinomio se ajusta a toda la serie; con una ventana, a los puntos cercanos a cada hueco
+        window = None
+        if selected_method == "Interpolación Polinomial":
+            window = simpledialog.askstring(
+                "Ventana", "Puntos a cada lado de cada hueco para ajustar el polinomio (vacío para toda la "
+                f"serie; por ejemplo {degree + 1}):")
+            if window and not window.isdigit():
+                messagebox.showerror("Error", "Número de puntos no válido.")
+                return
+            window = int(window) if window else None
+
+        # Con muchas celdas las columnas se interpolan en paralelo. El número de procesos lo elige
+        # la interfaz y queda en el historial; al repetir una receta cada paso cubre una sola
+        # columna, así que se interpola en un solo proceso
+        workers = None
+        if len(selected_columns) > 1 and len(self.data) * len(selected_columns) >= self.PARALLEL_INTERPOLATION_CELLS:
+            workers = os.cpu_count()
+
         # Mapear el método seleccionado al argumento para fill_null_values
         method_mapping = {
             "Media": "mean",
@@ -1144,19 +1764,25 @@ class DataOperationsWithUI(DataOperations):
         selected_method_key = method_mapping.get(selected_method)
 
         # Aplicar el método seleccionado solo a las columnas seleccionadas
-        self.fill_null_values(method=selected_method_key, degree=degree, columns=selected_columns)
+        try:
+            self.fill_null_values(method=selected_method_key, degree=degree, columns=selected_columns,
+                                  window=window, workers=workers)
+        except ValueError as e:
+            messagebox.showerror("Error", f"No se pudieron rellenar los nulos. Detalles: {e}")
+            return
         if ui_callback:
             ui_callback(self.data)
 
 
 
-    def select_option(self, title, options):
+    def select_option(self, title, options, prompt="Seleccione un método:"):
         """
         Muestra un cuadro de diálogo con botones de radio para seleccionar una opción.
 
         Args:
             title (str): Título del cuadro de diálogo.
             options (list): Opciones para mostrar en los botones de radio.
+            prompt (str, optional): Texto que se muestra sobre las opciones.
 
         Returns:
             str: La opción seleccionada por el usuario, o None si la ventana se cierra.
@@ -1168,7 +1794,7 @@ class DataOperationsWithUI(DataOperations):
         selected_option = StringVar()
         selected_option.set(None)  # Ninguna selección inicial
 
-        label = ttk.Label(popup, text="Seleccione un método:", font=("Helvetica", 12))
+        label = ttk.Label(popup, text=prompt, font=("Helvetica", 12))
         label.pack(pady=10)
 
         # Crear botones de radio para cada opción
@@ -0,0 +1,79 @@
+"""
+Benchmark de los motores de lectura CSV de `DataOperations.read_file`.
+
+Genera un volcado sintético de sensores (tiempo, posición, velocidad, aceleración y
+etiqueta de corrida) y compara el tiempo de carga del parser C de pandas con el lector
+multihilo de PyArrow, con y sin columnas respaldadas por Arrow.
+
+Uso:
+    python benchmarks/bench_csv_engines.py --rows 10000000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.data_operations import DataOperations
+
+
+def generar_volcado(path, rows, seed=0):
+    """Escribe un CSV con `rows` filas de lecturas simuladas de un sensor."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(rows) * 1e-3
+    data = pd.DataFrame({
+        'tiempo': t,
+        'posicion': 0.5 * 9.81 * t ** 2 + rng.normal(0, 1e-3, rows),
+        'velocidad': 9.81 * t + rng.normal(0, 1e-2, rows),
+        'aceleracion': 9.81 + rng.normal(0, 5e-2, rows),
+        'corrida': rng.integers(0, 50, rows),
+    })
+    data.to_csv(path, index=False)
+
+
+def medir(ops, path, repeats, **options):
+    """Retorna el mejor tiempo (s) de `repeats` lecturas con las opciones dadas."""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        ops.read_file(path, **options)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=10_000_000, help='filas del volcado sintético')
+    parser.add_argument('--repeats', type=int, default=3, help='repeticiones por motor')
+    parser.add_argument('--file', help='CSV existente a usar en lugar del sintético')
+    args = parser.parse_args()
+
+    ops = DataOperations()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.file
+        if path is None:
+            path = os.path.join(tmp, 'volcado_sensor.csv')
+            print(f"Generando {args.rows:,} filas en {path} ...")
+            generar_volcado(path, args.rows)
+        size_mb = os.path.getsize(path) / 1e6
+
+        casos = [
+            ("pandas C (NumPy)", {'engine': 'c'}),
+            ("pandas C por bloques", {'engine': 'c', 'chunksize': 1_000_000}),
+            ("PyArrow (NumPy)", {'engine': 'pyarrow'}),
+            ("PyArrow (Arrow)", {'engine': 'pyarrow', 'dtype_backend': 'pyarrow'}),
+        ]
+        print(f"Archivo: {size_mb:.1f} MB, núcleos disponibles: {os.cpu_count()}")
+        base = None
+        for nombre, opciones in casos:
+            segundos = medir(ops, path, args.repeats, **opciones)
+            base = base or segundos
+            print(f"{nombre:<22} {segundos:8.2f} s  {size_mb / segundos:8.1f} MB/s  x{base / segundos:.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark de la lectura de libros de Excel de `DataOperations.read_file`.
+
+Genera un libro sintético con una hoja de portada y una hoja de datos de sensores
+(tiempo, posición, velocidad, aceleración y etiqueta de corrida) y compara la lectura
+con el motor por defecto de pandas (openpyxl) contra el lector calamine, leyendo la hoja
+completa o solo un rango acotado de filas y columnas.
+
+Uso:
+    python benchmarks/bench_excel_engines.py --rows 500000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.data_operations import DataOperations
+
+HOJA_DATOS = 'Datos'
+
+
+def generar_libro(path, rows, seed=0):
+    """Escribe un libro con una hoja de portada y `rows` filas de lecturas simuladas."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(rows) * 1e-3
+    data = pd.DataFrame({
+        'tiempo': t,
+        'posicion': 0.5 * 9.81 * t ** 2 + rng.normal(0, 1e-3, rows),
+        'velocidad': 9.81 * t + rng.normal(0, 1e-2, rows),
+        'aceleracion': 9.81 + rng.normal(0, 5e-2, rows),
+        'corrida': rng.integers(0, 50, rows),
+    })
+    portada = pd.DataFrame({'campo': ['Práctica', 'Grupo'], 'valor': ['Caída libre', 'A1']})
+    with pd.ExcelWriter(path, engine='openpyxl') as writer:
+        portada.to_excel(writer, sheet_name='Portada', index=False)
+        data.to_excel(writer, sheet_name=HOJA_DATOS, index=False)
+
+
+def medir(leer, repeats):
+    """Retorna el mejor tiempo (s) de `repeats` llamadas a `leer`."""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        leer()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=500_000, help='filas de la hoja de datos')
+    parser.add_argument('--repeats', type=int, default=3, help='repeticiones por caso')
+    parser.add_argument('--file', help='libro existente a usar en lugar del sintético')
+    parser.add_argument('--sheet', default=HOJA_DATOS, help='hoja a leer del libro')
+    args = parser.parse_args()
+
+    ops = DataOperations()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.file
+        if path is None:
+            path = os.path.join(tmp, 'libro_sensor.xlsx')
+            print(f"Generando {args.rows:,} filas en {path} ...")
+            generar_libro(path, args.rows)
+        size_mb = os.path.getsize(path) / 1e6
+
+        casos = [
+            ("openpyxl (hoja completa)",
+             lambda: pd.read_excel(path, sheet_name=args.sheet, engine='openpyxl')),
+            ("read_file (hoja completa)",
+             lambda: ops.read_file(path, sheet_name=args.sheet)),
+            ("read_file (A:B, 10000 filas)",
+             lambda: ops.read_file(path, sheet_name=args.sheet, usecols='A:B', nrows=10_000)),
+        ]
+        print(f"Archivo: {size_mb:.1f} MB, motor de read_file: {ops.excel_engine() or 'openpyxl'}")
+        base = None
+        for nombre, leer in casos:
+            segundos = medir(leer, args.repeats)
+            base = base or segundos
+            print(f"{nombre:<30} {segundos:8.2f} s  x{base / segundos:.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark de la lectura de NDJSON de `DataOperations.read_file`.
+
+Genera un volcado sintético en JSON delimitado por líneas, como el que emiten las cajas de
+sensores (tiempo, aceleraciones, temperatura y estado), y compara los registros por segundo
+de `pd.read_json(lines=True)` con la lectura por bloques con PyArrow de `read_file`.
+
+Uso:
+    python benchmarks/bench_json_reader.py --rows 2000000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from src.data_operations import DataOperations
+
+
+def generar_volcado(path, rows, seed=0):
+    """Escribe un NDJSON con `rows` registros de lecturas simuladas de un sensor."""
+    rng = np.random.default_rng(seed)
+    data = pd.DataFrame({
+        'tiempo': np.arange(rows) * 1e-3,
+        'ax': rng.normal(0, 0.05, rows),
+        'ay': rng.normal(0, 0.05, rows),
+        'az': 9.81 + rng.normal(0, 0.05, rows),
+        'temperatura': 21.5 + rng.normal(0, 0.2, rows),
+        'estado': rng.choice(['ok', 'saturado'], rows, p=[0.99, 0.01]),
+    })
+    data.to_json(path, orient='records', lines=True)
+
+
+def medir(leer, repeats):
+    """Retorna el mejor tiempo (s) de `repeats` llamadas a `leer` y el número de registros."""
+    best = float('inf')
+    rows = 0
+    for _ in range(repeats):
+        start = time.perf_counter()
+        rows = len(leer())
+        best = min(best, time.perf_counter() - start)
+    return best, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=2_000_000, help='registros del volcado sintético')
+    parser.add_argument('--repeats', type=int, default=3, help='repeticiones por caso')
+    parser.add_argument('--file', help='NDJSON existente a usar en lugar del sintético')
+    args = parser.parse_args()
+
+    ops = DataOperations()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.file
+        if path is None:
+            path = os.path.join(tmp, 'volcado_sensor.ndjson')
+            print(f"Generando {args.rows:,} registros en {path} ...")
+            generar_volcado(path, args.rows)
+        size_mb = os.path.getsize(path) / 1e6
+
+        casos = [
+            ("pd.read_json(lines=True)", lambda: pd.read_json(path, lines=True)),
+            ("read_file (PyArrow por bloques)", lambda: ops.read_file(path)),
+            ("read_file (tipos de Arrow)", lambda: ops.read_file(path, dtype_backend='pyarrow')),
+        ]
+        print(f"Archivo: {size_mb:.1f} MB, núcleos disponibles: {os.cpu_count()}")
+        base = None
+        for nombre, leer in casos:
+            segundos, rows = medir(leer, args.repeats)
+            base = base or segundos
+            print(f"{nombre:<32} {segundos:8.2f} s  {rows / segundos:12,.0f} registros/s  x{base / segundos:.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,227 @@
+import numpy as np
+import pandas as pd
+
+from src.history import RowDropDelta, AffineDelta, CellFillDelta
+from src.normalization import column_block, block_statistics
+
+STAT_FIELDS = ('count', 'nulls', 'min', 'max', 'sum', 'm2', 'absmax')
+
+
+def _summary(values):
+    """Estadísticas de un arreglo de valores sueltos, con NaN en los nulos."""
+    values = np.asarray(values, dtype=np.float64)
+    stats = block_statistics(values.reshape(-1, 1))
+    part = {key: float(value[0]) for key, value in stats.items()}
+    part['count'] = int(part['count'])
+    part['nulls'] = len(values) - part['count']
+    return part
+
+
+class ColumnStatsCache:
+    """
+    Caché de estadísticas por columna numérica que se mantiene al día con cada operación.
+
+    Guarda por columna el número de valores (`count`), de nulos (`nulls`), el mínimo, el
+    máximo, la suma, la suma de cuadrados de las desviaciones respecto a la media (`m2`) y el
+    máximo valor absoluto (`absmax`). Las columnas se leen una sola vez, la primera vez que se
+    piden; después cada cambio registrado en el historial (`RowDropDelta`, `AffineDelta` o
+    `CellFillDelta`) actualiza las estadísticas de las columnas que modifica sin volver a
+    recorrerlas:
+
+    - Un escalado `(x - offset) / scale` se propaga de forma exacta a todas las estadísticas.
+    - Las celdas rellenadas y las filas reinsertadas se combinan con la fórmula de Chan para
+      medias y `m2`.
+    - Al quitar valores (filas eliminadas o celdas que vuelven a ser nulas) la suma y `m2` se
+      descuentan; si entre los valores quitados está el mínimo o el máximo, la columna se
+      descarta y se vuelve a leer cuando se necesite.
+
+    La suma de cuadrados se guarda centrada (`m2`) porque `sum(x**2) - sum(x)**2 / n` pierde
+    toda la precisión en columnas con media grande y varianza pequeña, como las marcas de tiempo.
+    """
+
+    def __init__(self):
+        self._stats = {}
+
+    def __contains__(self, column):
+        return column in self._stats
+
+    def statistics(self, data, columns, block=None):
+        """
+        Estadísticas de varias columnas; solo se leen las que no están en la caché.
+
+        Args:
+            data (pd.DataFrame): Datos actuales.
+            columns (list): Columnas numéricas.
+            block (np.ndarray, optional): Bloque de `column_block(data, columns)` si quien llama
+                ya lo leyó; se usa para calcular las columnas que faltan sin volver a leerlas.
+
+        Returns:
+            dict: Arreglos por columna 'count', 'nulls', 'min', 'max', 'sum', 'm2', 'absmax' y
+            'mean', nuevos en cada llamada. Una columna sin valores tiene min = inf,
+            max = absmax = -inf y media NaN, como en `block_statistics`.
+        """
+        columns = list(columns)
+        n_rows = len(data)
+        missing = [i for i, col in enumerate(columns)
+                   if col not in self._stats or self._stats[col]['count'] + self._stats[col]['nulls'] != n_rows]
+        if missing:
+            if block is None:
+                sub_block = column_block(data, [columns[i] for i in missing])
+            else:
+                sub_block = block[:, missing]
+            computed = block_statistics(sub_block)
+            for j, i in enumerate(missing):
+                entry = {key: float(value[j]) for key, value in computed.items()}
+                entry['count'] = int(entry['count'])
+                entry['nulls'] = n_rows - entry['count']
+                self._stats[columns[i]] = self._complete(entry)
+
+        stats = {field: np.array([self._stats[col][field] for col in columns], dtype=np.float64)
+                 for field in STAT_FIELDS}
+        stats['count'] = stats['count'].astype(np.int64)
+        stats['nulls'] = stats['nulls'].astype(np.int64)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            stats['mean'] = np.where(stats['count'] > 0, stats['sum'] / stats['count'], np.nan)
+        return stats
+
+    def frame(self, data, columns):
+        """
+        Estadísticas de varias columnas como tabla.
+
+        Args:
+            data (pd.DataFrame): Datos actuales.
+            columns (list): Columnas numéricas.
+
+        Returns:
+            pd.DataFrame: Una fila por columna y una columna por estadístico.
+        """
+        return pd.DataFrame(self.statistics(data, columns), index=list(columns))
+
+    def invalidate(self, columns=None):
+        """
+        Descarta las estadísticas de algunas columnas, o de todas.
+
+        Args:
+            columns (list, optional): Columnas a descartar. Si es None, se vacía la caché.
+        """
+        if columns is None:
+            self._stats.clear()
+        else:
+            for col in columns:
+                self._stats.pop(col, None)
+
+    def apply(self, delta):
+        """
+        Actualiza las estadísticas con un cambio recién aplicado a los datos.
+
+        Args:
+            delta (RowDropDelta, AffineDelta or CellFillDelta): Cambio registrado en el historial.
+        """
+        self._update(delta, forward=True)
+
+    def revert(self, delta):
+        """
+        Actualiza las estadísticas con un cambio recién deshecho.
+
+        Args:
+            delta (RowDropDelta, AffineDelta or CellFillDelta): Cambio deshecho.
+        """
+        self._update(delta, forward=False)
+
+    def _update(self, delta, forward):
+        """Propaga un cambio, o su inversa, a las columnas que están en la caché."""
+        if isinstance(delta, RowDropDelta):
+            for col in [col for col in delta.rows.columns if col in self._stats]:
+                if not pd.api.types.is_numeric_dtype(delta.rows[col]):
+                    self._stats.pop(col)
+                    continue
+                part = _summary(delta.rows[col].to_numpy(dtype=np.float64, na_value=np.nan))
+                if forward:
+                    self._remove(col, part, nulls_change=-part['nulls'])
+                else:
+                    self._add(col, part, nulls_change=part['nulls'])
+        elif isinstance(delta, AffineDelta):
+            for col, (offset, scale, dtype) in delta.params.items():
+                if col not in self._stats:
+                    continue
+                if forward:
+                    self._scale(col, offset, scale)
+                elif pd.api.types.is_integer_dtype(dtype):
+                    self._stats.pop(col)  # Deshacer redondea los valores: se vuelven a leer
+                else:
+                    self._scale(col, offset, scale, inverse=True)
+        elif isinstance(delta, CellFillDelta):
+            for col, (_, values) in delta.cells.items():
+                if col not in self._stats:
+                    continue
+                part = _summary(values)
+                if forward:
+                    self._add(col, part, nulls_change=-part['count'])
+                else:
+                    self._remove(col, part, nulls_change=part['count'])
+
+    @staticmethod
+    def _complete(entry):
+        """Completa `absmax` y normaliza la entrada de una columna sin valores."""
+        if entry['count'] == 0:
+            entry.update(sum=0.0, m2=0.0, min=np.inf, max=-np.inf)
+        entry['absmax'] = max(entry['max'], -entry['min'])
+        entry.pop('mean', None)
+        return entry
+
+    def _add(self, col, part, nulls_change):
+        """Combina con la columna los valores resumidos en `part`."""
+        entry = self._stats[col]
+        n1, n2 = entry['count'], part['count']
+        if n2:
+            n = n1 + n2
+            delta = part['sum'] / n2 - (entry['sum'] / n1 if n1 else 0.0)
+            entry['m2'] += part['m2'] + (delta * delta * n1 * n2 / n if n1 else 0.0)
+            entry['sum'] += part['sum']
+            entry['count'] = n
+            entry['min'] = min(entry['min'], part['min'])
+            entry['max'] = max(entry['max'], part['max'])
+        entry['nulls'] += nulls_change
+        self._complete(entry)
+
+    def _remove(self, col, part, nulls_change):
+        """Descuenta de la columna los valores resumidos en `part`."""
+        entry = self._stats[col]
+        n1, n2 = entry['count'], part['count']
+        if n2:
+            # Los extremos propagados pueden diferir de los datos en el último decimal
+            margin = 1e-9 * entry['absmax']
+            if part['min'] <= entry['min'] + margin or part['max'] >= entry['max'] - margin:
+                self._stats.pop(col)  # Se quitó un extremo: no se conoce el siguiente
+                return
+            n = n1 - n2
+            rest_sum = entry['sum'] - part['sum']
+            delta = part['sum'] / n2 - rest_sum / n
+            entry['m2'] = max(entry['m2'] - part['m2'] - delta * delta * n * n2 / n1, 0.0)
+            entry['sum'] = rest_sum
+            entry['count'] = n
+        entry['nulls'] += nulls_change
+        self._complete(entry)
+
+    def _scale(self, col, offset, scale, inverse=False):
+        """
+        Propaga `(x - offset) / scale`, o su inversa `x * scale + offset`, a las estadísticas.
+
+        El mínimo y el máximo se transforman con las mismas operaciones que `AffineDelta`
+        aplica a los datos, así que coinciden exactamente con los extremos de la columna.
+        """
+        entry = self._stats[col]
+        if not np.isfinite(scale) or scale == 0:
+            self._stats.pop(col)  # Los valores pasan a ser NaN o infinitos
+            return
+        if entry['count']:
+            if inverse:
+                bounds = sorted((entry['min'] * scale + offset, entry['max'] * scale + offset))
+                total = entry['sum'] * scale + entry['count'] * offset
+                m2 = entry['m2'] * (scale * scale)
+            else:
+                bounds = sorted(((entry['min'] - offset) / scale, (entry['max'] - offset) / scale))
+                total = (entry['sum'] - entry['count'] * offset) / scale
+                m2 = entry['m2'] / (scale * scale)
+            entry.update(min=bounds[0], max=bounds[1], sum=total, m2=m2)
+        self._complete(entry)
@@ -0,0 +1,85 @@
+import os
+import bz2
+import gzip
+import lzma
+from contextlib import contextmanager
+
+COMPRESSION_EXTENSIONS = {
+    '.gz': 'gzip',
+    '.bz2': 'bz2',
+    '.xz': 'xz',
+    '.zst': 'zstd',
+}
+
+
+def split_compression(file_path):
+    """
+    Separa la extensión de compresión de una ruta.
+
+    Args:
+        file_path (str): Ruta del archivo, por ejemplo `corrida.csv.gz`.
+
+    Returns:
+        tuple: (ruta sin la extensión de compresión, nombre de la compresión o None).
+    """
+    base, extension = os.path.splitext(file_path)
+    compression = COMPRESSION_EXTENSIONS.get(extension.lower())
+    if compression is None:
+        return file_path, None
+    return base, compression
+
+
+def wrap_decompressor(raw, compression):
+    """
+    Envuelve un archivo binario abierto en un lector que lo descomprime al vuelo.
+
+    El lector no cierra `raw`, de modo que quien lo abrió puede seguir consultando
+    `raw.tell()` para conocer cuántos bytes comprimidos se han consumido.
+
+    Args:
+        raw (file): Archivo abierto en modo binario.
+        compression (str): 'gzip', 'bz2', 'xz', 'zstd' o None.
+
+    Returns:
+        file: Objeto de lectura binaria con los datos descomprimidos.
+
+    Raises:
+        ImportError: Si la compresión es 'zstd' y no está instalado `zstandard`.
+    """
+    if compression is None:
+        return raw
+    if compression == 'gzip':
+        return gzip.GzipFile(fileobj=raw, mode='rb')
+    if compression == 'bz2':
+        return bz2.BZ2File(raw, mode='rb')
+    if compression == 'xz':
+        return lzma.LZMAFile(raw, mode='rb')
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError("Se necesita el paquete 'zstandard' para leer archivos .zst") from e
+        return zstandard.ZstdDecompressor().stream_reader(raw, closefd=False)
+    raise ValueError(f"Compresión no soportada: {compression}")
+
+
+@contextmanager
+def open_binary(file_path, mode='rb'):
+    """
+    Abre un archivo para lectura binaria, descomprimiéndolo si su extensión lo indica.
+
+    Args:
+        file_path (str): Ruta del archivo.
+        mode (str, optional): Solo se admite 'rb'; existe por compatibilidad con `open`.
+
+    Yields:
+        file: Objeto de lectura binaria con los datos descomprimidos.
+    """
+    compression = split_compression(file_path)[1]
+    with open(file_path, mode) as raw:
+        stream = wrap_decompressor(raw, compression)
+        try:
+            yield stream
+        finally:
+            if stream is not raw:
+                stream.close()
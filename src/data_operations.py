@@ -1,3 +1,9 @@
+import os
+import glob
+import json
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import pandas as pd
 import numpy as np
 from sklearn.linear_model import LinearRegression
@@ -5,6 +11,80 @@ from sklearn.neighbors import KNeighborsRegressor
 from sklearn.model_selection import train_test_split
 from tkinter import filedialog, messagebox
 from datetime import datetime
+from src.file_cache import ParsedFileCache
+from src.memmap_store import MemmapFrameStore
+from src.text_sniffer import sniff_text_format
+from src.compressed_io import split_compression, wrap_decompressor, open_binary
+from src.dtype_optimizer import compact_dtypes, format_memory_report
+from src.live_ingest import LiveIngest
+from src.json_reader import JSON_EXTENSIONS, read_json_records
+from src.raw_binary import RAW_EXTENSIONS, read_raw_binary
+from src.history import RowDropDelta, CellFillDelta
+from src.normalization import NORMALIZATION_METHODS, Normalizer, column_block
+from src.column_stats import ColumnStatsCache
+from src.duplicates import duplicated_rows, duplicates_scope
+from src.knn_impute import knn_impute
+from src.interpolation import interpolate_columns
+from src.lazy_plan import PlanStep, DropNullRowsStep, DropDuplicatesStep, NormalizeStep, FillMeanStep, run_plan
+
+def _read_batch_file(file_path, read_options, cache=None):
+    """
+    Lee un archivo de un lote dentro de un proceso de trabajo.
+
+    Se define a nivel de módulo para que `ProcessPoolExecutor` pueda serializarla.
+
+    Args:
+        file_path (str): Ruta del archivo.
+        read_options (dict): Opciones para `DataOperations.read_file`.
+        cache (ParsedFileCache, optional): Caché de archivos parseados compartida en disco.
+
+    Returns:
+        pd.DataFrame: Datos del archivo.
+    """
+    return DataOperations(cache=cache).read_file(file_path, **read_options)
+
+
+def _free_column_name(columns, name):
+    """
+    Retorna `name` si no está entre `columns`; si no, el primer `name_1`, `name_2`, ... libre.
+    """
+    taken = set(map(str, columns))
+    candidate, suffix = name, 0
+    while candidate in taken:
+        suffix += 1
+        candidate = f"{name}_{suffix}"
+    return candidate
+
+
+def _run_ids(files):
+    """
+    Identificador de cada archivo de un lote: su nombre sin la compresión ni la extensión.
+
+    Los nombres repetidos (el mismo archivo en dos directorios) reciben un sufijo `_2`, `_3`, ...
+    para que cada archivo tenga un identificador único.
+
+    Args:
+        files (list): Rutas de los archivos.
+
+    Returns:
+        list: Identificadores, en el mismo orden que `files`.
+    """
+    names = [os.path.splitext(os.path.basename(split_compression(path)[0]))[0] for path in files]
+    run_ids, used = [], set(names)
+    counts = {}
+    for name in names:
+        counts[name] = counts.get(name, 0) + 1
+        if counts[name] == 1:
+            run_ids.append(name)
+            continue
+        candidate = f"{name}_{counts[name]}"
+        while candidate in used:
+            counts[name] += 1
+            candidate = f"{name}_{counts[name]}"
+        used.add(candidate)
+        run_ids.append(candidate)
+    return run_ids
+
 
 class DataOperations:
     """
@@ -40,16 +120,42 @@ class DataOperations:
     
     Attributos:
         data (pd.DataFrame): DataFrame actual con los datos procesados.
-        original_data (pd.DataFrame): Copia de los datos originales sin procesar.
+        original_data (pd.DataFrame): Copia de los datos originales sin procesar. Con
+                                      `original_storage='memmap'` se reconstruye desde disco
+                                      en cada acceso.
+        original_storage (str): 'memory' o 'memmap'. Dónde se guardan los datos originales.
+        lazy (bool): Si es True, las operaciones compatibles se registran en un plan diferido
+                     que se ejecuta, fusionado, la próxima vez que se leen los datos.
+        interactive (bool): Si es False, no se abre ningún diálogo de Tk: los mensajes se
+                            guardan en `notifications` y se usan los parámetros recibidos.
+        notifications (list): Mensajes (tipo, título, texto) emitidos sin interfaz.
         transformation_history (list): Lista de diccionarios con el historial de transformaciones.
                                      Cada entrada contiene:
                                      - operation: nombre de la operación
                                      - timestamp: momento de la ejecución
                                      - details: detalles específicos
                                      - rows_affected: número de filas afectadas
+                                     - params: parámetros para repetir la operación
+                                       (ver `src.recipes`)
     """
 
-    def __init__(self):
+    TEXT_EXTENSIONS = ('.csv', '.txt')
+    # Opciones de lectura que se reutilizan al traer columnas adicionales del archivo de origen
+    SOURCE_OPTIONS = ('engine', 'dtype_backend', 'sniff', 'use_cache', 'sheet_name', 'nrows', 'raw_layout')
+    COLUMNAR_EXTENSIONS = ('.parquet', '.feather', '.arrow')
+    LOAD_FILETYPES = [
+        ("Archivos CSV", "*.csv"),
+        ("Archivos TXT", "*.txt"),
+        ("Registros comprimidos", "*.csv.gz *.csv.bz2 *.csv.xz *.csv.zst *.txt.gz *.txt.bz2 *.txt.xz *.txt.zst "
+                                  "*.ndjson.gz *.ndjson.zst *.jsonl.gz *.jsonl.zst"),
+        ("Archivos JSON", "*.json *.ndjson *.jsonl"),
+        ("Archivos Excel", "*.xlsx *.xls"),
+        ("Archivos Parquet", "*.parquet"),
+        ("Archivos Feather", "*.feather *.arrow"),
+        ("Binarios de adquisición", "*.bin *.dat *.raw")
+    ]
+
+    def __init__(self, cache=None, original_storage='memory', lazy=False, interactive=True):
         """
         Inicializa la clase DataOperations con un DataFrame vacío y una lista para registrar transformaciones.
         Aquí no realiza ninguna operación en los datos iniciales, sino que almacena los datos originales
@@ -57,57 +163,992 @@ class DataOperations:
         
         Parameters
         ----------
-        None
+        cache : ParsedFileCache, optional
+            Caché en disco de archivos parseados. Si es None, cada carga vuelve a parsear el archivo.
+        original_storage : str, optional
+            'memory' guarda `original_data` como copia en RAM; 'memmap' guarda las columnas
+            numéricas en archivos de solo lectura mapeados en memoria. Por defecto es 'memory'.
+        lazy : bool, optional
+            Si es True, `remove_null_values`, `remove_duplicates`, `normalize_data` y el relleno
+            con la media se registran como un plan que se ejecuta al leer `data`. Por defecto es False.
+        interactive : bool, optional
+            Si es False, las operaciones no muestran cuadros de mensaje ni piden datos al usuario,
+            para poder ejecutarlas sin interfaz (por ejemplo al reproducir una receta). Por
+            defecto es True.
         """
-        self.data = None
-        self.original_data = None
+        self._plan = []
+        self._data = None
+        self.column_stats = ColumnStatsCache()
+        self.lazy = lazy
+        self.interactive = interactive
+        self.notifications = []
+        self.original_storage = original_storage
+        self._original_data = None
+        self._original_store = None
         self.transformation_history = []
+        self._undo_stack = []
+        self._redo_stack = []
+        self.cache = cache
+        self._live = None
+        self.source_path = None
+        self.source_options = {}
+        self._source_columns = None
+
+    def _notify(self, kind, title, message):
+        """
+        Informa al usuario con un cuadro de mensaje o, sin interfaz, guarda el mensaje.
+
+        Args:
+            kind (str): 'info', 'warning' o 'error'.
+            title (str): Título del mensaje.
+            message (str): Texto del mensaje.
+        """
+        if self.interactive:
+            getattr(messagebox, f'show{kind}')(title, message)
+        else:
+            self.notifications.append((kind, title, message))
 
-    def load_file(self):
+    def load_file(self, file_path=None, keep_original=True, optimize=False, **read_options):
         """
-        Permite al usuario seleccionar y cargar un archivo de datos, desde un archivo CSV, TXT o Excel.
+        Permite al usuario seleccionar y cargar un archivo de datos, desde un archivo CSV, TXT, JSON,
+        Excel, Parquet, Feather (Arrow IPC) o binario de adquisición.
 
         Parameters
         ----------
-        file_path : str
-            La ruta al archivo que se desea cargar.
+        file_path : str, optional
+            La ruta al archivo que se desea cargar. Si es None, se abre un diálogo para seleccionarlo.
+        keep_original : bool, optional
+            Si es False, no se guarda la copia de los datos originales en `original_data`,
+            lo que evita duplicar la memoria ocupada en archivos muy grandes.
+        optimize : bool, optional
+            Si es True, se compactan los tipos de datos al cargar (ver `optimize_dtypes`).
+        **read_options
+            Opciones de lectura que se pasan a `read_file`: `chunksize`, `memory_limit`,
+            `progress_callback`, `engine`, `dtype_backend`, `columns`, `sniff`, `use_cache`,
+            `sheet_name`, `usecols`, `nrows` y `raw_layout`.
 
         Returns
         -------
-        pd.DataFrame
-            DataFrame que contiene los datos cargados.
+        bool
+            True si el archivo se cargó correctamente, False en caso contrario.
 
         Raises
         ------
         ValueError
-            Si el archivo no tiene extensión .csv  .xlsx o .txt.
+            Si el archivo no tiene extensión .csv, .txt, .json, .ndjson, .jsonl, .xlsx, .xls,
+            .parquet, .feather, .arrow, .bin, .dat o .raw, o si un archivo binario no tiene
+            descripción de formato.
         """
-        file = filedialog.askopenfilename(filetypes=[
-            ("Archivos CSV", "*.csv"),
-            ("Archivos TXT", "*.txt"),
-            ("Archivos Excel", "*.xlsx *.xls")
-        ])
+        if self._live_ingest_blocks_load():
+            return False
+        if file_path is None:
+            file_path = filedialog.askopenfilename(filetypes=self.LOAD_FILETYPES)
         
-        if file:
+        if file_path:
             try:
-                if file.endswith('.csv'):
-                    self.data = pd.read_csv(file)
-                elif file.endswith('.txt'):
-                    self.data = pd.read_csv(file, delimiter='\t')
-                else:
-                    self.data = pd.read_excel(file)
-                
-                self.original_data = self.data.copy()
-                self.transformation_history = []
+                data = self.read_file(file_path, **read_options)
+                mensaje = self._load_message()
+                if optimize:
+                    data, report = compact_dtypes(data)
+                    mensaje += "\n\nMemoria:\n" + format_memory_report(report)
+                self._set_loaded_data(data, keep_original=keep_original,
+                                      source_path=file_path, source_options=read_options)
                 
-                messagebox.showinfo("Éxito", "Archivo cargado correctamente")
+                self._notify('info', "Éxito", mensaje)
                 return True
             except Exception as e:
-                messagebox.showerror("Error", f"No se pudo cargar el archivo. Detalles: {e}")
+                self._notify('error', "Error", f"No se pudo cargar el archivo. Detalles: {e}")
                 return False
         return False
 
-    def _add_to_history(self, operation_name, details=None):
+    def read_file(self, file_path, chunksize=None, memory_limit=None, progress_callback=None,
+                  engine='c', dtype_backend=None, columns=None, sniff=True, use_cache=True,
+                  sheet_name=0, usecols=None, nrows=None, raw_layout=None):
+        """
+        Lee un archivo de datos y lo retorna como DataFrame, sin modificar el estado de la clase
+        ni mostrar mensajes de la interfaz.
+
+        Args:
+            file_path (str): Ruta del archivo CSV, TXT, JSON/NDJSON, Excel, Parquet, Feather o
+                binario de adquisición (.bin, .dat, .raw).
+            chunksize (int, optional): Filas por bloque para leer archivos CSV/TXT por partes.
+            memory_limit (int, optional): Máximo de bytes que pueden ocupar los datos leídos por bloques.
+            progress_callback (callable, optional): Función que recibe (filas_leidas, fraccion_leida).
+                Se usa en archivos CSV/TXT (que entonces se leen por bloques) y JSON/NDJSON.
+            engine (str, optional): 'c' o 'pyarrow'. El motor 'pyarrow' usa todos los núcleos
+                disponibles pero lee el archivo completo, por lo que no admite carga por bloques.
+            dtype_backend (str, optional): 'pyarrow' para columnas con tipos de Arrow.
+            columns (list, optional): Equivalente a `usecols` para archivos Parquet o Feather.
+            sniff (bool, optional): Si es True, el delimitador, la marca decimal, la codificación,
+                el preámbulo y el encabezado de los archivos CSV/TXT se detectan a partir de una
+                muestra del archivo. Si es False, se usa ',' para .csv y tabulador para .txt.
+            use_cache (bool, optional): Si es True y hay una caché configurada, los archivos de
+                texto y Excel se sirven desde ella cuando no han cambiado. Por defecto es True.
+            sheet_name (str or int, optional): Hoja a leer de un libro de Excel, por nombre o
+                posición. Por defecto la primera.
+            usecols (list, optional): Columnas a leer, por nombre o posición (en Excel también
+                como rango de letras, "A:D"). Las demás columnas no se materializan: en CSV/TXT el
+                parser las descarta sin convertirlas y en Parquet/Feather ni se leen del disco.
+            nrows (int, optional): Máximo de filas de datos a leer de un archivo CSV/TXT o de un
+                libro de Excel. Junto con `usecols` acota el rango leído sin recorrer el resto.
+            raw_layout (dict, optional): Formato de un archivo binario (`dtype`, `channels`,
+                `sample_rate`, `header_bytes`; ver `read_raw_binary`). Si es None, se busca en
+                un archivo JSON junto al binario.
+
+        Returns:
+            pd.DataFrame: Datos leídos del archivo.
+
+        Raises:
+            ValueError: Si la extensión del archivo no es soportada, o si se combina el motor
+                'pyarrow' con la carga por bloques.
+            MemoryError: Si la carga por bloques supera `memory_limit`.
+        """
+        def parse():
+            return self._parse_file(file_path, chunksize=chunksize, memory_limit=memory_limit,
+                                    progress_callback=progress_callback, engine=engine,
+                                    dtype_backend=dtype_backend, columns=columns, sniff=sniff,
+                                    sheet_name=sheet_name, usecols=usecols, nrows=nrows,
+                                    raw_layout=raw_layout)
+
+        # Los formatos columnares y binarios ya se leen en milisegundos; cachearlos solo duplicaría el disco
+        if self.cache is None or not use_cache or file_path.endswith(self.COLUMNAR_EXTENSIONS + RAW_EXTENSIONS):
+            if self.cache is not None:
+                self.cache.last_hit = False
+            return parse()
+
+        # `columns` también acota lo que leen los lectores de JSON: forma parte de la clave
+        options = {'dtype_backend': dtype_backend, 'sniff': sniff, 'sheet_name': sheet_name,
+                   'usecols': usecols, 'columns': columns, 'nrows': nrows}
+        data = self.cache.get_or_load(file_path, options, parse)
+        if self.cache.last_hit and progress_callback:
+            progress_callback(len(data), 1.0)
+        return data
+
+    def _parse_file(self, file_path, chunksize=None, memory_limit=None, progress_callback=None,
+                    engine='c', dtype_backend=None, columns=None, sniff=True,
+                    sheet_name=0, usecols=None, nrows=None, raw_layout=None):
+        """
+        Parsea un archivo de datos sin pasar por la caché. Ver `read_file` para los argumentos.
+
+        Returns:
+            pd.DataFrame: Datos leídos del archivo.
+        """
+        base_path, compression = split_compression(file_path)
+        if base_path.endswith(self.TEXT_EXTENSIONS):
+            if sniff:
+                read_options = sniff_text_format(file_path, opener=open_binary)
+            elif base_path.endswith('.txt'):
+                read_options = {'delimiter': '\t'}
+            else:
+                read_options = {}
+        elif base_path.endswith(JSON_EXTENSIONS):
+            return read_json_records(file_path, usecols=usecols if usecols is not None else columns,
+                                     nrows=nrows, progress_callback=progress_callback,
+                                     dtype_backend=dtype_backend)
+        elif compression is not None:
+            raise ValueError("Solo se admiten archivos CSV, TXT o JSON comprimidos")
+        elif file_path.endswith(('.xlsx', '.xls')):
+            return self._read_excel(file_path, sheet_name=sheet_name, usecols=usecols,
+                                    nrows=nrows, dtype_backend=dtype_backend)
+        elif file_path.endswith(self.COLUMNAR_EXTENSIONS):
+            columnar_options = {'columns': columns if columns is not None else usecols}
+            if dtype_backend is not None:
+                columnar_options['dtype_backend'] = dtype_backend
+            if file_path.endswith('.parquet'):
+                return pd.read_parquet(file_path, **columnar_options)
+            return pd.read_feather(file_path, **columnar_options)
+        elif file_path.endswith(RAW_EXTENSIONS):
+            return read_raw_binary(file_path, layout=raw_layout, usecols=usecols if usecols is not None else columns,
+                                   nrows=nrows)
+        else:
+            raise ValueError("El archivo debe tener extensión .csv, .txt, .json, .ndjson, .jsonl, .xlsx, .xls, "
+                             ".parquet, .feather, .arrow, .bin, .dat o .raw")
+
+        if usecols is not None:
+            read_options['usecols'] = usecols
+        if nrows is not None:
+            read_options['nrows'] = nrows
+
+        chunked = chunksize is not None or memory_limit is not None or progress_callback is not None
+        if engine not in ('c', 'pyarrow'):
+            raise ValueError(f"Motor de lectura no soportado: {engine}")
+        if engine == 'pyarrow' and not self._pyarrow_compatible(read_options):
+            engine = 'c'
+        if engine == 'pyarrow' and chunked:
+            raise ValueError("El motor 'pyarrow' no admite la carga por bloques")
+
+        if not chunked:
+            if dtype_backend is not None:
+                read_options['dtype_backend'] = dtype_backend
+            return pd.read_csv(file_path, engine=engine, **read_options)
+
+        # Los bloques se reservan como arreglos de NumPy; los tipos de Arrow se aplican al final
+        data = self._read_csv_chunked(file_path, read_options, chunksize or 100_000,
+                                      memory_limit, progress_callback)
+        if dtype_backend == 'pyarrow':
+            import pyarrow as pa
+            data = pa.Table.from_pandas(data, preserve_index=False).to_pandas(types_mapper=pd.ArrowDtype)
+        elif dtype_backend is not None:
+            data = data.convert_dtypes(dtype_backend=dtype_backend)
+        return data
+
+    def read_preview(self, file_path, n_rows=2000, **read_options):
+        """
+        Lee solo las primeras filas de un archivo para mostrarlas mientras se carga el resto.
+
+        Los archivos de texto y Excel se parsean con `nrows`, de modo que el parser se detiene
+        tras `n_rows` filas. De Parquet y Feather se lee únicamente el primer grupo de filas o
+        los primeros lotes necesarios. La vista previa no pasa por la caché.
+
+        Args:
+            file_path (str): Ruta del archivo.
+            n_rows (int, optional): Máximo de filas de la vista previa. Por defecto 2000.
+            **read_options: Opciones de lectura de `read_file` (`sniff`, `sheet_name`,
+                `usecols`, `columns`, `dtype_backend`, `engine`); las de carga por bloques se ignoran.
+
+        Returns:
+            pd.DataFrame: Primeras filas del archivo.
+        """
+        if read_options.get('nrows') is not None:
+            n_rows = min(n_rows, read_options['nrows'])
+        usecols = read_options.get('columns')
+        if usecols is None:
+            usecols = read_options.get('usecols')
+        dtype_backend = read_options.get('dtype_backend')
+        types_mapper = pd.ArrowDtype if dtype_backend == 'pyarrow' else None
+
+        if file_path.endswith('.parquet'):
+            import pyarrow.parquet as pq
+            parquet_file = pq.ParquetFile(file_path)
+            batch = next(parquet_file.iter_batches(batch_size=n_rows, columns=usecols), None)
+            if batch is None:
+                return parquet_file.schema_arrow.empty_table().to_pandas(types_mapper=types_mapper)
+            return batch.to_pandas(types_mapper=types_mapper)
+        if file_path.endswith(self.COLUMNAR_EXTENSIONS):
+            import pyarrow as pa
+            with pa.memory_map(file_path) as source:
+                reader = pa.ipc.open_file(source)
+                batches, rows = [], 0
+                for i in range(reader.num_record_batches):
+                    if rows >= n_rows:
+                        break
+                    batch = reader.get_batch(i)
+                    batches.append(batch)
+                    rows += batch.num_rows
+                table = pa.Table.from_batches(batches, schema=reader.schema).slice(0, n_rows)
+                if usecols is not None:
+                    table = table.select(usecols)
+                return table.to_pandas(types_mapper=types_mapper)
+
+        options = {key: read_options[key] for key in ('sniff', 'sheet_name', 'usecols', 'dtype_backend', 'raw_layout')
+                   if key in read_options}
+        return self._parse_file(file_path, nrows=n_rows, **options)
+
+    @staticmethod
+    def excel_engine():
+        """
+        Elige el motor de lectura de Excel más rápido disponible.
+
+        Returns:
+            str: 'calamine' si está instalado `python-calamine` (lector escrito en Rust que lee
+            .xlsx y .xls varias veces más rápido que openpyxl), o None para el motor por
+            defecto de pandas.
+        """
+        try:
+            import python_calamine  # noqa: F401
+        except ImportError:
+            return None
+        return 'calamine'
+
+    @classmethod
+    def excel_sheets(cls, file_path):
+        """
+        Lista las hojas de un libro de Excel sin leer sus celdas.
+
+        Args:
+            file_path (str): Ruta del archivo .xlsx o .xls.
+
+        Returns:
+            list: Nombres de las hojas, en el orden del libro.
+        """
+        with pd.ExcelFile(file_path, engine=cls.excel_engine()) as workbook:
+            return list(workbook.sheet_names)
+
+    def _read_excel(self, file_path, sheet_name=0, usecols=None, nrows=None, dtype_backend=None):
+        """
+        Lee una hoja de un libro de Excel con el motor más rápido disponible.
+
+        Args:
+            file_path (str): Ruta del archivo .xlsx o .xls.
+            sheet_name (str or int, optional): Hoja a leer, por nombre o posición.
+            usecols (str or list, optional): Columnas a leer.
+            nrows (int, optional): Máximo de filas de datos a leer.
+            dtype_backend (str, optional): 'pyarrow' para columnas con tipos de Arrow.
+
+        Returns:
+            pd.DataFrame: Datos de la hoja.
+
+        Raises:
+            ValueError: Si `sheet_name` no identifica una única hoja.
+        """
+        if not isinstance(sheet_name, (str, int)):
+            raise ValueError("Debe indicarse una única hoja por nombre o posición")
+
+        excel_options = {'sheet_name': sheet_name, 'usecols': usecols, 'nrows': nrows,
+                         'engine': self.excel_engine()}
+        if dtype_backend is not None:
+            excel_options['dtype_backend'] = dtype_backend
+        return pd.read_excel(file_path, **excel_options)
+
+    @staticmethod
+    def _pyarrow_compatible(read_options):
+        """
+        Indica si las opciones detectadas para un archivo de texto las soporta el motor 'pyarrow'.
+
+        El lector de PyArrow no interpreta la coma decimal ni separadores por expresión regular,
+        no admite `nrows` y pandas no le traslada bien `skiprows`; en esos casos se usa el
+        parser C.
+
+        Args:
+            read_options (dict): Opciones para `pd.read_csv`.
+
+        Returns:
+            bool: True si el archivo puede leerse con el motor 'pyarrow'.
+        """
+        return (not read_options.get('skiprows')
+                and 'nrows' not in read_options
+                and read_options.get('decimal', '.') == '.'
+                and len(read_options.get('sep', read_options.get('delimiter', ','))) == 1)
+
+    def _read_csv_chunked(self, file_path, read_options, chunksize, memory_limit=None, progress_callback=None):
+        """
+        Lee un archivo de texto delimitado en bloques de `chunksize` filas.
+
+        Tras el primer bloque se estima el total de filas a partir de los bytes consumidos y
+        se reserva un arreglo por columna; cada bloque se copia en su posición y se descarta,
+        de modo que el pico de memoria es el DataFrame final más un bloque, en lugar de la
+        lista de bloques más el resultado de `pd.concat`. Si la estimación se queda corta,
+        los arreglos crecen de forma geométrica y al final se recortan a las filas leídas.
+
+        Si una columna cambia de tipo entre bloques y en alguno es de texto, se vuelve a leer
+        solo esa columna como texto, para que el resultado coincida con una lectura de una vez.
+
+        Los archivos comprimidos se descomprimen al vuelo hacia el parser, sin escribir nunca
+        el archivo descomprimido, y el progreso se mide en bytes comprimidos consumidos.
+
+        Args:
+            file_path (str): Ruta del archivo.
+            read_options (dict): Argumentos adicionales para `pd.read_csv`.
+            chunksize (int): Número de filas por bloque.
+            memory_limit (int, optional): Máximo de bytes permitidos para los datos leídos.
+            progress_callback (callable, optional): Función que recibe (filas_leidas, fraccion_leida).
+
+        Returns:
+            pd.DataFrame: Datos leídos.
+
+        Raises:
+            MemoryError: Si el tamaño estimado o real de los datos supera `memory_limit`.
+        """
+        total_bytes = os.path.getsize(file_path) or 1
+        max_rows = read_options.get('nrows')
+        columns = None
+        arrays = None
+        mixed = set()  # Columnas con bloques de texto y bloques de otro tipo
+        rows_read = 0
+
+        with open(file_path, 'rb') as raw, wrap_decompressor(raw, split_compression(file_path)[1]) as handle:
+            with pd.read_csv(handle, chunksize=chunksize, **read_options) as reader:
+                for chunk in reader:
+                    n = len(chunk)
+                    if arrays is None:
+                        columns = chunk.columns
+                        # Filas estimadas según la fracción del archivo que ocupó el primer bloque
+                        capacity = max(n, int(n * total_bytes / max(raw.tell(), 1) * 1.05) + 1)
+                        if max_rows is not None:
+                            capacity = min(capacity, max_rows)
+                        row_bytes = chunk.memory_usage(deep=True, index=False).sum() / max(n, 1)
+                        if memory_limit is not None and row_bytes * capacity > memory_limit:
+                            raise MemoryError(
+                                f"Se estiman {row_bytes * capacity / 1e6:.1f} MB para {capacity} filas, "
+                                f"por encima del presupuesto de {memory_limit / 1e6:.1f} MB"
+                            )
+                        arrays = [np.empty(capacity, dtype=chunk[col].dtype) for col in columns]
+                    elif rows_read + n > len(arrays[0]):
+                        capacity = max(rows_read + n, int(len(arrays[0]) * 1.5))
+                        for arr in arrays:
+                            arr.resize(capacity, refcheck=False)
+
+                    for i, col in enumerate(columns):
+                        values = chunk.iloc[:, i].to_numpy()
+                        if values.dtype != arrays[i].dtype:
+                            if values.dtype == object or arrays[i].dtype == object:
+                                mixed.add(i)
+                            arrays[i] = arrays[i].astype(np.result_type(arrays[i].dtype, values.dtype))
+                        arrays[i][rows_read:rows_read + n] = values
+                    rows_read += n
+                    del chunk
+
+                    if memory_limit is not None:
+                        bytes_used = sum(arr[:rows_read].nbytes for arr in arrays)
+                        if bytes_used > memory_limit:
+                            raise MemoryError(
+                                f"Los datos superan el presupuesto de {memory_limit / 1e6:.1f} MB "
+                                f"tras leer {rows_read} filas"
+                            )
+                    if progress_callback:
+                        progress_callback(rows_read, min(raw.tell() / total_bytes, 1.0))
+
+        if arrays is None:
+            return pd.read_csv(file_path, **{**read_options, 'nrows': 0})
+
+        # Recorta en su lugar la reserva que sobró
+        for arr in arrays:
+            arr.resize(rows_read, refcheck=False)
+        if mixed:
+            text = self._read_csv_columns_as_text(file_path, read_options, [columns[i] for i in sorted(mixed)])
+            for i in mixed:
+                arrays[i] = text[columns[i]].to_numpy()
+        data = pd.DataFrame(dict(enumerate(arrays)), copy=False)
+        data.columns = columns
+        return data
+
+    @staticmethod
+    def _read_csv_columns_as_text(file_path, read_options, columns):
+        """
+        Vuelve a leer algunas columnas de un archivo de texto delimitado, como texto.
+
+        Args:
+            file_path (str): Ruta del archivo.
+            read_options (dict): Argumentos adicionales para `pd.read_csv`.
+            columns (list): Columnas a leer.
+
+        Returns:
+            pd.DataFrame: Columnas leídas, con los valores como cadenas y NaN en los nulos.
+        """
+        options = {**read_options, 'usecols': columns, 'dtype': {col: str for col in columns}}
+        with open_binary(file_path) as handle:
+            return pd.read_csv(handle, **options)
+
+    @staticmethod
+    def is_json_file(file_path):
+        """
+        Indica si una ruta corresponde a un archivo JSON o NDJSON, comprimido o no.
+
+        Args:
+            file_path (str): Ruta del archivo.
+
+        Returns:
+            bool: True si es un archivo .json, .ndjson o .jsonl.
+        """
+        return split_compression(file_path)[0].endswith(JSON_EXTENSIONS)
+
+    @classmethod
+    def is_text_file(cls, file_path):
+        """
+        Indica si una ruta corresponde a un archivo CSV/TXT, comprimido o no.
+
+        Args:
+            file_path (str): Ruta del archivo.
+
+        Returns:
+            bool: True si es un archivo de texto delimitado.
+        """
+        return split_compression(file_path)[0].endswith(cls.TEXT_EXTENSIONS)
+
+    def load_batch(self, source, pattern='*.csv', max_workers=None, keep_original=True, **read_options):
+        """
+        Carga varios archivos de corridas en un único DataFrame con una columna `run_id`.
+
+        Parameters
+        ----------
+        source : str
+            Directorio con los archivos, o un patrón glob (por ejemplo `datos/caida_*.csv`).
+        pattern : str, optional
+            Patrón de archivos a usar cuando `source` es un directorio. Por defecto '*.csv'.
+        max_workers : int, optional
+            Número de procesos de trabajo. Por defecto, el número de núcleos.
+        keep_original : bool, optional
+            Si es False, no se guarda la copia de los datos originales.
+        **read_options
+            Opciones de lectura para cada archivo, como en `read_file`, además de
+            `progress_callback`, que recibe (archivos_leidos, fraccion_leida).
+
+        Returns
+        -------
+        bool
+            True si los archivos se cargaron correctamente, False en caso contrario.
+        """
+        if self._live_ingest_blocks_load():
+            return False
+        try:
+            data, stats = self.read_batch(source, pattern=pattern, max_workers=max_workers, **read_options)
+            self._set_loaded_data(data, keep_original=keep_original)
+            self._notify('info', "Éxito", self._batch_message(stats))
+            return True
+        except Exception as e:
+            self._notify('error', "Error", f"No se pudieron cargar los archivos. Detalles: {e}")
+            return False
+
+    def read_batch(self, source, pattern='*.csv', max_workers=None, progress_callback=None, **read_options):
+        """
+        Lee en paralelo los archivos de un directorio o patrón glob y los concatena.
+
+        Cada archivo se parsea en un proceso independiente, de modo que el parseo aprovecha
+        todos los núcleos. Las filas de cada archivo se identifican con la columna categórica
+        `run_id`, que contiene el nombre del archivo sin extensión ni compresión; si dos archivos
+        tienen el mismo nombre se les agrega un sufijo `_2`, `_3`, ... Si los archivos ya traen una
+        columna `run_id`, la clave se guarda en `run_id_1` (o el primer nombre libre).
+
+        Args:
+            source (str): Directorio o patrón glob.
+            pattern (str, optional): Patrón de archivos dentro de un directorio. Por defecto '*.csv'.
+            max_workers (int, optional): Número de procesos. Por defecto, el número de núcleos.
+            progress_callback (callable, optional): Función que recibe (archivos_leidos, fraccion_leida).
+            **read_options: Opciones de `read_file` para cada archivo.
+
+        Returns:
+            tuple: (pd.DataFrame con los datos concatenados, dict con 'files', 'rows',
+            'key_column' (nombre de la columna clave), 'seconds' y 'rows_per_second').
+
+        Raises:
+            FileNotFoundError: Si no hay archivos que coincidan.
+        """
+        if os.path.isdir(source):
+            files = sorted(glob.glob(os.path.join(source, pattern)))
+        else:
+            files = sorted(glob.glob(source))
+        if not files:
+            raise FileNotFoundError(f"No se encontraron archivos en {source}")
+
+        run_ids = _run_ids(files)
+        frames = [None] * len(files)
+        start = time.perf_counter()
+
+        # 'spawn' evita bifurcar un proceso con hilos activos (por ejemplo, el de la interfaz)
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+            futures = {executor.submit(_read_batch_file, path, read_options, self.cache): i
+                       for i, path in enumerate(files)}
+            try:
+                for done, future in enumerate(as_completed(futures), 1):
+                    frames[futures[future]] = future.result()
+                    if progress_callback:
+                        progress_callback(done, done / len(files))
+            except BaseException:
+                # No esperar a los archivos pendientes si falla uno o se cancela la carga
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+        lengths = [len(frame) for frame in frames]
+        data = pd.concat(frames, ignore_index=True)
+        frames.clear()
+        key = _free_column_name(data.columns, 'run_id')
+        data.insert(0, key, pd.Categorical.from_codes(
+            np.repeat(np.arange(len(files)), lengths), categories=run_ids))
+
+        seconds = time.perf_counter() - start
+        stats = {
+            'files': len(files),
+            'rows': len(data),
+            'key_column': key,
+            'seconds': seconds,
+            'rows_per_second': len(data) / seconds if seconds > 0 else float('inf'),
+        }
+        return data, stats
+
+    @staticmethod
+    def _batch_message(stats):
+        """
+        Construye el mensaje de carga de un lote con su rendimiento.
+
+        Args:
+            stats (dict): Estadísticas retornadas por `read_batch`.
+
+        Returns:
+            str: Mensaje para mostrar al usuario.
+        """
+        return (f"Se cargaron {stats['files']} archivos ({stats['rows']:,} filas) "
+                f"en {stats['seconds']:.2f} s: {stats['rows_per_second']:,.0f} filas/s")
+
+    def _load_message(self):
+        """
+        Construye el mensaje de carga exitosa, indicando el uso de la caché si está activa.
+
+        Returns:
+            str: Mensaje para mostrar al usuario.
+        """
+        mensaje = "Archivo cargado correctamente"
+        if self.cache is not None and self.cache.hits + self.cache.misses:
+            origen = "desde la caché" if self.cache.last_hit else "desde el archivo de origen"
+            mensaje += f" {origen}.\n{self.cache.summary()}"
+        return mensaje
+
+    def start_live_ingest(self, file_path, callback=None, max_rows=1_000_000, refresh_interval=0.5,
+                          read_options=None, error_callback=None):
+        """
+        Empieza a seguir un archivo CSV/TXT que crece, o una FIFO, mientras el instrumento escribe.
+
+        Solo se parsean los bytes añadidos desde la última lectura. Las filas se acumulan en un
+        búfer circular de `max_rows` filas y, como mucho cada `refresh_interval` segundos,
+        `self.data` se reemplaza por su contenido y se llama a `callback`. Las actualizaciones
+        llegan desde un hilo de trabajo (ver `_apply_live_data`).
+
+        Args:
+            file_path (str): Ruta del archivo o de la FIFO.
+            callback (callable, optional): Función que recibe los datos tras cada actualización.
+            max_rows (int, optional): Máximo de filas conservadas; se descartan las más antiguas.
+            refresh_interval (float, optional): Segundos mínimos entre actualizaciones.
+            read_options (dict, optional): Opciones de `pd.read_csv`. Si es None, el formato se
+                detecta de las primeras líneas.
+            error_callback (callable, optional): Función que recibe el error si la lectura falla.
+
+        Raises:
+            RuntimeError: Si ya hay una lectura en vivo en curso.
+        """
+        if self._live is not None:
+            raise RuntimeError("Ya hay una lectura en vivo en curso")
+
+        self._live = LiveIngest(file_path,
+                                on_update=lambda data: self._apply_live_data(data, callback),
+                                on_error=error_callback, max_rows=max_rows,
+                                refresh_interval=refresh_interval, read_options=read_options)
+        self._live.start()
+
+    def stop_live_ingest(self, keep_original=True):
+        """
+        Detiene la lectura en vivo y fija las filas del búfer como los datos cargados.
+
+        Args:
+            keep_original (bool, optional): Si es True, guarda una copia en `original_data`.
+
+        Returns:
+            dict: Filas leídas en total ('filas'), conservadas ('conservadas') y descartadas
+            ('descartadas'), o None si no había una lectura en vivo.
+        """
+        live, self._live = self._live, None
+        if live is None:
+            return None
+
+        data = live.stop()
+        if data is not None:
+            self._set_loaded_data(data, keep_original=keep_original)
+        return {'filas': live.rows_total,
+                'conservadas': 0 if data is None else len(data),
+                'descartadas': live.rows_dropped}
+
+    def is_live_ingest_running(self):
+        """
+        Indica si hay una lectura en vivo en curso.
+
+        Returns:
+            bool: True si se está siguiendo un archivo.
+        """
+        return self._live is not None
+
+    def _live_ingest_blocks_load(self):
+        """
+        Indica si hay una lectura en vivo y, en ese caso, avisa al usuario: la siguiente
+        actualización del búfer reemplazaría los datos recién cargados.
+
+        Returns:
+            bool: True si hay una lectura en vivo en curso.
+        """
+        if self.is_live_ingest_running():
+            self._notify('warning', "Advertencia", "Detenga la lectura en vivo antes de cargar otros datos")
+            return True
+        return False
+
+    def _apply_live_data(self, data, callback=None):
+        """
+        Reemplaza `self.data` por el contenido actual del búfer de la lectura en vivo.
+
+        Se llama desde el hilo de la lectura en vivo; las subclases con interfaz gráfica lo
+        redefinen para aplicar la actualización en el hilo de la interfaz.
+
+        Args:
+            data (pd.DataFrame): Filas del búfer.
+            callback (callable, optional): Función que recibe los datos actualizados.
+        """
+        if self._live is None:
+            return  # La lectura se detuvo; los datos finales ya se fijaron
+        self.data = data
+        self.column_stats.invalidate()
+        if callback:
+            callback(data)
+
+    def _set_loaded_data(self, data, keep_original=True, source_path=None, source_options=None):
+        """
+        Establece un DataFrame recién cargado como los datos actuales y reinicia el historial.
+
+        Args:
+            data (pd.DataFrame): Datos cargados.
+            keep_original (bool, optional): Si es True, guarda una copia en `original_data`
+                para poder exportar los datos originales. Por defecto es True.
+            source_path (str, optional): Archivo del que se leyeron los datos. Si se indica, las
+                columnas no cargadas pueden traerse después con `ensure_columns`.
+            source_options (dict, optional): Opciones de lectura usadas con `source_path`.
+        """
+        self.data = data
+        self.column_stats.invalidate()
+        self.source_path = source_path
+        self.source_options = {key: value for key, value in (source_options or {}).items()
+                               if key in self.SOURCE_OPTIONS}
+        self._source_columns = None
+        if not keep_original:
+            self.original_data = None
+        elif self.original_storage == 'memmap':
+            self.original_data = data  # El almacén escribe su propia copia en disco
+        else:
+            self.original_data = data.copy()
+        self._clear_history()
+
+    def available_columns(self):
+        """
+        Lista las columnas de los datos actuales y las del archivo de origen que no se cargaron.
+
+        El encabezado del archivo de origen se lee una sola vez, sin parsear sus filas. Si el
+        archivo ya no se puede leer (se movió o se borró), solo se listan las columnas cargadas.
+
+        Returns:
+            list: Columnas cargadas seguidas de las columnas aún no cargadas.
+        """
+        # Las operaciones diferidas no cambian las columnas: no hace falta ejecutar el plan
+        if self._data is None:
+            return []
+        loaded = list(self._data.columns)
+        if self.source_path is None:
+            return loaded
+        if self._source_columns is None:
+            try:
+                self._source_columns = self.read_columns(self.source_path, **self.source_options)
+            except (OSError, ValueError):
+                self._source_columns = loaded
+        return loaded + [col for col in self._source_columns if col not in loaded]
+
+    def read_columns(self, file_path, **read_options):
+        """
+        Lee los nombres de las columnas de un archivo sin cargar sus filas.
+
+        Args:
+            file_path (str): Ruta del archivo.
+            **read_options: Opciones de lectura de `read_file` (por ejemplo `sheet_name`).
+
+        Returns:
+            list: Nombres de las columnas, en el orden del archivo.
+        """
+        if file_path.endswith('.parquet'):
+            import pyarrow.parquet as pq
+            names = pq.read_schema(file_path).names
+            return [name for name in names if not name.startswith('__index_level_')]
+        if file_path.endswith(self.COLUMNAR_EXTENSIONS):
+            import pyarrow as pa
+            with pa.memory_map(file_path) as source:
+                return list(pa.ipc.open_file(source).schema.names)
+
+        options = {key: value for key, value in read_options.items()
+                   if key in self.SOURCE_OPTIONS and key not in ('nrows', 'use_cache')}
+        return list(self.read_file(file_path, nrows=0, use_cache=False, **options).columns)
+
+    def ensure_columns(self, columns):
+        """
+        Trae del archivo de origen las columnas pedidas que aún no estén cargadas.
+
+        Solo se parsean las columnas que faltan (desde la caché si ya se leyeron antes) y se
+        alinean con las filas actuales por el índice, por lo que las filas eliminadas con
+        `remove_null_values` o `remove_duplicates` tampoco aparecen en ellas. Las columnas
+        traídas contienen los valores del archivo: las transformaciones ya aplicadas a los
+        datos no se repiten sobre ellas.
+
+        Args:
+            columns (list): Columnas que se van a usar.
+
+        Returns:
+            list: Columnas que se agregaron a `self.data`.
+
+        Raises:
+            KeyError: Si alguna columna no existe en los datos ni en el archivo de origen.
+            ValueError: Si las filas actuales ya no corresponden con las del archivo de origen.
+        """
+        if self.data is None:
+            return []
+        missing = [col for col in columns if col not in self.data.columns]
+        if not missing:
+            return []
+        unknown = [col for col in missing if col not in self.available_columns()]
+        if unknown:
+            raise KeyError(f"Columnas no disponibles: {unknown}")
+
+        fetched = self.read_file(self.source_path, usecols=missing, **self.source_options)[missing]
+        if not self.data.index.isin(fetched.index).all():
+            raise ValueError("Las filas actuales ya no corresponden con las del archivo de origen")
+
+        self.data = self.data.join(fetched)
+        for delta in self._undo_stack + [delta for _, delta in self._redo_stack]:
+            if delta is not None:
+                delta.add_columns(fetched)
+        original_data = self.original_data
+        if original_data is not None and original_data.index.equals(fetched.index):
+            self.original_data = original_data.join(fetched)
+        return missing
+
+    @property
+    def data(self):
+        """
+        pd.DataFrame: Datos actuales. Si hay operaciones diferidas pendientes, se ejecutan
+        antes de retornarlos.
+        """
+        self._run_plan()
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._discard_plan()
+        self._data = value
+
+    def has_pending_operations(self):
+        """
+        Indica si hay operaciones diferidas sin ejecutar.
+
+        Returns:
+            bool: True si el plan no está vacío.
+        """
+        return bool(self._plan)
+
+    def pending_operations(self):
+        """
+        Lista las operaciones diferidas que aún no se ejecutan, en orden.
+
+        Returns:
+            list: Descripción de cada operación pendiente.
+        """
+        return [step.details for step in self._plan]
+
+    def execute_plan(self):
+        """
+        Ejecuta las operaciones diferidas pendientes.
+
+        Returns:
+            pd.DataFrame: Datos con las operaciones aplicadas.
+        """
+        return self.data
+
+    def _add_step(self, step):
+        """
+        Agrega una operación al plan diferido y la registra en el historial como pendiente.
+
+        Args:
+            step (PlanStep): Operación a diferir.
+        """
+        self._add_to_history(step.operation, step.details, step, step.params)
+        self.transformation_history[-1]['rows_affected'] = None
+        self._plan.append(step)
+
+    def _run_plan(self):
+        """
+        Ejecuta el plan diferido y completa sus entradas del historial y de la pila de deshacer.
+
+        Las operaciones pendientes son siempre las últimas del historial: cualquier operación
+        inmediata lee antes `data` y con ello ejecuta el plan. Los rellenos que no encontraron
+        nulos se quitan del historial, como hace `fill_null_values` al aplicarse de inmediato.
+        """
+        if not self._plan:
+            return
+        steps = self._plan
+        self._data = run_plan(self._data, steps, self.column_stats)
+        self._plan = []
+        entries = self.transformation_history[-len(steps):]
+        del self.transformation_history[-len(steps):]
+        del self._undo_stack[-len(steps):]
+        for entry, step in zip(entries, steps):
+            if isinstance(step, FillMeanStep) and not step.delta.count():
+                continue
+            entry['details'] = step.details
+            entry['rows_affected'] = step.rows_affected
+            self.transformation_history.append(entry)
+            self._undo_stack.append(step.delta)
+
+    def _discard_plan(self):
+        """Descarta las operaciones pendientes, junto con sus entradas del historial."""
+        if not self._plan:
+            return
+        del self.transformation_history[-len(self._plan):]
+        del self._undo_stack[-len(self._plan):]
+        self._plan = []
+
+    def column_statistics(self, columns=None):
+        """
+        Estadísticas de las columnas numéricas, tomadas de la caché `column_stats`.
+
+        Solo se recorren las columnas que no están en la caché; las demás se mantienen al día
+        con cada operación sin volver a leerlas.
+
+        Args:
+            columns (list, optional): Columnas a consultar. Si es None, todas las numéricas.
+
+        Returns:
+            pd.DataFrame: Una fila por columna con 'count', 'nulls', 'min', 'max', 'sum', 'm2'
+            (suma de cuadrados de las desviaciones), 'absmax' y 'mean', o None si no hay datos.
+        """
+        data = self.data
+        if data is None:
+            return None
+        if columns is None:
+            columns = [col for col in data.columns if pd.api.types.is_numeric_dtype(data[col])]
+        return self.column_stats.frame(data, columns)
+
+    @property
+    def original_data(self):
+        """
+        pd.DataFrame: Datos originales sin procesar, o None si no se guardaron.
+
+        Con `original_storage='memmap'` cada acceso reconstruye el DataFrame leyendo los
+        archivos mapeados, por lo que conviene guardarlo en una variable local si se usa
+        varias veces.
+        """
+        if self._original_store is not None:
+            return self._original_store.to_frame()
+        return self._original_data
+
+    @original_data.setter
+    def original_data(self, value):
+        if self._original_store is not None:
+            self._original_store.close()
+            self._original_store = None
+        if value is not None and self.original_storage == 'memmap':
+            self._original_store = MemmapFrameStore(value)
+            self._original_data = None
+        else:
+            self._original_data = value
+
+    def has_original_data(self):
+        """
+        Indica si hay datos originales guardados, sin reconstruirlos desde disco.
+
+        Returns:
+            bool: True si `original_data` no es None.
+        """
+        return self._original_store is not None or self._original_data is not None
+
+    def reset_data(self):
+        """
+        Restaura los datos a su estado original al momento de la carga y vacía el historial.
+
+        Returns:
+            bool: True si se restauraron los datos, False si no hay datos originales guardados.
+        """
+        if not self.has_original_data():
+            self._notify('warning', "Advertencia", "No hay datos originales para restaurar")
+            return False
+
+        # Desde el almacén mapeado ya se obtiene un DataFrame nuevo; en memoria hay que copiarlo
+        original_data = self.original_data
+        self.data = original_data if self._original_store is not None else original_data.copy()
+        self.column_stats.invalidate()
+        self._clear_history()
+        self._notify('info', "Éxito", "Se restauraron los datos originales")
+        return True
+
+    def _add_to_history(self, operation_name, details=None, delta=None, params=None, rows_affected=None):
         """
         Registra una operación en el historial de transformaciones.
         Se utiliza para mantener un seguimiento de las modificaciones realizadas.
@@ -118,6 +1159,16 @@ class DataOperations:
             Nombre de la operación realizada.
         details : str, optional
             Detalles adicionales sobre la operación.
+        delta : RowDropDelta, AffineDelta or CellFillDelta, optional
+            Cambio reversible de la operación, usado por `undo` y `redo`, ya aplicado a los
+            datos; con él se actualizan las estadísticas de `column_stats`. Si es None, la
+            operación no se puede deshacer.
+        params : dict, optional
+            Argumentos con los que se llamó al método `operation_name`, para poder repetirla
+            sobre otros datos con una receta (ver `src.recipes`).
+        rows_affected : int, optional
+            Filas eliminadas o modificadas por la operación. Si es None, se registra el número
+            de filas de los datos.
 
         Returns
         -------
@@ -127,8 +1178,132 @@ class DataOperations:
             'operation': operation_name,
             'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             'details': details,
-            'rows_affected': len(self.data)
+            'rows_affected': len(self._data) if rows_affected is None else int(rows_affected),
+            'params': params
         })
+        self._undo_stack.append(delta)
+        self._redo_stack = []
+        if delta is not None and not isinstance(delta, PlanStep):
+            self.column_stats.apply(delta)
+
+    def _clear_history(self):
+        """Vacía el historial de transformaciones y las pilas de deshacer y rehacer."""
+        self.transformation_history = []
+        self._undo_stack = []
+        self._redo_stack = []
+
+    def can_undo(self):
+        """
+        Indica si la última operación del historial se puede deshacer.
+
+        Returns:
+            bool: True si hay una operación reversible que deshacer.
+        """
+        return bool(self._undo_stack) and self._undo_stack[-1] is not None
+
+    def can_redo(self):
+        """
+        Indica si hay una operación deshecha que se pueda rehacer.
+
+        Returns:
+            bool: True si la pila de rehacer no está vacía.
+        """
+        return bool(self._redo_stack)
+
+    def undo(self):
+        """
+        Deshace la última operación aplicando la inversa de su cambio registrado. Si la
+        última operación sigue pendiente en el plan diferido, solo se retira del plan.
+
+        Cada operación guarda solo lo que modificó (filas eliminadas y sus posiciones,
+        parámetros de escala por columna o celdas imputadas y sus valores), de modo que
+        deshacer no necesita copias completas de los datos.
+
+        Returns:
+            bool: True si se deshizo la operación, False si no hay nada que deshacer o la
+            última operación no es reversible.
+        """
+        if not self._undo_stack:
+            self._notify('warning', "Advertencia", "No hay operaciones para deshacer")
+            return False
+        delta = self._undo_stack[-1]
+        entry = self.transformation_history[-1]
+        if self._plan:
+            # Una operación aún pendiente se retira del plan sin ejecutar nada
+            self._plan.pop()
+            self.transformation_history.pop()
+            self._undo_stack.pop()
+            self._redo_stack.append((entry, delta))
+            return True
+        if delta is None:
+            self._notify('warning', "Advertencia", f"La operación '{entry['operation']}' no se puede deshacer")
+            return False
+
+        self.data = delta.undo(self.data)
+        self.column_stats.revert(delta)
+        self.transformation_history.pop()
+        self._undo_stack.pop()
+        self._redo_stack.append((entry, delta))
+        return True
+
+    def redo(self):
+        """
+        Vuelve a aplicar la última operación deshecha.
+
+        Returns:
+            bool: True si se rehízo la operación, False si no hay nada que rehacer.
+        """
+        if not self._redo_stack:
+            self._notify('warning', "Advertencia", "No hay operaciones para rehacer")
+            return False
+
+        entry, delta = self._redo_stack.pop()
+        if isinstance(delta, PlanStep) and delta.delta is None:
+            # Se había retirado del plan antes de ejecutarse: vuelve a quedar pendiente
+            self.transformation_history.append(entry)
+            self._undo_stack.append(delta)
+            self._plan.append(delta)
+            return True
+        self.data = delta.redo(self.data)
+        self.column_stats.apply(delta)
+        self.transformation_history.append(entry)
+        self._undo_stack.append(delta)
+        return True
+
+    def optimize_dtypes(self, float32_columns=None, category_threshold=0.5):
+        """
+        Compacta los tipos de datos de las columnas para reducir la memoria ocupada.
+
+        Reduce los enteros al tipo más pequeño que los contiene, convierte a float32 las
+        columnas flotantes indicadas y transforma en categóricas las columnas de texto con
+        etiquetas repetidas. Muestra un informe de memoria antes y después calculado con
+        `DataFrame.memory_usage(deep=True)`.
+
+        Args:
+            float32_columns (list or bool, optional): Columnas flotantes a convertir a float32,
+                o True para todas. Solo debe usarse en canales cuya precisión de medida lo permita.
+            category_threshold (float, optional): Fracción máxima de valores distintos para
+                convertir una columna de texto en categórica. Por defecto 0.5.
+
+        Returns:
+            str: Informe de memoria, o None si no hay datos cargados.
+        """
+        if self.data is None:
+            self._notify('warning', "Advertencia", "Primero debes cargar los datos")
+            return None
+
+        self.data, report = compact_dtypes(self.data, float32_columns, category_threshold)
+        summary = format_memory_report(report)
+
+        changed = report.index[report['tipo_antes'] != report['tipo_despues']]
+        self.column_stats.invalidate(changed)
+        self._add_to_history('optimize_dtypes',
+                             f'Compactadas las columnas {", ".join(map(str, changed)) or "ninguna"}',
+                             params={'float32_columns': float32_columns if float32_columns is True
+                                     else list(float32_columns or []),
+                                     'category_threshold': category_threshold})
+        self._notify('info', "Memoria", summary)
+        return summary
 
     def remove_null_values(self):
         """
@@ -137,55 +1312,78 @@ class DataOperations:
         La operación se realiza in-place y se registra en el historial de transformaciones.
         Muestra un mensaje con el número de filas eliminadas.
         
+        En modo diferido (`lazy`) solo se agrega al plan.
+
         Requires:
             Datos cargados previamente (self.data no None).
         """
+        if self.lazy and self._data is not None:
+            self._add_step(DropNullRowsStep())
+            return
         if self.data is not None:
-            rows_before = len(self.data)
-            self.data.dropna(inplace=True)
-            rows_removed = rows_before - len(self.data)
+            delta = RowDropDelta(self.data, self.data.isna().any(axis=1).to_numpy())
+            self.data = delta.redo(self.data)
+            rows_removed = len(delta.positions)
             
             self._add_to_history('remove_null_values', 
-                               f'Eliminadas {rows_removed} filas con valores nulos')
+                               f'Eliminadas {rows_removed} filas con valores nulos', delta, {}, rows_removed)
             
-            messagebox.showinfo("Éxito", 
+            self._notify('info', "Éxito", 
                               f"Se han eliminado {rows_removed} filas con valores nulos")
         else:
-            messagebox.showwarning("Advertencia", "Primero debes cargar los datos")
+            self._notify('warning', "Advertencia", "Primero debes cargar los datos")
 
-    def remove_duplicates(self):
+    def remove_duplicates(self, subset=None, tolerance=None):
         """
         Elimina las filas duplicadas del DataFrame, manteniendo la primera ocurrencia.
         
         Este método:
-        - Identifica y elimina filas completamente duplicadas
+        - Identifica y elimina las filas repetidas en las columnas indicadas
         - Mantiene la primera ocurrencia de cada fila duplicada
         - Registra la operación en el historial
         - Muestra un mensaje con el número de filas eliminadas
+
+        Las filas se comparan por un hash calculado columna a columna (ver
+        `src.duplicates.duplicated_rows`), más rápido que `drop_duplicates` en datos anchos.
+
+        Args:
+            subset (list, optional): Columnas a comparar. Si es None, todas.
+            tolerance (float or dict, optional): Tolerancia para comparar las columnas numéricas,
+                o {columna: tolerancia}; los valores se redondean al múltiplo de la tolerancia
+                más cercano, de modo que las filas que solo difieren por ruido de redondeo
+                cuentan como duplicadas. Si es None, la comparación es exacta.
         
         Returns:
             None
         
         Raises:
-            No lanza excepciones directamente, pero muestra un messagebox de advertencia
-            si self.data es None
+            KeyError: Si alguna columna de `subset` no existe.
+            ValueError: Si `subset` está vacío o la tolerancia no es positiva.
+            Si self.data es None no lanza excepciones, pero muestra un messagebox de advertencia.
         
         Notas:
-            - La comparación de duplicados considera todas las columnas
-            - La operación es irreversible
+            - La operación se puede deshacer con `undo`; solo se guardan las filas eliminadas
+            - En modo diferido (`lazy`) solo se agrega al plan
         """
+        if self.lazy and self._data is not None:
+            # Se valida ahora para no descubrir el error al ejecutar el plan
+            duplicated_rows(self._data.iloc[:0], subset, tolerance)
+            self._add_step(DropDuplicatesStep(subset, tolerance))
+            return
         if self.data is not None:
-            rows_before = len(self.data)
-            self.data.drop_duplicates(inplace=True)
-            rows_removed = rows_before - len(self.data)
+            delta = RowDropDelta(self.data, duplicated_rows(self.data, subset, tolerance))
+            self.data = delta.redo(self.data)
+            rows_removed = len(delta.positions)
             
             self._add_to_history('remove_duplicates',
-                               f'Eliminadas {rows_removed} filas duplicadas')
+                               f'Eliminadas {rows_removed} filas duplicadas{duplicates_scope(subset, tolerance)}',
+                               delta, {'subset': None if subset is None else list(subset), 'tolerance': tolerance},
+                               rows_removed)
             
-            messagebox.showinfo("Éxito", 
+            self._notify('info', "Éxito", 
                               f"Se han eliminado {rows_removed} filas duplicadas")
         else:
-            messagebox.showwarning("Advertencia", "Primero debes cargar los datos")
+            self._notify('warning', "Advertencia", "Primero debes cargar los datos")
 
     def normalize_data(self, selected_columns, method="Min-Max Scaling"):
         """
@@ -199,55 +1397,50 @@ class DataOperations:
                 - "Max Abs Scaling": Escala los valores al rango [-1, 1] dividiendo por el valor absoluto máximo.
 
         Raises:
-            ValueError: Si no se seleccionan columnas o si no hay datos cargados.
+            ValueError: Si no se seleccionan columnas, no hay datos cargados, el método no es
+                soportado o alguna columna no es numérica.
 
         Returns:
-            int: Número de filas afectadas por la normalización.
+            int: Número de filas afectadas por la normalización, o None en modo diferido.
 
         Efectos secundarios:
             - Actualiza el atributo `data` con los valores normalizados.
             - Registra la transformación en el historial de operaciones.
+            - En modo diferido (`lazy`) solo se agrega al plan.
         """
         if not selected_columns:
             raise ValueError("Debe seleccionar al menos una columna para normalizar.")
+        if method not in NORMALIZATION_METHODS:
+            raise ValueError(f"Método de normalización no soportado: {method}")
+
+        if self.lazy and self._data is not None:
+            missing = [col for col in selected_columns if col not in self._data.columns]
+            if missing:
+                raise KeyError(f"Columnas no encontradas: {missing}")
+            non_numeric = [col for col in selected_columns
+                           if not pd.api.types.is_numeric_dtype(self._data[col])]
+            if non_numeric:
+                raise ValueError(f"Solo se pueden normalizar columnas numéricas: {non_numeric}")
+            self._add_step(NormalizeStep(selected_columns, method))
+            return None
 
         if self.data is None:
             raise ValueError("No hay datos cargados para normalizar.")
 
-        original_data = self.data[selected_columns].copy()
+        # Todas las columnas se normalizan con una pasada sobre el bloque; los parámetros bastan para
+        # deshacerlo y las filas modificadas se cuentan dentro de la misma pasada
+        normalizer = Normalizer(method, self.column_stats)
+        self.data = normalizer.fit_transform(self.data, selected_columns)
+        affected_rows = normalizer.changed_rows
 
-        for col in selected_columns:
-            if self.data[col].notnull().any():  # Solo aplica si la columna no está completamente vacía
-                if method == "Min-Max Scaling":
-                    min_val = self.data[col].min()
-                    max_val = self.data[col].max()
-                    if max_val != min_val:
-                        self.data[col] = (self.data[col] - min_val) / (max_val - min_val)
-                    else:
-                        self.data[col] = 0
-
-                elif method == "Z-Score Scaling":
-                    mean_val = self.data[col].mean()
-                    std_val = self.data[col].std()
-                    if std_val != 0:
-                        self.data[col] = (self.data[col] - mean_val) / std_val
-                    else:
-                        self.data[col] = 0
-
-                elif method == "Max Abs Scaling":
-                    max_abs_val = self.data[col].abs().max()
-                    if max_abs_val != 0:
-                        self.data[col] = self.data[col] / max_abs_val
-                    else:
-                        self.data[col] = 0
-
-        affected_rows = (self.data[selected_columns] != original_data).any(axis=1).sum()
-        self._add_to_history('normalize_data', f'Normalizadas las columnas {", ".join(selected_columns)} usando {method}')
+        self._add_to_history('normalize_data', f'Normalizadas las columnas {", ".join(selected_columns)} usando {method}',
+                             normalizer.delta(), {'selected_columns': list(selected_columns), 'method': method},
+                             affected_rows)
 
         return affected_rows
 
 
-    def fill_null_values(self, method='mean', degree=None, columns=None, n_neighbors=5):
+    def fill_null_values(self, method='mean', degree=None, columns=None, n_neighbors=5, window=None, workers=None):
         """
         Llena valores nulos en columnas seleccionadas utilizando diferentes métodos de imputación.
 
@@ -273,6 +1466,15 @@ class DataOperations:
             n_neighbors (int, opcional): Número de vecinos a usar para la imputación KNN.
                 Relevante solo cuando el método es 'knn'. Por defecto es 5.
 
+            window (int, opcional): Para 'polynomial', número de valores válidos a cada lado de
+                cada hueco con los que se ajusta el polinomio por mínimos cuadrados, en lugar de
+                ajustarlo a toda la serie. Por defecto es None (toda la serie).
+
+            workers (int, opcional): Para 'linear' y 'polynomial', número de procesos entre los que
+                se reparten las columnas a interpolar. Por defecto es None (un solo proceso). Se
+                guarda en el historial, pero cada entrada cubre una sola columna, así que al repetir
+                una receta cada paso se interpola en un solo proceso.
+
         Raises:
             tkinter.messagebox.showwarning: Si no se cargan datos.
             tkinter.messagebox.showerror: Si no se cumplen los requisitos para la imputación KNN.
@@ -283,9 +1485,13 @@ class DataOperations:
             - Registra el historial de imputación utilizando el método self._add_to_history.
 
         Notas:
-            - Para la imputación KNN, solo se consideran columnas numéricas.
-            - El método KNN normaliza los datos antes de la imputación para manejar diferentes escalas.
-            - El método proporciona interacción con el usuario para seleccionar la cantidad de vecinos en KNN.
+            - En modo diferido (`lazy`), el relleno con la media se agrega al plan y solo
+              afecta a las columnas numéricas; los demás métodos se aplican de inmediato.
+            - Para la imputación KNN y las interpolaciones, solo se consideran columnas numéricas.
+            - El método KNN normaliza los datos antes de la imputación para manejar diferentes escalas
+              e imputa todas las columnas en una sola pasada.
+            - Con `interactive=True`, el número de vecinos de KNN se pide al usuario; si no, se usa
+              `n_neighbors`.
 
         Ejemplos:
             # Llenar valores nulos con la media
@@ -298,116 +1504,155 @@ class DataOperations:
             df.fill_null_values(method='knn', columns=['column1', 'column2'])
         """
    
+        if self.lazy and method == 'mean' and self._data is not None:
+            columns = list(self._data.columns) if columns is None else \
+                [col for col in columns if col in self._data.columns]
+            self._add_step(FillMeanStep(columns))
+            return
+
         if self.data is None:
-            messagebox.showwarning("Advertencia", "Primero debes cargar los datos")
+            self._notify('warning', "Advertencia", "Primero debes cargar los datos")
             return
 
         if columns is None:
             columns = self.data.columns  # Si no se pasan columnas, usar todas las columnas
 
+        if method == 'knn':
+            # Una sola imputación cubre todas las columnas seleccionadas
+            self._fill_null_knn([col for col in columns if col in self.data.columns], n_neighbors)
+            return
+
         affected_rows = 0  # Contador de filas afectadas
 
+        # Las columnas a interpolar son independientes: se calculan todas antes de registrarlas,
+        # en paralelo si se pidieron varios procesos
+        interpolated = {}
+        parallel = ''
+        if method == 'linear' or (method == 'polynomial' and degree is not None):
+            targets = [col for col in columns if col in self.data.columns
+                       and pd.api.types.is_numeric_dtype(self.data[col]) and self.data[col].isna().any()]
+            interpolated = interpolate_columns(self.data, targets, method, degree, window, workers)
+            if workers and workers > 1 and len(targets) > 1:
+                parallel = f" (calculado en {min(workers, len(targets))} procesos)"
+
         for column in columns:
             if column not in self.data.columns:
                 continue  # Si la columna no existe en los datos, continuar con la siguiente
 
-            if self.data[column].isnull().any():
-                initial_null_count = self.data[column].isnull().sum()  # Contar los valores nulos antes
+            # Máscara de nulos previa, calculada una sola vez: con ella se cuentan y registran las
+            # celdas imputadas para deshacer
+            null_mask = {column: self.data[column].isna().to_numpy()}
+            if null_mask[column].any():
 
                 if method == 'mean':
-                    self.data[column] = self.data[column].fillna(self.data[column].mean())
-                    nulls_filled = initial_null_count - self.data[column].isnull().sum()  # Calcular los nulos rellenados
+                    if pd.api.types.is_numeric_dtype(self.data[column]):
+                        mean = self.column_stats.statistics(self.data, [column])['mean'][0]
+                    else:
+                        mean = self.data[column].mean()
+                    self.data[column] = self.data[column].fillna(mean)
+                    delta = CellFillDelta(self.data, null_mask)
+                    nulls_filled = delta.count()  # Nulos que dejaron de serlo
                     affected_rows += nulls_filled  # Sumar al total de filas afectadas
                     detail = f"rellenados con la media en {column}"
+                    self._add_to_history('fill_null_values', detail, delta,
+                                         {'method': method, 'columns': [column]}, nulls_filled)
 
-                elif method == 'linear':
-                    # Realizar la interpolación lineal y asignar el resultado a la columna
-                    self.data[column] = self.data[column].interpolate(method='linear')
+                elif method == 'linear' and column in interpolated:
+                    # Asignar el resultado de la interpolación lineal a la columna
+                    self.data[column] = interpolated[column]
 
-                    nulls_filled = initial_null_count - self.data[column].isnull().sum()
+                    delta = CellFillDelta(self.data, null_mask)
+                    nulls_filled = delta.count()
                     affected_rows += nulls_filled
-                    detail = f"rellenados con interpolación lineal en {column}"
+                    detail = f"rellenados con interpolación lineal en {column}{parallel}"
 
                     # Registrar el detalle y mostrar mensaje
-                    self._add_to_history('fill_null_values', detail)
-                    messagebox.showinfo("Éxito", f"{detail}. Se imputaron {nulls_filled} valores nulos.")
+                    self._add_to_history('fill_null_values', detail, delta,
+                                         {'method': method, 'columns': [column], 'workers': workers},
+                                         nulls_filled)
+                    self._notify('info', "Éxito", f"{detail}. Se imputaron {nulls_filled} valores nulos.")
 
-                elif method == 'polynomial' and degree is not None:
-                    # Realizar la interpolación polinomial y asignar el resultado a la columna
-                    self.data[column] = self.data[column].interpolate(method='polynomial', order=degree)
+                elif method == 'polynomial' and column in interpolated:
+                    # Asignar el resultado de la interpolación polinomial a la columna
+                    self.data[column] = interpolated[column]
 
-                    nulls_filled = initial_null_count - self.data[column].isnull().sum()
+                    delta = CellFillDelta(self.data, null_mask)
+                    nulls_filled = delta.count()
                     affected_rows += nulls_filled
                     detail = f"rellenados con interpolación polinomial en {column} de grado {degree}"
+                    if window is not None:
+                        detail += f" con ventanas de {window} puntos"
+                    detail += parallel
 
                     # Registrar el detalle y mostrar mensaje
-                    self._add_to_history('fill_null_values', detail)
-                    messagebox.showinfo("Éxito", f"{detail}. Se imputaron {nulls_filled} valores nulos.")
-
-                elif method == 'knn':
-                    from sklearn.impute import KNNImputer
-                    import pandas as pd
-                    from tkinter.simpledialog import askstring
-
-                    # Pedir al usuario el número de vecinos cercanos
-                    neighbors_input = askstring("Número de Vecinos", "Ingrese el número de vecinos cercanos (default: 5):")
-
-                    # Validar entrada del usuario
-                    try:
-                        n_neighbors = int(neighbors_input) if neighbors_input else 5
-                        if n_neighbors <= 0:
-                            raise ValueError("El número de vecinos debe ser mayor a 0.")
-                    except ValueError:
-                        messagebox.showerror("Error", "Entrada inválida. Usando el valor predeterminado de 5 vecinos.")
-                        n_neighbors = 5
-
-                    # Selección de columnas relevantes para KNN
-                    numeric_cols = [col for col in columns if pd.api.types.is_numeric_dtype(self.data[col])]
-                    if len(numeric_cols) < 2:
-                        messagebox.showerror(
-                            "Error", "KNN requiere al menos 2 columnas numéricas correlacionadas para funcionar."
-                        )
-                        return
-
-                    # Normalizar datos para evitar problemas de escala
-                    normalized_data = self.data[numeric_cols].copy()
-                    min_vals = normalized_data.min()
-                    max_vals = normalized_data.max()
-
-                    normalized_data = (normalized_data - min_vals) / (max_vals - min_vals)
-
-                    # Contar valores nulos antes
-                    nulls_before = self.data[numeric_cols].isnull().sum().sum()
-
-                    # Aplicar KNNImputer
-                    imputer = KNNImputer(n_neighbors=n_neighbors)
-                    imputed_normalized_data = imputer.fit_transform(normalized_data)
-
-                    # Desnormalizar los datos imputados
-                    imputed_data = pd.DataFrame(
-                        imputed_normalized_data, columns=numeric_cols
-                    )
-                    imputed_data = imputed_data * (max_vals - min_vals) + min_vals
-
-                    # Actualizar el DataFrame con los valores imputados
-                    for col in numeric_cols:
-                        self.data[col] = imputed_data[col]
-
-                    # Contar valores nulos después
-                    nulls_after = self.data[numeric_cols].isnull().sum().sum()
-                    nulls_filled = nulls_before - nulls_after
-                    affected_rows += nulls_filled  # Sumar al total de filas afectadas
+                    self._add_to_history('fill_null_values', detail, delta,
+                                         {'method': method, 'columns': [column], 'degree': degree,
+                                          'window': window, 'workers': workers}, nulls_filled)
+                    self._notify('info', "Éxito", f"{detail}. Se imputaron {nulls_filled} valores nulos.")
 
-                    # Registrar el detalle y mostrar mensaje
-                    detail = f"KNN aplicado en columnas: {', '.join(numeric_cols)} con {n_neighbors} vecinos"
-                    self._add_to_history('fill_null_with_knn', detail)
+        # Mostrar el número total de filas afectadas
+        self._notify('info', "Éxito", f"Se afectaron {affected_rows} valores nulos en total.")
 
-                    messagebox.showinfo("Éxito", f"{detail}. Se imputaron {nulls_filled} valores nulos.")
+    def _fill_null_knn(self, columns, n_neighbors=5):
+        """
+        Imputa con K-Nearest Neighbors los nulos de todas las columnas numéricas indicadas en una
+        sola pasada (ver `src.knn_impute.knn_impute`).
 
-        # Mostrar el número total de filas afectadas
-        messagebox.showinfo("Éxito", f"Se afectaron {affected_rows} valores nulos en total.")
+        Con `interactive=True` el número de vecinos se pide una sola vez al usuario.
+
+        Args:
+            columns (list): Columnas existentes a considerar; se usan las numéricas.
+            n_neighbors (int, optional): Número de vecinos. Por defecto 5.
 
-    def export_results(self):
+        Returns:
+            int: Número de valores imputados, o None si no se pudo aplicar.
+        """
+        numeric_cols = [col for col in columns if pd.api.types.is_numeric_dtype(self.data[col])]
+        if not self.data[numeric_cols].isna().any().any():
+            self._notify('info', "Éxito", "Se afectaron 0 valores nulos en total.")
+            return 0
+        if len(numeric_cols) < 2:
+            self._notify('error', "Error", "KNN requiere al menos 2 columnas numéricas correlacionadas para funcionar.")
+            return None
+
+        if self.interactive:
+            from tkinter.simpledialog import askstring
+
+            # Pedir al usuario el número de vecinos cercanos
+            neighbors_input = askstring("Número de Vecinos", "Ingrese el número de vecinos cercanos (default: 5):")
+
+            # Validar entrada del usuario
+            try:
+                n_neighbors = int(neighbors_input) if neighbors_input else 5
+                if n_neighbors <= 0:
+                    raise ValueError("El número de vecinos debe ser mayor a 0.")
+            except ValueError:
+                self._notify('error', "Error", "Entrada inválida. Usando el valor predeterminado de 5 vecinos.")
+                n_neighbors = 5
+
+        # Las distancias se miden con las columnas escaladas por su mínimo y máximo, tomados de la caché
+        stats = self.column_stats.statistics(self.data, numeric_cols)
+        cells = knn_impute(column_block(self.data, numeric_cols), stats['min'], stats['max'], n_neighbors)
+
+        # Los valores se escriben por posición: el índice de los datos puede no ser un RangeIndex
+        data = self.data.copy(deep=False)
+        for i, (positions, imputed) in cells.items():
+            values = data[numeric_cols[i]].to_numpy(dtype=np.float64, na_value=np.nan)
+            values[positions] = imputed
+            data[numeric_cols[i]] = values
+        delta = CellFillDelta.from_cells({numeric_cols[i]: cell for i, cell in cells.items()})
+        self.data = data
+        nulls_filled = delta.count()
+
+        # Registrar el detalle y mostrar mensaje
+        detail = f"KNN aplicado en columnas: {', '.join(map(str, numeric_cols))} con {n_neighbors} vecinos"
+        self._add_to_history('fill_null_with_knn', detail, delta,
+                             {'method': 'knn', 'columns': numeric_cols, 'n_neighbors': n_neighbors},
+                             delta.rows_affected())
+        self._notify('info', "Éxito", f"{detail}. Se imputaron {nulls_filled} valores nulos.")
+        return nulls_filled
+
+    def export_results(self, file_path=None, compression=None):
         """
         Exporta los datos procesados y el historial de transformaciones.
         
@@ -415,40 +1660,57 @@ class DataOperations:
         - Excel (.xlsx): Crea múltiples hojas para datos transformados, originales e historial
         - CSV (.csv): Crea archivos separados para cada tipo de dato
         - TXT (.txt): Similar a CSV pero con delimitador de tabulación
+        - Parquet (.parquet) y Feather (.feather, .arrow): Formatos columnares binarios que se
+          vuelven a cargar mucho más rápido que el texto o Excel
         
+        Args:
+            file_path (str, optional): Ruta de destino. Si es None, se abre un diálogo para elegirla.
+            compression (str, optional): Compresión para Parquet ('snappy', 'zstd', 'gzip', None)
+                o Feather ('lz4', 'zstd', 'uncompressed'). Si es None, se usa la predeterminada
+                de cada formato.
+
         Returns:
             bool: True si la exportación fue exitosa, False en otro caso.
         
         Notes:
-            Para CSV y TXT, se crean archivos adicionales con sufijos '_original' 
+            Para CSV, TXT, Parquet y Feather, se crean archivos adicionales con sufijos '_original' 
             y '_transformaciones' para los datos originales y el historial.
         """
         if self.data is None:
-            messagebox.showwarning("Advertencia", "No hay datos para exportar")
+            self._notify('warning', "Advertencia", "No hay datos para exportar")
             return False
 
-        # Crear un DataFrame con el resumen de transformaciones
+        # Crear un DataFrame con el resumen de transformaciones; los parámetros se guardan como JSON
         transformation_summary = pd.DataFrame(self.transformation_history)
+        if 'params' in transformation_summary:
+            transformation_summary['params'] = transformation_summary['params'].map(
+                lambda params: json.dumps(params, ensure_ascii=False, default=str))
         
-        file_path = filedialog.asksaveasfilename(
-            filetypes=[
-                ("Excel files", "*.xlsx"),
-                ("CSV files", "*.csv"),
-                ("Text files", "*.txt"),
-                ("All files", "*.*")
-            ]
-        )
+        if file_path is None:
+            file_path = filedialog.asksaveasfilename(
+                filetypes=[
+                    ("Excel files", "*.xlsx"),
+                    ("CSV files", "*.csv"),
+                    ("Text files", "*.txt"),
+                    ("Parquet files", "*.parquet"),
+                    ("Feather files", "*.feather *.arrow"),
+                    ("All files", "*.*")
+                ]
+            )
         
         if not file_path:
             return False
 
         try:
+            # Se lee una sola vez, ya que con almacenamiento mapeado cada acceso lee el disco
+            original_data = self.original_data
+
             # Exportar a Excel
             if file_path.endswith('.xlsx'):
                 with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
                     self.data.to_excel(writer, sheet_name='Datos Transformados', index=False)
-                    if self.original_data is not None:
-                        self.original_data.to_excel(writer, sheet_name='Datos Originales', index=False)
+                    if original_data is not None:
+                        original_data.to_excel(writer, sheet_name='Datos Originales', index=False)
                     if self.transformation_history:
                         transformation_summary.to_excel(writer, 
                                                      sheet_name='Historial de Transformaciones',
@@ -461,8 +1723,8 @@ class DataOperations:
                 
                 # Exportar datos originales y transformaciones en archivos separados
                 base_path = file_path[:-4]  # Remover la extensión .csv
-                if self.original_data is not None:
-                    self.original_data.to_csv(f"{base_path}_original.csv", index=False)
+                if original_data is not None:
+                    original_data.to_csv(f"{base_path}_original.csv", index=False)
                 if self.transformation_history:
                     transformation_summary.to_csv(f"{base_path}_transformaciones.csv", index=False)
             
@@ -473,22 +1735,54 @@ class DataOperations:
                 
                 # Exportar datos originales y transformaciones en archivos separados
                 base_path = file_path[:-4]  # Remover la extensión .txt
-                if self.original_data is not None:
-                    self.original_data.to_csv(f"{base_path}_original.txt", sep='\t', index=False)
+                if original_data is not None:
+                    original_data.to_csv(f"{base_path}_original.txt", sep='\t', index=False)
                 if self.transformation_history:
                     transformation_summary.to_csv(f"{base_path}_transformaciones.txt", sep='\t', index=False)
+
+            # Exportar a Parquet o Feather
+            elif file_path.endswith(self.COLUMNAR_EXTENSIONS):
+                base_path, extension = os.path.splitext(file_path)
+                self._write_columnar(self.data, file_path, compression)
+                if original_data is not None:
+                    self._write_columnar(original_data, f"{base_path}_original{extension}", compression)
+                if self.transformation_history:
+                    self._write_columnar(transformation_summary, f"{base_path}_transformaciones{extension}",
+                                         compression)
             
             mensaje = "Los resultados se han exportado correctamente"
-            if file_path.endswith(('.csv', '.txt')) and (self.original_data is not None or self.transformation_history):
+            if file_path.endswith(('.csv', '.txt') + self.COLUMNAR_EXTENSIONS) and \
+                    (original_data is not None or self.transformation_history):
                 mensaje += "\nSe han creado archivos adicionales para los datos originales y el historial de transformaciones"
             
-            messagebox.showinfo("Éxito", mensaje)
+            self._notify('info', "Éxito", mensaje)
             return True
             
         except Exception as e:
-            messagebox.showerror("Error", f"Error al exportar los resultados: {str(e)}")
+            self._notify('error', "Error", f"Error al exportar los resultados: {str(e)}")
             return False
 
+    @staticmethod
+    def _write_columnar(data, file_path, compression=None):
+        """
+        Escribe un DataFrame en formato Parquet o Feather según la extensión del archivo.
+
+        Ambos formatos requieren nombres de columna de tipo texto, y Feather además un índice
+        por defecto, por lo que el índice (que puede tener huecos tras eliminar filas) se descarta.
+
+        Args:
+            data (pd.DataFrame): Datos a escribir.
+            file_path (str): Ruta de destino (.parquet, .feather o .arrow).
+            compression (str, optional): Códec de compresión. Si es None, se usa el predeterminado.
+        """
+        data = data.reset_index(drop=True)
+        data.columns = [str(col) for col in data.columns]
+        options = {} if compression is None else {'compression': compression}
+        if file_path.endswith('.parquet'):
+            data.to_parquet(file_path, index=False, **options)
+        else:
+            data.to_feather(file_path, **options)
+
     def get_transformation_summary(self):
         """
         Genera un resumen textual de todas las transformaciones aplicadas.
@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+
+
+def compact_dtypes(data, float32_columns=None, category_threshold=0.5):
+    """
+    Reduce la memoria de un DataFrame usando tipos de datos más compactos.
+
+    - Las columnas enteras se reducen al entero más pequeño que contiene su rango
+      (sin signo si no hay negativos).
+    - Las columnas flotantes indicadas en `float32_columns` pasan a float32. Solo conviene
+      para canales cuya precisión de medida es menor que la de float32 (~7 cifras).
+    - Las columnas de texto con pocas etiquetas distintas se convierten en categóricas.
+
+    Las columnas con tipos de extensión (Arrow, enteros con nulos) no se modifican.
+
+    Args:
+        data (pd.DataFrame): Datos a compactar. No se modifican.
+        float32_columns (list or bool, optional): Columnas flotantes a convertir a float32,
+            o True para todas. Por defecto ninguna.
+        category_threshold (float, optional): Fracción máxima de valores distintos respecto
+            al número de filas para convertir una columna de texto en categórica.
+
+    Returns:
+        tuple: (pd.DataFrame compactado, pd.DataFrame con el informe por columna: tipo y
+        bytes antes y después).
+    """
+    before = data.memory_usage(deep=True, index=False)
+    result = data.copy(deep=False)
+    if float32_columns is True:
+        float32_columns = list(data.select_dtypes(include='floating').columns)
+    float32_columns = set(float32_columns or [])
+
+    for col in data.columns:
+        column = data[col]
+        dtype = column.dtype
+        if not isinstance(dtype, np.dtype):
+            continue
+        if dtype.kind in 'iu' and len(column):
+            downcast = 'unsigned' if column.min() >= 0 else 'integer'
+            result[col] = pd.to_numeric(column, downcast=downcast)
+        elif dtype.kind == 'f' and col in float32_columns and dtype.itemsize > 4:
+            result[col] = column.astype(np.float32)
+        elif dtype.kind == 'O' and len(column):
+            if column.nunique(dropna=True) <= category_threshold * len(column):
+                result[col] = column.astype('category')
+
+    after = result.memory_usage(deep=True, index=False)
+    report = pd.DataFrame({
+        'tipo_antes': data.dtypes.astype(str),
+        'tipo_despues': result.dtypes.astype(str),
+        'bytes_antes': before,
+        'bytes_despues': after,
+    })
+    return result, report
+
+
+def format_memory_report(report):
+    """
+    Genera un resumen legible del informe de memoria de `compact_dtypes`.
+
+    Args:
+        report (pd.DataFrame): Informe por columna.
+
+    Returns:
+        str: Líneas por cada columna modificada y el total antes y después.
+    """
+    lines = []
+    for col, row in report.iterrows():
+        if row['tipo_antes'] != row['tipo_despues']:
+            lines.append(f"{col}: {row['tipo_antes']} -> {row['tipo_despues']} "
+                         f"({row['bytes_antes'] / 1e6:.2f} MB -> {row['bytes_despues'] / 1e6:.2f} MB)")
+    total_before = report['bytes_antes'].sum()
+    total_after = report['bytes_despues'].sum()
+    saved = 1 - total_after / total_before if total_before else 0.0
+    if not lines:
+        lines.append("No se encontraron columnas que compactar.")
+    lines.append(f"Total: {total_before / 1e6:.2f} MB -> {total_after / 1e6:.2f} MB ({saved:.0%} menos)")
+    return "\n".join(lines)
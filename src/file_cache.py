@@ -0,0 +1,192 @@
+import os
+import json
+import hashlib
+import tempfile
+import pandas as pd
+
+
+class ParsedFileCache:
+    """
+    Caché en disco de DataFrames ya parseados, guardados en formato Feather (Arrow IPC).
+
+    Volver a abrir una hoja de Excel o un CSV grande obliga a parsear el archivo completo.
+    Esta caché guarda el resultado del parseo en un formato binario columnar que se lee en
+    milisegundos, usando como clave la ruta absoluta, el tamaño y la fecha de modificación
+    del archivo de origen junto con las opciones de lectura. Si el archivo cambia, la clave
+    cambia y la entrada anterior deja de usarse hasta que la expulsión LRU la elimina.
+
+    Attributes:
+        cache_dir (str): Directorio donde se guardan las entradas.
+        max_bytes (int): Tamaño total máximo de la caché en bytes.
+        hits (int): Número de lecturas servidas desde la caché.
+        misses (int): Número de lecturas que tuvieron que parsear el archivo de origen.
+        last_hit (bool): Si la última lectura fue servida desde la caché.
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=1 << 30):
+        """
+        Inicializa la caché y crea el directorio si no existe.
+
+        Args:
+            cache_dir (str, optional): Directorio de la caché. Por defecto `~/.cache/novalabud`.
+            max_bytes (int, optional): Tamaño máximo total en bytes. Por defecto 1 GiB.
+        """
+        if cache_dir is None:
+            cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "novalabud")
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.last_hit = False
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _entry_path(self, file_path, options):
+        """
+        Calcula la ruta de la entrada para un archivo y sus opciones de lectura.
+
+        Args:
+            file_path (str): Ruta del archivo de origen.
+            options (dict): Opciones de lectura que afectan el DataFrame resultante.
+
+        Returns:
+            str: Ruta del archivo .feather de la entrada.
+        """
+        stat = os.stat(file_path)
+        key = json.dumps({
+            'path': os.path.abspath(file_path),
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'options': options,
+        }, sort_keys=True, default=str)
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.feather')
+
+    def get_or_load(self, file_path, options, loader):
+        """
+        Retorna el DataFrame cacheado o lo parsea con `loader` y lo guarda.
+
+        Args:
+            file_path (str): Ruta del archivo de origen.
+            options (dict): Opciones de lectura que forman parte de la clave.
+            loader (callable): Función sin argumentos que parsea el archivo de origen.
+
+        Returns:
+            pd.DataFrame: Datos del archivo.
+        """
+        entry = self._entry_path(file_path, options)
+        dtype_backend = options.get('dtype_backend')
+
+        if os.path.exists(entry):
+            try:
+                data = pd.read_feather(entry, dtype_backend=dtype_backend) if dtype_backend \
+                    else pd.read_feather(entry)
+                os.utime(entry)  # Marca la entrada como usada recientemente
+                self.hits += 1
+                self.last_hit = True
+                return data
+            except (OSError, ValueError):
+                self._remove(entry)
+
+        data = loader()
+        self.misses += 1
+        self.last_hit = False
+        self._store(entry, data)
+        return data
+
+    def _store(self, entry, data):
+        """
+        Guarda un DataFrame en la caché de forma atómica y aplica la expulsión LRU.
+
+        Los DataFrames que Feather no puede representar (nombres de columna no textuales,
+        índices no triviales o columnas de objetos mixtos) simplemente no se cachean, y
+        tampoco los que no caben en `max_bytes`: guardarlos obligaría a expulsar el resto de
+        la caché.
+
+        Args:
+            entry (str): Ruta de la entrada.
+            data (pd.DataFrame): Datos a guardar.
+        """
+        if not isinstance(data.index, pd.RangeIndex) or not all(isinstance(c, str) for c in data.columns):
+            return
+        # Estimación sin recorrer las cadenas; el tamaño real del archivo se verifica al escribirlo
+        if data.memory_usage(index=False).sum() > self.max_bytes:
+            return
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        os.close(fd)
+        try:
+            data.to_feather(tmp_path)
+            if os.path.getsize(tmp_path) > self.max_bytes:
+                self._remove(tmp_path)
+                return
+            os.replace(tmp_path, entry)
+        except Exception:
+            self._remove(tmp_path)
+            return
+        self._evict(keep=entry)
+
+    def _evict(self, keep=None):
+        """
+        Elimina las entradas usadas hace más tiempo hasta que la caché quepa en `max_bytes`.
+
+        Args:
+            keep (str, optional): Entrada que no se elimina, por ejemplo la recién guardada.
+        """
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.feather'):
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            self._remove(path)
+            total -= size
+
+    @staticmethod
+    def _remove(path):
+        """Elimina un archivo ignorando si ya no existe."""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def clear(self):
+        """
+        Elimina todas las entradas de la caché y reinicia los contadores.
+        """
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(('.feather', '.tmp')):
+                self._remove(os.path.join(self.cache_dir, name))
+        self.hits = 0
+        self.misses = 0
+        self.last_hit = False
+
+    def size_bytes(self):
+        """
+        Calcula el tamaño total ocupado por las entradas de la caché.
+
+        Returns:
+            int: Tamaño en bytes.
+        """
+        return sum(os.path.getsize(os.path.join(self.cache_dir, name))
+                   for name in os.listdir(self.cache_dir) if name.endswith('.feather'))
+
+    def summary(self):
+        """
+        Genera un resumen legible del uso de la caché.
+
+        Returns:
+            str: Aciertos, fallos, tasa de aciertos y tamaño ocupado.
+        """
+        total = self.hits + self.misses
+        rate = self.hits / total * 100 if total else 0.0
+        return (f"Caché: {self.hits} aciertos, {self.misses} fallos ({rate:.0f}% aciertos), "
+                f"{self.size_bytes() / 1e6:.1f} MB de {self.max_bytes / 1e6:.0f} MB")
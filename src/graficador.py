@@ -316,6 +316,31 @@ origy_lim = None
 # Variable global para almacenar los datos cargados
 data = pd.DataFrame()  # Inicializar como DataFrame vacío
 
+# Mínimo y máximo de cada columna: los datos no cambian, así que se calculan una sola vez
+limites_columnas = {}
+
+def limites_columna(columna):
+    """
+    Retorna el mínimo y el máximo de una columna de los datos cargados.
+
+    Se usan los límites calculados por la aplicación principal (guardados en
+    `data.attrs['column_limits']`) o, si no están, se calculan la primera vez que se piden.
+    Así redibujar la gráfica o abrir las ventanas de límites no vuelve a recorrer la columna.
+
+    Parámetros
+    ----------
+    columna : str
+        Nombre de la columna.
+
+    Retorna
+    -------
+    tuple
+        (mínimo, máximo) de la columna.
+    """
+    if columna not in limites_columnas:
+        limites_columnas[columna] = (data[columna].min(), data[columna].max())
+    return limites_columnas[columna]
+
 def cargar_datos():
     """
     Carga los datos desde un archivo temporal llamado 'tmp_graph.pkl' al iniciar la aplicación.
@@ -331,6 +356,8 @@ def cargar_datos():
             # Cargar archivo temporal .pkl en un DataFrame
             with open("tmp_graph.pkl", 'rb') as f:
                 data = pickle.load(f)
+            limites_columnas.clear()
+            limites_columnas.update(data.attrs.get('column_limits', {}))
 
             if not data.empty:
                 actualizar_columnas()  # Actualizar opciones de columnas
@@ -501,19 +528,16 @@ def graficar_datos():
         messagebox.showerror("Error", "Las columnas seleccionadas deben ser numéricas.")
         return
         
-    datos_x = data[x_col]
-    datos_y = data[y_col]
-
     # Restablecer límites originales si es la primera vez que se grafican
     if origx_lim is None or origy_lim is None:
-        origx_lim = [datos_x.min(), datos_x.max()]
-        origy_lim = [datos_y.min(), datos_y.max()]
+        origx_lim = list(limites_columna(x_col))
+        origy_lim = list(limites_columna(y_col))
         x_limits = origx_lim.copy()
         y_limits = origy_lim.copy()
 
     # Restablecer límites automáticamente según los datos actuales
-    x_limits = [datos_x.min(), datos_x.max()]
-    y_limits = [datos_y.min(), datos_y.max()]
+    x_limits = list(limites_columna(x_col))
+    y_limits = list(limites_columna(y_col))
 
     # Actualizar títulos de los ejes con los nombres de las columnas seleccionadas
     ejex_titulo.set(x_col)
@@ -1266,12 +1290,8 @@ def update_x_limits(master):
     # Obtener las columnas seleccionadas
     columna_x_seleccionada = columna_x.get()
         
-    # Obtener los datos de la columna seleccionada
-    datos_x = data[columna_x_seleccionada]
-    
-    # Valores predeterminados 
-    x_min_datos = datos_x.min()
-    x_max_datos = datos_x.max()
+    # Valores predeterminados: límites de la columna seleccionada
+    x_min_datos, x_max_datos = limites_columna(columna_x_seleccionada)
 
     # Crear nueva ventana
     ventana_lim_x = Toplevel(master)
@@ -1327,12 +1347,8 @@ def set_x_limits(x_min_entry, x_max_entry):
         # Obtener las columnas seleccionadas
         columna_x_seleccionada = columna_x.get()
         
-        # Obtener los datos de la columna seleccionada
-        datos_x = data[columna_x_seleccionada]
-
-        # Valores predeterminados 
-        x_min_datos = datos_x.min()
-        x_max_datos = datos_x.max()
+        # Valores predeterminados: límites de la columna seleccionada
+        x_min_datos, x_max_datos = limites_columna(columna_x_seleccionada)
         
         # Validar y asignar los límites ingresados por el usuario
         x_min = float(x_min_entry.get()) if x_min_entry.get() else x_min_datos
@@ -1370,12 +1386,8 @@ def update_y_limits(master):
     # Obtener las columnas seleccionadas
     columna_y_seleccionada = columna_y.get()
         
-    # Obtener los datos de la columna seleccionada
-    datos_y = data[columna_y_seleccionada]
-    
-    # Valores predeterminados 
-    y_min_datos = datos_y.min()
-    y_max_datos = datos_y.max()
+    # Valores predeterminados: límites de la columna seleccionada
+    y_min_datos, y_max_datos = limites_columna(columna_y_seleccionada)
 
 
     # Crear nueva ventana
@@ -1433,12 +1445,8 @@ def set_y_limits(y_min_entry, y_max_entry):
         # Obtener las columnas seleccionadas
         columna_y_seleccionada = columna_y.get()
         
-        # Obtener los datos de la columna seleccionada
-        datos_y = data[columna_y_seleccionada]
-
-        # Valores predeterminados 
-        y_min_datos = datos_y.min()
-        y_max_datos = datos_y.max()
+        # Valores predeterminados: límites de la columna seleccionada
+        y_min_datos, y_max_datos = limites_columna(columna_y_seleccionada)
         
         # Validar y asignar los límites ingresados por el usuario
         y_min = float(y_min_entry.get()) if y_min_entry.get() else y_min_datos
@@ -0,0 +1,187 @@
+import numpy as np
+import pandas as pd
+
+
+class RowDropDelta:
+    """
+    Cambio reversible que elimina filas: guarda solo las filas eliminadas y sus posiciones.
+
+    Attributes:
+        positions (np.ndarray): Posiciones de las filas eliminadas en el DataFrame anterior.
+        rows (pd.DataFrame): Filas eliminadas, con su índice original.
+    """
+
+    def __init__(self, data, removed_mask):
+        """
+        Registra las filas que una operación va a eliminar.
+
+        Args:
+            data (pd.DataFrame): Datos antes de eliminar las filas.
+            removed_mask (np.ndarray): Máscara booleana de las filas eliminadas.
+        """
+        self.positions = np.flatnonzero(removed_mask)
+        self.rows = data.iloc[self.positions].copy()
+
+    @classmethod
+    def from_rows(cls, positions, rows):
+        """
+        Crea el cambio a partir de filas ya extraídas.
+
+        Args:
+            positions (np.ndarray): Posiciones de las filas eliminadas en el DataFrame anterior.
+            rows (pd.DataFrame): Filas eliminadas, con su índice original.
+
+        Returns:
+            RowDropDelta: Cambio equivalente a eliminar esas filas.
+        """
+        delta = cls.__new__(cls)
+        delta.positions = positions
+        delta.rows = rows
+        return delta
+
+    def undo(self, data):
+        """Reinserta las filas eliminadas en sus posiciones originales."""
+        total = len(data) + len(self.positions)
+        source = np.empty(total, dtype=np.int64)
+        kept = np.ones(total, dtype=bool)
+        kept[self.positions] = False
+        source[kept] = np.arange(len(data))
+        source[self.positions] = len(data) + np.arange(len(self.positions))
+        rows = self.rows.reindex(columns=data.columns)
+        return pd.concat([data, rows]).take(source)
+
+    def redo(self, data):
+        """Vuelve a eliminar las filas."""
+        kept = np.ones(len(data), dtype=bool)
+        kept[self.positions] = False
+        return data.take(np.flatnonzero(kept))
+
+    def add_columns(self, columns):
+        """
+        Agrega a las filas guardadas columnas traídas después de la operación.
+
+        Args:
+            columns (pd.DataFrame): Columnas nuevas, indexadas como el archivo de origen.
+        """
+        self.rows = self.rows.join(columns.reindex(self.rows.index))
+
+    def rows_affected(self):
+        """Número de filas eliminadas."""
+        return len(self.positions)
+
+    def nbytes(self):
+        """Bytes que ocupa el cambio en memoria."""
+        return int(self.positions.nbytes + self.rows.memory_usage(deep=True).sum())
+
+
+class AffineDelta:
+    """
+    Cambio reversible que escala columnas como `(x - offset) / scale`: guarda dos números por columna.
+
+    Attributes:
+        params (dict): {columna: (offset, scale, dtype original)}.
+    """
+
+    def __init__(self, params):
+        """
+        Args:
+            params (dict): {columna: (offset, scale, dtype original)}.
+        """
+        self.params = params
+
+    def undo(self, data):
+        """Aplica la transformación inversa `x * scale + offset` y recupera los tipos enteros."""
+        data = data.copy(deep=False)
+        for col, (offset, scale, dtype) in self.params.items():
+            values = data[col] * scale + offset
+            if pd.api.types.is_integer_dtype(dtype):
+                values = values.round().astype(dtype)
+            data[col] = values
+        return data
+
+    def redo(self, data):
+        """Vuelve a aplicar la transformación."""
+        data = data.copy(deep=False)
+        for col, (offset, scale, _) in self.params.items():
+            data[col] = (data[col] - offset) / scale
+        return data
+
+    def add_columns(self, columns):
+        """Las columnas nuevas no se ven afectadas por un escalado anterior."""
+
+    def nbytes(self):
+        """Bytes que ocupa el cambio en memoria (aproximado)."""
+        return 24 * len(self.params)
+
+
+class CellFillDelta:
+    """
+    Cambio reversible que rellena celdas nulas: guarda las posiciones y los valores imputados.
+
+    Attributes:
+        cells (dict): {columna: (posiciones, valores)}.
+    """
+
+    def __init__(self, data, null_masks):
+        """
+        Registra las celdas que una operación acaba de rellenar.
+
+        Args:
+            data (pd.DataFrame): Datos después de rellenar.
+            null_masks (dict): {columna: máscara booleana de nulos antes de rellenar}.
+        """
+        self.cells = {}
+        for col, was_null in null_masks.items():
+            filled = np.flatnonzero(was_null & data[col].notna().to_numpy())
+            if len(filled):
+                self.cells[col] = (filled, data[col].iloc[filled].to_numpy())
+
+    @classmethod
+    def from_cells(cls, cells):
+        """
+        Crea el cambio a partir de las celdas imputadas ya conocidas.
+
+        Args:
+            cells (dict): {columna: (posiciones, valores)}.
+
+        Returns:
+            CellFillDelta: Cambio equivalente a rellenar esas celdas.
+        """
+        delta = cls.__new__(cls)
+        delta.cells = cells
+        return delta
+
+    def undo(self, data):
+        """Vuelve a dejar nulas las celdas imputadas."""
+        data = data.copy(deep=False)
+        for col, (positions, _) in self.cells.items():
+            values = data[col].copy()
+            values.iloc[positions] = None
+            data[col] = values
+        return data
+
+    def redo(self, data):
+        """Vuelve a escribir los valores imputados."""
+        data = data.copy(deep=False)
+        for col, (positions, imputed) in self.cells.items():
+            values = data[col].copy()
+            values.iloc[positions] = imputed
+            data[col] = values
+        return data
+
+    def add_columns(self, columns):
+        """Las columnas nuevas no tienen celdas imputadas."""
+
+    def count(self):
+        """Número de celdas imputadas."""
+        return sum(len(positions) for positions, _ in self.cells.values())
+
+    def rows_affected(self):
+        """Número de filas con alguna celda imputada."""
+        if len(self.cells) == 1:
+            return len(next(iter(self.cells.values()))[0])
+        return len(np.unique(np.concatenate([positions for positions, _ in self.cells.values()] or [[]])))
+
+    def nbytes(self):
+        """Bytes que ocupa el cambio en memoria."""
+        return int(sum(positions.nbytes + imputed.nbytes for positions, imputed in self.cells.values()))
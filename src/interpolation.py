@@ -0,0 +1,131 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+
+def _index_positions(index):
+    """
+    Coordenadas de las filas para la interpolación polinomial: los valores del índice.
+
+    Raises:
+        ValueError: Si el índice no es numérico ni de fechas.
+    """
+    if pd.api.types.is_datetime64_any_dtype(index):
+        return index.asi8.astype(np.float64)
+    if pd.api.types.is_numeric_dtype(index):
+        return index.to_numpy(dtype=np.float64)
+    raise ValueError("El índice debe ser numérico o de fechas para la interpolación polinomial")
+
+
+def _local_polynomial(values, x, degree, window):
+    """
+    Rellena cada hueco interior con un polinomio de grado `degree` ajustado por mínimos
+    cuadrados a los `window` valores válidos a cada lado del hueco.
+
+    Todos los huecos se resuelven a la vez: las ventanas se reúnen en un arreglo
+    (huecos x puntos) y los sistemas normales de todos los ajustes se resuelven con una
+    sola llamada a `np.linalg.solve`. Con `2 * window == degree + 1` el polinomio pasa por
+    los puntos de la ventana. Los huecos al inicio o al final de la serie quedan nulos,
+    como en la interpolación global.
+    """
+    result = values.copy()
+    missing = np.isnan(values)
+    valid = np.flatnonzero(~missing)
+    if len(valid) <= degree:
+        return result  # No hay puntos suficientes para el grado pedido
+    edges = np.diff(np.concatenate(([0], missing.view(np.int8), [0])))
+    starts, ends = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+    interior = (starts > 0) & (ends < len(values))
+    starts, ends = starts[interior], ends[interior]
+    if not len(starts):
+        return result
+
+    # Ventana de cada hueco; si un lado tiene menos de `window` puntos, el otro aporta los que faltan
+    size = min(2 * window, len(valid))
+    split = np.searchsorted(valid, starts)
+    left = np.clip(split - window, 0, len(valid) - size)
+    support = valid[left[:, None] + np.arange(size)]
+
+    # Abscisas centradas y escaladas por hueco para que el sistema esté bien condicionado
+    support_x = x[support]
+    center = support_x.mean(axis=1, keepdims=True)
+    spread = np.ptp(support_x, axis=1, keepdims=True)
+    spread[spread == 0] = 1.0
+    powers = np.arange(degree + 1)
+    design = ((support_x - center) / spread)[:, :, None] ** powers
+    normal = np.einsum('gpi,gpj->gij', design, design)
+    rhs = np.einsum('gpi,gp->gi', design, values[support])
+    coefficients = np.linalg.solve(normal, rhs[:, :, None])[:, :, 0]
+
+    # Cada posición nula toma el polinomio de su hueco
+    lengths = ends - starts
+    gap = np.repeat(np.arange(len(starts)), lengths)
+    offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    positions = np.repeat(starts, lengths) + offsets
+    t = (x[positions] - center[gap, 0]) / spread[gap, 0]
+    result[positions] = np.einsum('pi,pi->p', t[:, None] ** powers, coefficients[gap])
+    return result
+
+
+def interpolate_values(values, index, method='linear', degree=None, window=None):
+    """
+    Rellena los nulos de una columna por interpolación.
+
+    Se define a nivel de módulo para que `ProcessPoolExecutor` pueda serializarla.
+
+    Args:
+        values (np.ndarray): Valores de la columna, con NaN en los nulos.
+        index (pd.Index): Índice de los datos; la interpolación polinomial lo usa como abscisa.
+        method (str, optional): 'linear' o 'polynomial'. Por defecto 'linear'.
+        degree (int, optional): Grado de la interpolación polinomial.
+        window (int, optional): Para 'polynomial', número de valores válidos a cada lado de
+            cada hueco con los que se ajusta un polinomio local por mínimos cuadrados. Si es
+            None, se interpola con un spline sobre toda la serie.
+
+    Returns:
+        np.ndarray: Valores con los nulos interpolados.
+
+    Raises:
+        ValueError: Si el método no es soportado o el índice no sirve para 'polynomial'.
+    """
+    if method == 'linear':
+        return pd.Series(values).interpolate(method='linear').to_numpy()
+    if method != 'polynomial':
+        raise ValueError(f"Método de interpolación no soportado: {method}")
+    if window is None:
+        return pd.Series(values, index=index).interpolate(method='polynomial', order=degree).to_numpy()
+    return _local_polynomial(values, _index_positions(index), degree, max(int(window), (degree + 2) // 2))
+
+
+def interpolate_columns(data, columns, method='linear', degree=None, window=None, workers=None):
+    """
+    Interpola los nulos de varias columnas numéricas, en paralelo si se piden varios procesos.
+
+    Cada columna es independiente, así que con `workers` > 1 se reparten entre procesos de
+    un `ProcessPoolExecutor`; cada proceso recibe solo los valores de su columna y el índice.
+
+    Args:
+        data (pd.DataFrame): Datos. No se modifican.
+        columns (list): Columnas numéricas a interpolar.
+        method (str, optional): 'linear' o 'polynomial'. Por defecto 'linear'.
+        degree (int, optional): Grado de la interpolación polinomial.
+        window (int, optional): Valores válidos a cada lado de cada hueco para 'polynomial'
+            (ver `interpolate_values`). Si es None, se ajusta a toda la serie.
+        workers (int, optional): Procesos de trabajo. Si es None o 1, se interpola en este proceso.
+
+    Returns:
+        dict: {columna: np.ndarray con los valores interpolados}.
+    """
+    arrays = {col: data[col].to_numpy(dtype=np.float64, na_value=np.nan) for col in columns}
+    if not workers or workers <= 1 or len(columns) <= 1:
+        return {col: interpolate_values(values, data.index, method, degree, window)
+                for col, values in arrays.items()}
+
+    # 'spawn' evita bifurcar un proceso con hilos activos (por ejemplo, el de la interfaz)
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=min(workers, len(columns)), mp_context=context) as executor:
+        futures = {col: executor.submit(interpolate_values, values, data.index, method, degree, window)
+                   for col, values in arrays.items()}
+        return {col: future.result() for col, future in futures.items()}
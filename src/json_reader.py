@@ -0,0 +1,157 @@
+import io
+import os
+import pandas as pd
+
+from src.compressed_io import split_compression, wrap_decompressor
+
+JSON_EXTENSIONS = ('.json', '.ndjson', '.jsonl')
+
+
+def _first_byte(file_path):
+    """Retorna el primer byte que no es espacio en blanco del archivo (descomprimido)."""
+    with open(file_path, 'rb') as raw, wrap_decompressor(raw, split_compression(file_path)[1]) as handle:
+        while True:
+            block = handle.read(4096)
+            if not block:
+                return b''
+            stripped = block.lstrip()
+            if stripped:
+                return stripped[:1]
+
+
+def _iter_blocks(handle, block_size):
+    """
+    Lee un flujo binario en bloques que terminan en un salto de línea.
+
+    Args:
+        handle (file): Flujo binario abierto.
+        block_size (int): Tamaño aproximado de cada bloque en bytes.
+
+    Yields:
+        bytes: Bloques con registros completos.
+    """
+    pending = b''
+    while True:
+        block = handle.read(block_size)
+        if not block:
+            break
+        block = pending + block
+        end = block.rfind(b'\n') + 1
+        if end == 0:
+            pending = block
+            continue
+        pending = block[end:]
+        yield block[:end]
+    if pending.strip():
+        yield pending + b'\n'
+
+
+def read_json_records(file_path, usecols=None, nrows=None, progress_callback=None,
+                      dtype_backend=None, block_size=1 << 24):
+    """
+    Lee un archivo JSON de registros, preferentemente delimitado por líneas (NDJSON).
+
+    Los archivos NDJSON (un objeto por línea) se leen por bloques de `block_size` bytes que se
+    cortan en el último salto de línea, y cada bloque se parsea con el lector multihilo de
+    PyArrow directamente a columnas de Arrow, sin construir el árbol de objetos de Python de
+    `json.loads`. Los bloques se unen al final promoviendo los tipos (por ejemplo, enteros que
+    luego aparecen con decimales pasan a flotantes; campos ausentes quedan nulos). Los archivos
+    comprimidos se descomprimen al vuelo.
+
+    Sin PyArrow, se usa `pd.read_json(lines=True, chunksize=...)`. Un archivo .json que contiene
+    un arreglo u objeto JSON (no una línea por registro) se lee completo con `pd.read_json`.
+
+    Args:
+        file_path (str): Ruta del archivo .json, .ndjson o .jsonl (opcionalmente comprimido).
+        usecols (list, optional): Campos a conservar.
+        nrows (int, optional): Máximo de registros a leer.
+        progress_callback (callable, optional): Función que recibe (registros_leidos, fraccion_leida).
+        dtype_backend (str, optional): 'pyarrow' para columnas con tipos de Arrow.
+        block_size (int, optional): Bytes por bloque. Por defecto 16 MiB.
+
+    Returns:
+        pd.DataFrame: Un registro por fila y un campo por columna.
+    """
+    base_path, compression = split_compression(file_path)
+    if not base_path.endswith(('.ndjson', '.jsonl')) and _first_byte(file_path) != b'{':
+        return _read_json_document(file_path, usecols, nrows, dtype_backend)
+
+    try:
+        import pyarrow as pa
+        import pyarrow.json as pa_json
+    except ImportError:
+        return _read_ndjson_pandas(file_path, usecols, nrows, progress_callback, dtype_backend,
+                                   chunksize=max(block_size // 256, 1))
+
+    if nrows is not None:
+        block_size = min(block_size, 1 << 20)  # Para unas pocas filas basta un bloque pequeño
+    lines_format = base_path.endswith(('.ndjson', '.jsonl'))
+    total_bytes = os.path.getsize(file_path) or 1
+    tables = []
+    rows = 0
+    with open(file_path, 'rb') as raw, wrap_decompressor(raw, compression) as handle:
+        for block in _iter_blocks(handle, block_size):
+            try:
+                table = pa_json.read_json(io.BytesIO(block))
+            except pa.ArrowInvalid:
+                if tables:
+                    raise
+                # Un único objeto JSON en varias líneas, no NDJSON
+                return _read_json_document(file_path, usecols, nrows, dtype_backend)
+            if not tables and not lines_format and table.num_rows == 1 and \
+                    all(pa.types.is_struct(field.type) for field in table.schema):
+                # Un único objeto por columnas ({"col": {"0": ...}}) escrito en una sola línea
+                return _read_json_document(file_path, usecols, nrows, dtype_backend)
+            if usecols is not None:
+                table = table.select([col for col in usecols if col in table.column_names])
+            tables.append(table)
+            rows += table.num_rows
+            if progress_callback:
+                progress_callback(rows, min(raw.tell() / total_bytes, 1.0))
+            if nrows is not None and rows >= nrows:
+                break
+
+    if not tables:
+        return pd.DataFrame(columns=usecols)
+    table = pa.concat_tables(tables, promote_options='permissive')
+    if nrows is not None:
+        table = table.slice(0, nrows)
+    if usecols is not None:
+        table = table.select([col for col in usecols if col in table.column_names])
+    if dtype_backend == 'pyarrow':
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+    data = table.to_pandas()
+    return data.convert_dtypes(dtype_backend=dtype_backend) if dtype_backend else data
+
+
+def _read_ndjson_pandas(file_path, usecols, nrows, progress_callback, dtype_backend, chunksize):
+    """Lee NDJSON por bloques de registros con pandas, cuando PyArrow no está disponible."""
+    options = {'lines': True, 'chunksize': chunksize, 'nrows': nrows, 'compression': 'infer'}
+    if dtype_backend is not None:
+        options['dtype_backend'] = dtype_backend
+    chunks = []
+    rows = 0
+    with pd.read_json(file_path, **options) as reader:
+        for chunk in reader:
+            if usecols is not None:
+                chunk = chunk[[col for col in usecols if col in chunk.columns]]
+            chunks.append(chunk)
+            rows += len(chunk)
+            if progress_callback:
+                progress_callback(rows, 0.0)
+    if not chunks:
+        return pd.DataFrame(columns=usecols)
+    return pd.concat(chunks, ignore_index=True)
+
+
+def _read_json_document(file_path, usecols, nrows, dtype_backend):
+    """Lee un documento JSON completo (arreglo de registros u objeto por columnas)."""
+    options = {'compression': 'infer'}
+    if dtype_backend is not None:
+        options['dtype_backend'] = dtype_backend
+    data = pd.read_json(file_path, **options)
+    if usecols is not None:
+        data = data[[col for col in usecols if col in data.columns]]
+    if nrows is not None:
+        data = data.head(nrows)
+    return data
@@ -0,0 +1,240 @@
+import numpy as np
+import pandas as pd
+
+from src.history import RowDropDelta, AffineDelta, CellFillDelta
+from src.normalization import column_block, block_statistics, scaling_parameters
+from src.duplicates import duplicated_rows, duplicates_scope
+
+
+class PlanStep:
+    """
+    Operación registrada en modo diferido, pendiente de ejecutarse.
+
+    Al ejecutarse el plan se completan `details`, `rows_affected` y `delta` con el resultado,
+    igual que si la operación se hubiera aplicado de inmediato.
+
+    Attributes:
+        operation (str): Nombre de la operación, como en el historial de transformaciones.
+        kind (str): 'rows' si elimina filas, 'columns' si transforma valores de columnas.
+        details (str): Detalle para el historial; mientras está pendiente, una descripción.
+        rows_affected (int): Filas eliminadas o modificadas por la operación, o None si está pendiente.
+        delta (RowDropDelta, AffineDelta or CellFillDelta): Cambio reversible, o None si está pendiente.
+        params (dict): Argumentos de la operación, como en el historial de transformaciones.
+    """
+
+    operation = None
+    kind = None
+
+    def __init__(self, details, params=None):
+        self.details = details
+        self.params = params or {}
+        self.rows_affected = None
+        self.delta = None
+
+    def add_columns(self, columns):
+        """Un paso pendiente se aplica sobre las columnas presentes al ejecutarse el plan."""
+
+
+class DropNullRowsStep(PlanStep):
+    """Elimina las filas con algún valor nulo."""
+
+    operation = 'remove_null_values'
+    kind = 'rows'
+
+    def __init__(self):
+        super().__init__('Pendiente: eliminar filas con valores nulos')
+
+    def removed(self, data, alive):
+        """Máscara de las filas vivas que elimina el paso."""
+        return alive & data.isna().any(axis=1).to_numpy()
+
+    def describe(self, count):
+        return f'Eliminadas {count} filas con valores nulos'
+
+
+class DropDuplicatesStep(PlanStep):
+    """Elimina las filas duplicadas entre las filas vivas, conservando la primera."""
+
+    operation = 'remove_duplicates'
+    kind = 'rows'
+
+    def __init__(self, subset=None, tolerance=None):
+        super().__init__(f'Pendiente: eliminar filas duplicadas{duplicates_scope(subset, tolerance)}',
+                         {'subset': None if subset is None else list(subset), 'tolerance': tolerance})
+        self.subset = subset
+        self.tolerance = tolerance
+
+    def removed(self, data, alive):
+        """Máscara de las filas vivas que repiten una fila viva anterior."""
+        if alive.all():
+            return duplicated_rows(data, self.subset, self.tolerance)
+        positions = np.flatnonzero(alive)
+        mask = np.zeros(len(data), dtype=bool)
+        mask[positions] = duplicated_rows(data.take(positions), self.subset, self.tolerance)
+        return mask
+
+    def describe(self, count):
+        return f'Eliminadas {count} filas duplicadas{duplicates_scope(self.subset, self.tolerance)}'
+
+
+class NormalizeStep(PlanStep):
+    """Escala columnas numéricas con Min-Max, Z-Score o Max Abs."""
+
+    operation = 'normalize_data'
+    kind = 'columns'
+
+    def __init__(self, columns, method):
+        super().__init__(f'Pendiente: normalizar las columnas {", ".join(map(str, columns))} usando {method}',
+                         {'selected_columns': list(columns), 'method': method})
+        self.columns = list(columns)
+        self.method = method
+
+    def describe(self):
+        return f'Normalizadas las columnas {", ".join(map(str, self.columns))} usando {self.method}'
+
+
+class FillMeanStep(PlanStep):
+    """Rellena los nulos de columnas numéricas con la media de cada columna."""
+
+    operation = 'fill_null_values'
+    kind = 'columns'
+
+    def __init__(self, columns):
+        super().__init__(f'Pendiente: rellenar con la media en {", ".join(map(str, columns))}',
+                         {'method': 'mean', 'columns': list(columns)})
+        self.columns = list(columns)
+
+    def describe(self, filled_columns):
+        return f'rellenados con la media en {", ".join(map(str, filled_columns))}'
+
+
+def run_plan(data, steps, stats=None):
+    """
+    Ejecuta un plan de operaciones diferidas fusionando los pasos compatibles.
+
+    Los pasos consecutivos que eliminan filas se combinan en una sola máscara y los datos se
+    recortan una única vez. Los pasos consecutivos que transforman columnas se resuelven con
+    una sola lectura de las columnas como bloque 2-D: las estadísticas (conteo, media,
+    mínimo, máximo y suma de cuadrados) se calculan una vez por columna y se propagan de forma
+    exacta a través de cada escalado y relleno, de modo que todas las transformaciones se
+    componen en un único `x * a + b` por columna más el valor de relleno de sus nulos. El orden
+    entre grupos de filas y de columnas se respeta.
+
+    Cada paso queda con su `delta`, `details` y `rows_affected`, equivalentes a los que habría
+    registrado la operación aplicada de inmediato.
+
+    Args:
+        data (pd.DataFrame): Datos sobre los que se aplica el plan. No se modifican.
+        steps (list): Pasos del plan (`PlanStep`), en orden.
+        stats (ColumnStatsCache, optional): Caché de estadísticas de `data`. Sus valores
+            evitan recalcular las estadísticas de las columnas y se actualiza con cada paso.
+
+    Returns:
+        pd.DataFrame: Datos con todas las operaciones aplicadas.
+    """
+    start = 0
+    while start < len(steps):
+        end = start
+        while end < len(steps) and steps[end].kind == steps[start].kind:
+            end += 1
+        group = steps[start:end]
+        if group[0].kind == 'rows':
+            data = _run_row_steps(data, group)
+        else:
+            data = _run_column_steps(data, group, stats)
+        if stats is not None:
+            for step in group:
+                stats.apply(step.delta)
+        start = end
+    return data
+
+
+def _run_row_steps(data, steps):
+    """Aplica pasos consecutivos que eliminan filas con una sola selección final."""
+    alive = np.ones(len(data), dtype=bool)
+    for step in steps:
+        removed = step.removed(data, alive)
+        # Posiciones relativas a los datos que recibió el paso, como en la ejecución inmediata
+        positions = np.flatnonzero(removed[alive])
+        step.delta = RowDropDelta.from_rows(positions, data.take(np.flatnonzero(removed)))
+        alive &= ~removed
+        step.details = step.describe(len(positions))
+        step.rows_affected = len(positions)
+    return data.take(np.flatnonzero(alive))
+
+
+def _run_column_steps(data, steps, stats=None):
+    """Compone pasos consecutivos sobre columnas y los aplica en una pasada sobre el bloque."""
+    columns = []
+    for step in steps:
+        for col in step.columns:
+            if col not in columns and pd.api.types.is_numeric_dtype(data[col]):
+                columns.append(col)
+    position = {col: i for i, col in enumerate(columns)}
+    n_rows = len(data)
+
+    block = column_block(data, columns)
+    nulls = np.isnan(block)
+    # Las estadísticas de la caché son copias: se pueden propagar sobre ellas
+    initial = stats.statistics(data, columns, block) if stats is not None else block_statistics(block)
+    count, minimum, maximum, mean, m2 = (initial[key] for key in ('count', 'min', 'max', 'mean', 'm2'))
+
+    # Estado de cada columna: valor actual = original * a + b; los nulos rellenados valen fill
+    a = np.ones(len(columns))
+    b = np.zeros(len(columns))
+    fill = np.full(len(columns), np.nan)
+    filled = np.zeros(len(columns), dtype=bool)
+    dtypes = {col: data[col].dtype for col in columns}
+    touched = np.zeros(len(columns), dtype=bool)
+
+    for step in steps:
+        targets = [position[col] for col in step.columns if col in position]
+        if isinstance(step, NormalizeStep):
+            # Columnas completamente vacías: no se transforman
+            targets = np.array([i for i in targets if count[i] > 0], dtype=np.intp)
+            offset, scale = scaling_parameters(step.method, count[targets], minimum[targets],
+                                               maximum[targets], mean[targets], m2[targets])
+            step.delta = AffineDelta({columns[i]: (o, sc, dtypes[columns[i]])
+                                      for i, o, sc in zip(targets, offset.tolist(), scale.tolist())})
+            for i in targets:
+                dtypes[columns[i]] = np.dtype(np.float64)
+            touched[targets] = True
+
+            # Filas modificadas: se comparan los valores de las columnas escaladas antes y después
+            before = np.where(nulls[:, targets] & filled[targets], fill[targets], block[:, targets] * a[targets] + b[targets])
+            with np.errstate(invalid='ignore'):
+                changed = ((before - offset) / scale != before) & ~np.isnan(before)
+            step.rows_affected = int(changed.any(axis=1).sum())
+
+            # Las estadísticas se propagan por la transformación (scale > 0) sin volver a leer los datos
+            a[targets] /= scale
+            b[targets] = (b[targets] - offset) / scale
+            fill[targets] = (fill[targets] - offset) / scale
+            minimum[targets] = (minimum[targets] - offset) / scale
+            maximum[targets] = (maximum[targets] - offset) / scale
+            mean[targets] = (mean[targets] - offset) / scale
+            m2[targets] /= scale ** 2
+            count[targets[~np.isfinite(scale)]] = 0  # Desviación indefinida: la columna queda sin valores
+            step.details = step.describe()
+        else:
+            cells = {}
+            for i in targets:
+                if count[i] == 0 or count[i] == n_rows:
+                    continue  # Sin media o sin nulos
+                positions = np.flatnonzero(nulls[:, i])
+                cells[columns[i]] = (positions, np.full(len(positions), mean[i]))
+                fill[i] = mean[i]
+                filled[i] = True
+                touched[i] = True
+                count[i] = n_rows
+            step.delta = CellFillDelta.from_cells(cells)
+            step.details = step.describe(list(cells))
+            step.rows_affected = step.delta.rows_affected()
+
+    if not touched.any():
+        return data
+    result = block * a + b
+    result = np.where(nulls & filled, fill, result)
+    data = data.copy(deep=False)
+    data[[col for col, changed in zip(columns, touched) if changed]] = result[:, touched]
+    return data
@@ -0,0 +1,303 @@
+import io
+import os
+import stat
+import time
+import threading
+from collections import deque
+import pandas as pd
+
+from src.compressed_io import split_compression
+from src.text_sniffer import sniff_text_format
+
+
+class LiveIngest:
+    """
+    Sigue un archivo CSV/TXT que crece (o una FIFO local) y acumula sus filas nuevas.
+
+    Un hilo de trabajo lee solo los bytes añadidos desde la última lectura, parsea las líneas
+    completas y guarda cada lote en un búfer circular de lotes (`deque`) acotado a `max_rows`
+    filas: al superarse el límite se descartan las filas más antiguas. Una línea incompleta al
+    final de la lectura se conserva hasta que llega el resto. Como mucho cada
+    `refresh_interval` segundos se arma un DataFrame con el contenido del búfer y se entrega a
+    `on_update`, de modo que la interfaz no se redibuja con cada lote.
+
+    El formato (delimitador, marca decimal, preámbulo y encabezado) se detecta con
+    `sniff_text_format` sobre las primeras `sniff_lines` líneas, salvo que se indique con
+    `read_options`. Si el origen escribe despacio, pasados `sniff_timeout` segundos desde los
+    primeros bytes se detecta con las líneas completas que haya (al menos el encabezado y una
+    fila), para no dejar la tabla vacía mientras tanto.
+
+    Attributes:
+        file_path (str): Ruta del archivo o FIFO seguido.
+        max_rows (int): Máximo de filas que conserva el búfer.
+        rows_total (int): Filas leídas desde el inicio, incluidas las descartadas.
+        rows_dropped (int): Filas descartadas por superar `max_rows`.
+        columns (list): Nombres de las columnas, o None si aún no se ha leído el encabezado.
+        error (Exception): Error que detuvo el hilo de trabajo, o None.
+    """
+
+    def __init__(self, file_path, on_update=None, on_error=None, max_rows=1_000_000,
+                 refresh_interval=0.5, poll_interval=0.1, read_options=None,
+                 read_size=1 << 20, sniff_lines=20, sniff_timeout=2.0):
+        """
+        Prepara el seguimiento del archivo sin iniciar el hilo de trabajo.
+
+        Args:
+            file_path (str): Ruta del archivo CSV/TXT o de la FIFO.
+            on_update (callable, optional): Función que recibe el DataFrame del búfer. Se llama
+                desde el hilo de trabajo.
+            on_error (callable, optional): Función que recibe la excepción que detuvo la lectura.
+            max_rows (int, optional): Máximo de filas en el búfer. Por defecto 1 000 000.
+            refresh_interval (float, optional): Segundos mínimos entre llamadas a `on_update`.
+            poll_interval (float, optional): Segundos de espera cuando no hay datos nuevos.
+            read_options (dict, optional): Opciones de `pd.read_csv` (`sep`, `decimal`,
+                `encoding`, `header`, `skiprows`). Si es None, se detectan del archivo.
+            read_size (int, optional): Máximo de bytes leídos por lote. Por defecto 1 MiB.
+            sniff_lines (int, optional): Líneas completas a esperar antes de detectar el formato.
+            sniff_timeout (float, optional): Segundos máximos a esperar esas líneas; después se
+                detecta el formato con las que haya, si son al menos dos. Por defecto 2.
+
+        Raises:
+            ValueError: Si el archivo está comprimido o `max_rows` no es positivo.
+        """
+        if split_compression(file_path)[1] is not None:
+            raise ValueError("La lectura en vivo no admite archivos comprimidos")
+        if max_rows <= 0:
+            raise ValueError("max_rows debe ser positivo")
+
+        self.file_path = file_path
+        self.on_update = on_update
+        self.on_error = on_error
+        self.max_rows = max_rows
+        self.refresh_interval = refresh_interval
+        self.poll_interval = poll_interval
+        self.read_size = read_size
+        self.sniff_lines = sniff_lines
+        self.sniff_timeout = sniff_timeout
+        self.rows_total = 0
+        self.rows_dropped = 0
+        self.columns = None
+        self.error = None
+
+        self._read_options = dict(read_options) if read_options else None
+        self._batches = deque()
+        self._rows = 0
+        self._pending = b''
+        self._pending_since = None  # Momento en que llegaron los primeros bytes sin parsear
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """
+        Inicia el hilo de trabajo que sigue el archivo.
+        """
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def is_running(self):
+        """
+        Indica si el hilo de trabajo sigue activo.
+
+        Returns:
+            bool: True si el archivo se sigue leyendo.
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def stop(self, timeout=None):
+        """
+        Detiene el seguimiento, parsea la última línea aunque no termine en salto de línea y
+        retorna el contenido final del búfer.
+
+        Args:
+            timeout (float, optional): Segundos máximos de espera al hilo de trabajo.
+
+        Returns:
+            pd.DataFrame: Filas del búfer, o None si no se leyó ninguna.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return self.snapshot()
+
+    def snapshot(self):
+        """
+        Arma un DataFrame con las filas del búfer.
+
+        Los lotes se consolidan en uno solo, así la siguiente consolidación solo concatena
+        los lotes llegados desde entonces.
+
+        Returns:
+            pd.DataFrame: Filas del búfer con índice 0..n-1, o None si está vacío.
+        """
+        with self._lock:
+            if not self._batches:
+                return None
+            data = pd.concat(list(self._batches), ignore_index=True)
+            self._batches = deque([data])
+            return data
+
+    def _run(self):
+        """Bucle del hilo de trabajo: lee, parsea y notifica hasta que se pide detenerlo."""
+        last_update = 0.0
+        dirty = False
+        try:
+            with self._open() as source:
+                while not self._stop.is_set():
+                    chunk = source.read()
+                    if chunk:
+                        dirty |= self._consume(chunk)
+                    elif self.columns is None and self._pending:
+                        dirty |= self._consume(b'')  # Sin datos nuevos: quizá venció la espera del formato
+                    if dirty and time.monotonic() - last_update >= self.refresh_interval:
+                        self._notify()
+                        last_update = time.monotonic()
+                        dirty = False
+                    if not chunk:
+                        self._stop.wait(self.poll_interval)
+
+                # Lo que quede en el archivo y la última línea sin salto de línea
+                while True:
+                    chunk = source.read()
+                    if not chunk:
+                        break
+                    dirty |= self._consume(chunk)
+                dirty |= self._consume(b'', final=True)
+            if dirty:
+                self._notify()
+        except Exception as e:
+            self.error = e
+            if self.on_error:
+                self.on_error(e)
+
+    def _open(self):
+        """Abre el origen como archivo regular o como FIFO no bloqueante."""
+        if stat.S_ISFIFO(os.stat(self.file_path).st_mode):
+            return _FifoSource(self.file_path, self.read_size)
+        return _FileSource(self.file_path, self.read_size, self._on_truncate)
+
+    def _on_truncate(self):
+        """Reinicia el estado de parseo si el archivo se truncó y se volvió a escribir."""
+        self._pending = b''
+        self._pending_since = None
+        self.columns = None
+
+    def _consume(self, chunk, final=False):
+        """
+        Añade bytes leídos y parsea las líneas completas.
+
+        Args:
+            chunk (bytes): Bytes nuevos.
+            final (bool, optional): Si es True, también se parsea la línea incompleta final.
+
+        Returns:
+            bool: True si se añadieron filas al búfer.
+        """
+        self._pending += chunk
+        if self._pending_since is None and self._pending:
+            self._pending_since = time.monotonic()
+        end = len(self._pending) if final else self._pending.rfind(b'\n') + 1
+        if end == 0:
+            return False
+
+        if self.columns is None:
+            if not final and self._read_options is None and not self._ready_to_sniff():
+                return False
+            return self._parse_first(end)
+
+        block, self._pending = self._pending[:end], self._pending[end:]
+        options = self._read_options
+        batch = pd.read_csv(io.BytesIO(block), sep=options['sep'], decimal=options['decimal'],
+                            encoding=options['encoding'], header=None, names=self.columns)
+        return self._append(batch)
+
+    def _ready_to_sniff(self):
+        """Indica si ya hay líneas suficientes, o esperó bastante, para detectar el formato."""
+        lines = self._pending.count(b'\n')
+        if lines >= self.sniff_lines:
+            return True
+        return lines >= 2 and time.monotonic() - self._pending_since >= self.sniff_timeout
+
+    def _parse_first(self, end):
+        """Detecta el formato si hace falta y parsea el primer bloque con su encabezado."""
+        block, self._pending = self._pending[:end], self._pending[end:]
+        if self._read_options is None:
+            self._read_options = sniff_text_format(self.file_path, opener=lambda *_: io.BytesIO(block))
+        options = dict(self._read_options)
+        options.setdefault('sep', ',')
+        options.setdefault('decimal', '.')
+        options.setdefault('encoding', 'utf-8')
+        self._read_options = options
+        try:
+            batch = pd.read_csv(io.BytesIO(block), **options)
+        except pd.errors.EmptyDataError:
+            return False
+        self.columns = list(batch.columns)
+        return self._append(batch)
+
+    def _append(self, batch):
+        """Guarda un lote en el búfer y descarta las filas más antiguas que excedan `max_rows`."""
+        if batch.empty:
+            return False
+        with self._lock:
+            self._batches.append(batch)
+            self._rows += len(batch)
+            self.rows_total += len(batch)
+            while self._rows - len(self._batches[0]) >= self.max_rows:
+                self._rows -= len(self._batches.popleft())
+            excess = self._rows - self.max_rows
+            if excess > 0:
+                self._batches[0] = self._batches[0].iloc[excess:]
+                self._rows -= excess
+            self.rows_dropped = self.rows_total - self._rows
+        return True
+
+    def _notify(self):
+        """Entrega el contenido del búfer a `on_update`."""
+        if self.on_update:
+            data = self.snapshot()
+            if data is not None:
+                self.on_update(data)
+
+
+class _FileSource:
+    """Lector incremental de un archivo regular que avisa si el archivo se trunca."""
+
+    def __init__(self, file_path, read_size, on_truncate):
+        self._handle = open(file_path, 'rb')
+        self._read_size = read_size
+        self._on_truncate = on_truncate
+
+    def read(self):
+        data = self._handle.read(self._read_size)
+        if not data and os.fstat(self._handle.fileno()).st_size < self._handle.tell():
+            self._handle.seek(0)
+            self._on_truncate()
+            data = self._handle.read(self._read_size)
+        return data
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._handle.close()
+
+
+class _FifoSource:
+    """Lector no bloqueante de una FIFO; sin escritor conectado simplemente no hay datos."""
+
+    def __init__(self, file_path, read_size):
+        self._fd = os.open(file_path, os.O_RDONLY | os.O_NONBLOCK)
+        self._read_size = read_size
+
+    def read(self):
+        try:
+            return os.read(self._fd, self._read_size)
+        except BlockingIOError:
+            return b''
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        os.close(self._fd)
@@ -0,0 +1,103 @@
+import os
+import shutil
+import tempfile
+import weakref
+import numpy as np
+import pandas as pd
+
+
+class MemmapFrameStore:
+    """
+    Almacén de solo lectura de un DataFrame con las columnas numéricas en archivos mapeados en memoria.
+
+    Cada columna numérica o booleana se escribe en un archivo `.npy` de un directorio temporal
+    y se vuelve a abrir con `np.load(..., mmap_mode='r')`, de modo que sus datos viven en disco y
+    el sistema operativo solo carga en RAM las páginas que se leen. Las columnas no numéricas
+    (texto, fechas, tipos de extensión) se conservan en memoria. El directorio se elimina al
+    cerrar el almacén o cuando este es recolectado.
+
+    Attributes:
+        directory (str): Directorio temporal con los archivos `.npy`.
+        columns (pd.Index): Columnas del DataFrame original, en su orden.
+        index (pd.Index): Índice del DataFrame original.
+    """
+
+    def __init__(self, data, directory=None):
+        """
+        Escribe las columnas del DataFrame en el almacén.
+
+        Args:
+            data (pd.DataFrame): Datos a guardar. No se modifican.
+            directory (str, optional): Directorio padre para los archivos temporales.
+                Por defecto se usa el directorio temporal del sistema.
+        """
+        self.directory = tempfile.mkdtemp(prefix='novalab_original_', dir=directory)
+        self._finalizer = weakref.finalize(self, shutil.rmtree, self.directory, True)
+        self.columns = data.columns.copy()
+        self.index = data.index.copy()
+        self._arrays = []
+
+        for i in range(data.shape[1]):
+            column = data.iloc[:, i]
+            dtype = column.dtype
+            if isinstance(dtype, np.dtype) and dtype.kind in 'biuf' and len(column):
+                path = os.path.join(self.directory, f'{i}.npy')
+                mapped = np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=(len(column),))
+                mapped[:] = column.to_numpy()
+                mapped.flush()
+                del mapped
+                self._arrays.append(np.load(path, mmap_mode='r'))
+            else:
+                self._arrays.append(column.copy())
+
+    def column(self, name):
+        """
+        Retorna una columna como Series sin copiar los datos mapeados.
+
+        Args:
+            name: Nombre de la columna.
+
+        Returns:
+            pd.Series: Columna respaldada por el archivo mapeado (o en memoria si no es numérica).
+        """
+        values = self._arrays[self.columns.get_loc(name)]
+        if isinstance(values, pd.Series):
+            return values
+        return pd.Series(values, index=self.index, name=name, copy=False)
+
+    def to_frame(self):
+        """
+        Reconstruye el DataFrame completo leyendo las columnas desde el disco.
+
+        Returns:
+            pd.DataFrame: Copia en memoria de los datos guardados.
+        """
+        data = pd.DataFrame({i: self.column(name) for i, name in enumerate(self.columns)}, index=self.index)
+        data.columns = self.columns
+        return data
+
+    def memory_bytes(self):
+        """
+        Calcula los bytes que ocupan en RAM las columnas no mapeadas.
+
+        Returns:
+            int: Bytes en memoria.
+        """
+        return sum(values.memory_usage(deep=True, index=False)
+                   for values in self._arrays if isinstance(values, pd.Series))
+
+    def disk_bytes(self):
+        """
+        Calcula los bytes de las columnas guardadas en disco.
+
+        Returns:
+            int: Bytes en los archivos mapeados.
+        """
+        return sum(values.nbytes for values in self._arrays if isinstance(values, np.memmap))
+
+    def close(self):
+        """
+        Libera los mapeos y elimina el directorio temporal.
+        """
+        self._arrays = []
+        self._finalizer()
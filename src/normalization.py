@@ -0,0 +1,256 @@
+import numpy as np
+import pandas as pd
+
+from src.history import AffineDelta
+
+NORMALIZATION_METHODS = ("Min-Max Scaling", "Z-Score Scaling", "Max Abs Scaling")
+
+
+def column_block(data, columns):
+    """
+    Copia columnas numéricas en un bloque 2-D de flotantes ordenado por columnas.
+
+    Con el orden de Fortran cada columna queda contigua en memoria, de modo que las
+    reducciones por columna y la escritura de vuelta al DataFrame recorren memoria seguida.
+
+    Args:
+        data (pd.DataFrame): Datos de origen.
+        columns (list): Columnas numéricas a copiar.
+
+    Returns:
+        np.ndarray: Bloque (filas x columnas) con NaN en los nulos.
+    """
+    block = np.empty((len(data), len(columns)), dtype=np.float64, order='F')
+    for i, col in enumerate(columns):
+        block[:, i] = data[col].to_numpy(dtype=np.float64, na_value=np.nan)
+    return block
+
+
+def block_statistics(block):
+    """
+    Calcula en una sola reducción por estadístico las estadísticas de todas las columnas de un bloque.
+
+    Args:
+        block (np.ndarray): Bloque 2-D de flotantes (filas x columnas); NaN marca los nulos.
+
+    Returns:
+        dict: Arreglos por columna 'count', 'min', 'max', 'sum', 'mean' y 'm2' (suma de
+        cuadrados de las desviaciones respecto a la media). Una columna sin valores tiene
+        min = inf, max = -inf y media NaN.
+    """
+    valid = ~np.isnan(block)
+    count = valid.sum(axis=0)
+    has_nulls = bool((count < len(block)).any())
+    values = np.where(valid, block, 0.0) if has_nulls else block
+    total = values.sum(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = total / count
+    deviation = values - mean
+    if has_nulls:
+        deviation[~valid] = 0.0
+    return {
+        'count': count,
+        # fmin/fmax ignoran los NaN; una columna sin valores se queda con el valor inicial
+        'min': np.fmin.reduce(block, axis=0, initial=np.inf),
+        'max': np.fmax.reduce(block, axis=0, initial=-np.inf),
+        'sum': total,
+        'mean': mean,
+        'm2': np.einsum('ij,ij->j', deviation, deviation),
+    }
+
+
+def scaling_parameters(method, count, minimum, maximum, mean, m2):
+    """
+    Calcula `offset` y `scale` por columna para que `(x - offset) / scale` aplique el método.
+
+    - "Min-Max Scaling": offset = mínimo, scale = máximo - mínimo (rango [0, 1]).
+    - "Z-Score Scaling": offset = media, scale = desviación estándar muestral (ddof=1).
+    - "Max Abs Scaling": offset = 0, scale = máximo valor absoluto (rango [-1, 1]).
+
+    Una columna constante (scale = 0) usa offset = su valor y scale = 1: queda en 0 y la
+    transformación sigue siendo invertible.
+
+    Args:
+        method (str): Uno de `NORMALIZATION_METHODS`.
+        count, minimum, maximum, mean, m2 (np.ndarray): Estadísticas por columna, como las de
+            `block_statistics`.
+
+    Returns:
+        tuple: (offset, scale) como arreglos por columna.
+
+    Raises:
+        ValueError: Si el método no es soportado.
+    """
+    if method == "Min-Max Scaling":
+        offset, scale = minimum, maximum - minimum
+    elif method == "Z-Score Scaling":
+        with np.errstate(invalid='ignore', divide='ignore'):
+            offset, scale = mean, np.sqrt(np.where(count > 1, m2 / (count - 1), np.nan))
+    elif method == "Max Abs Scaling":
+        offset, scale = np.zeros_like(mean), np.maximum(np.abs(minimum), np.abs(maximum))
+    else:
+        raise ValueError(f"Método de normalización no soportado: {method}")
+    constant = scale == 0
+    return np.where(constant, minimum, offset), np.where(constant, 1.0, scale)
+
+
+class Normalizer:
+    """
+    Normaliza varias columnas numéricas con una sola pasada vectorizada sobre el bloque 2-D.
+
+    `fit` calcula las estadísticas de todas las columnas a la vez y guarda los parámetros
+    (`offset`, `scale` y tipo original por columna); con ellos `transform` y
+    `inverse_transform` aplican la transformación, o su inversa, como una única operación de
+    arreglos. Las columnas sin ningún valor no se transforman.
+
+    Attributes:
+        method (str): Método de normalización (ver `NORMALIZATION_METHODS`).
+        columns (list): Columnas ajustadas con al menos un valor.
+        offset (np.ndarray): Valor restado a cada columna.
+        scale (np.ndarray): Divisor de cada columna.
+        dtypes (dict): Tipo original de cada columna, para recuperarlo al invertir.
+        changed_rows (int): Filas con algún valor modificado por el último `transform`.
+        changed_cells (int): Valores modificados por el último `transform`.
+        stats (ColumnStatsCache): Caché de estadísticas de los datos, o None.
+    """
+
+    def __init__(self, method="Min-Max Scaling", stats=None):
+        """
+        Args:
+            method (str, optional): Método de normalización. Por defecto "Min-Max Scaling".
+            stats (ColumnStatsCache, optional): Caché de estadísticas de los datos a ajustar;
+                si se indica, `fit` toma de ella las estadísticas y solo calcula las que faltan.
+
+        Raises:
+            ValueError: Si el método no es soportado.
+        """
+        if method not in NORMALIZATION_METHODS:
+            raise ValueError(f"Método de normalización no soportado: {method}")
+        self.method = method
+        self.stats = stats
+        self.columns = []
+        self.offset = np.empty(0)
+        self.scale = np.empty(0)
+        self.dtypes = {}
+        self.changed_rows = 0
+        self.changed_cells = 0
+
+    @staticmethod
+    def _block(data, columns):
+        """Lee las columnas como un bloque 2-D de flotantes con NaN en los nulos."""
+        non_numeric = [col for col in columns if not pd.api.types.is_numeric_dtype(data[col])]
+        if non_numeric:
+            raise ValueError(f"Solo se pueden normalizar columnas numéricas: {non_numeric}")
+        return column_block(data, columns)
+
+    def fit(self, data, columns):
+        """
+        Calcula los parámetros de normalización de las columnas.
+
+        Args:
+            data (pd.DataFrame): Datos de referencia.
+            columns (list): Columnas numéricas a normalizar.
+
+        Returns:
+            Normalizer: La misma instancia, ajustada.
+
+        Raises:
+            KeyError: Si alguna columna no existe.
+            ValueError: Si alguna columna no es numérica.
+        """
+        self._fit_block(data, list(columns), self._block(data, list(columns)))
+        return self
+
+    def _fit_block(self, data, columns, block):
+        """Ajusta los parámetros a partir del bloque ya leído de `columns`."""
+        if self.stats is not None:
+            stats = self.stats.statistics(data, columns, block)
+        else:
+            stats = block_statistics(block)
+        offset, scale = scaling_parameters(self.method, stats['count'], stats['min'], stats['max'],
+                                           stats['mean'], stats['m2'])
+        keep = stats['count'] > 0
+        self.columns = [col for col, kept in zip(columns, keep) if kept]
+        self.offset = offset[keep]
+        self.scale = scale[keep]
+        self.dtypes = {col: data[col].dtype for col in self.columns}
+        return keep
+
+    def transform(self, data):
+        """
+        Aplica la normalización ajustada.
+
+        Args:
+            data (pd.DataFrame): Datos a transformar. No se modifican.
+
+        Returns:
+            pd.DataFrame: Copia superficial de los datos con las columnas normalizadas.
+        """
+        block = self._block(data, self.columns)
+        return self._apply(data, block)
+
+    def fit_transform(self, data, columns):
+        """
+        Ajusta los parámetros y normaliza las columnas leyendo el bloque una sola vez.
+
+        Args:
+            data (pd.DataFrame): Datos a normalizar. No se modifican.
+            columns (list): Columnas numéricas a normalizar.
+
+        Returns:
+            pd.DataFrame: Copia superficial de los datos con las columnas normalizadas.
+        """
+        columns = list(columns)
+        block = self._block(data, columns)
+        keep = self._fit_block(data, columns, block)
+        return self._apply(data, block[:, keep])
+
+    def _apply(self, data, block):
+        """
+        Escribe `(block - offset) / scale` en las columnas ajustadas y cuenta los cambios.
+
+        Los valores modificados se cuentan comparando el bloque de entrada con el resultado,
+        que ya están en memoria: no hace falta copiar las columnas antes de transformarlas.
+        """
+        result = data.copy(deep=False)
+        if not self.columns:
+            self.changed_rows = self.changed_cells = 0
+            return result
+        normalized = (block - self.offset) / self.scale
+        # NaN != NaN: los nulos, que siguen nulos, no cuentan como cambios
+        changed = (normalized != block) & ~np.isnan(block)
+        self.changed_cells = int(changed.sum())
+        self.changed_rows = int(changed.any(axis=1).sum())
+        result[self.columns] = normalized
+        return result
+
+    def inverse_transform(self, data):
+        """
+        Revierte la normalización y recupera los tipos enteros originales.
+
+        Args:
+            data (pd.DataFrame): Datos normalizados. No se modifican.
+
+        Returns:
+            pd.DataFrame: Copia superficial de los datos en su escala original.
+        """
+        return self.delta().undo(data)
+
+    def params(self):
+        """
+        Parámetros por columna.
+
+        Returns:
+            dict: {columna: (offset, scale, dtype original)}.
+        """
+        return {col: (offset, scale, self.dtypes[col])
+                for col, offset, scale in zip(self.columns, self.offset.tolist(), self.scale.tolist())}
+
+    def delta(self):
+        """
+        Cambio reversible equivalente, para el historial de deshacer y rehacer.
+
+        Returns:
+            AffineDelta: Cambio con los parámetros de esta normalización.
+        """
+        return AffineDelta(self.params())
@@ -0,0 +1,88 @@
+import os
+import json
+import numpy as np
+import pandas as pd
+
+RAW_EXTENSIONS = ('.bin', '.dat', '.raw')
+
+
+def find_layout(file_path):
+    """
+    Busca la descripción del formato de un archivo binario en un archivo JSON vecino.
+
+    Se prueban `<archivo>.json` (por ejemplo `corrida.bin.json`) y `<nombre>.json`
+    (por ejemplo `corrida.json`).
+
+    Args:
+        file_path (str): Ruta del archivo binario.
+
+    Returns:
+        dict: Descripción leída del JSON, o None si no hay ninguno.
+    """
+    for candidate in (file_path + '.json', os.path.splitext(file_path)[0] + '.json'):
+        if os.path.exists(candidate):
+            with open(candidate, 'r', encoding='utf-8') as handle:
+                return json.load(handle)
+    return None
+
+
+def read_raw_binary(file_path, layout=None, usecols=None, nrows=None, time_column='tiempo'):
+    """
+    Mapea en memoria un volcado binario de canales intercalados y lo expone como DataFrame.
+
+    El archivo se abre con `np.memmap` en modo copia al escribir ('c'): las columnas del
+    DataFrame son vistas del archivo mapeado, sin parseo de texto ni copia, y el sistema
+    operativo carga en RAM solo las páginas que se leen. Modificar los datos no altera el
+    archivo; las páginas escritas se copian en memoria.
+
+    La descripción del formato tiene las claves:
+        - 'dtype' (str): Tipo de cada muestra, por ejemplo '<f4' (float32 little-endian).
+        - 'channels' (list): Nombres de los canales, en el orden en que están intercalados.
+        - 'sample_rate' (float, opcional): Frecuencia de muestreo en Hz. Si se indica, se
+          agrega la columna `time_column` con el tiempo de cada muestra en segundos.
+        - 'header_bytes' (int, opcional): Bytes de encabezado a omitir al inicio. Por defecto 0.
+
+    Args:
+        file_path (str): Ruta del archivo binario.
+        layout (dict, optional): Descripción del formato. Si es None, se busca un JSON vecino
+            (ver `find_layout`).
+        usecols (list, optional): Canales a conservar.
+        nrows (int, optional): Máximo de muestras por canal a leer.
+        time_column (str, optional): Nombre de la columna de tiempo. Por defecto 'tiempo'.
+
+    Returns:
+        pd.DataFrame: Una fila por muestra y una columna por canal.
+
+    Raises:
+        ValueError: Si no hay descripción del formato o esta es inválida.
+    """
+    if layout is None:
+        layout = find_layout(file_path)
+    if not layout or not layout.get('channels') or 'dtype' not in layout:
+        raise ValueError("Se necesita la descripción del formato binario ('dtype' y 'channels'), "
+                         "como parámetro o en un archivo JSON junto al archivo")
+
+    dtype = np.dtype(layout['dtype'])
+    channels = list(layout['channels'])
+    header_bytes = int(layout.get('header_bytes', 0))
+    frame_bytes = dtype.itemsize * len(channels)
+    frames = max(os.path.getsize(file_path) - header_bytes, 0) // frame_bytes
+    if nrows is not None:
+        frames = min(frames, nrows)
+
+    if frames:
+        samples = np.memmap(file_path, dtype=dtype, mode='c', offset=header_bytes,
+                            shape=(frames, len(channels)))
+    else:
+        samples = np.empty((0, len(channels)), dtype=dtype)
+    if not dtype.isnative:
+        # pandas no admite otro orden de bytes; convertirlo obliga a copiar
+        samples = samples.astype(dtype.newbyteorder('='))
+
+    selected = channels if usecols is None else [col for col in channels if col in usecols]
+    data = pd.DataFrame({col: samples[:, channels.index(col)] for col in selected}, copy=False)
+
+    sample_rate = layout.get('sample_rate')
+    if sample_rate and (usecols is None or time_column in usecols):
+        data.insert(0, time_column, np.arange(frames) / float(sample_rate))
+    return data
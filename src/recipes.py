@@ -0,0 +1,233 @@
+"""
+Recetas de transformación: guardan la secuencia de operaciones aplicadas a unos datos y la
+repiten, sin interfaz, sobre otros archivos de corridas.
+
+Uso desde la terminal:
+    python -m src.recipes receta.json datos/corrida_*.csv --salida limpias --formato parquet
+"""
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+from src.compressed_io import split_compression
+from src.data_operations import DataOperations
+
+RECIPE_VERSION = 1
+
+# Operación del historial -> método de DataOperations que la repite con sus `params`
+REPLAYABLE_OPERATIONS = {
+    'remove_null_values': 'remove_null_values',
+    'remove_duplicates': 'remove_duplicates',
+    'normalize_data': 'normalize_data',
+    'fill_null_values': 'fill_null_values',
+    'fill_null_with_knn': 'fill_null_values',
+    'optimize_dtypes': 'optimize_dtypes',
+}
+
+OUTPUT_FORMATS = ('.csv', '.txt', '.xlsx', '.parquet', '.feather')
+
+
+def recipe_from_history(transformation_history):
+    """
+    Construye una receta con las operaciones de un historial de transformaciones.
+
+    Args:
+        transformation_history (list): Historial de `DataOperations.transformation_history`.
+
+    Returns:
+        dict: Receta con las claves 'version', 'created' y 'steps' (lista de
+        {'operation', 'params', 'details'}).
+
+    Raises:
+        ValueError: Si alguna operación del historial no se puede repetir.
+    """
+    steps = []
+    for entry in transformation_history:
+        if entry['operation'] not in REPLAYABLE_OPERATIONS or entry.get('params') is None:
+            raise ValueError(f"La operación '{entry['operation']}' no se puede guardar en una receta")
+        steps.append({'operation': entry['operation'], 'params': entry['params'],
+                      'details': entry['details']})
+    return {'version': RECIPE_VERSION, 'created': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'steps': steps}
+
+
+def save_recipe(recipe, file_path):
+    """
+    Guarda una receta en un archivo JSON.
+
+    Args:
+        recipe (dict): Receta de `recipe_from_history`.
+        file_path (str): Ruta del archivo .json.
+    """
+    with open(file_path, 'w', encoding='utf-8') as handle:
+        json.dump(recipe, handle, ensure_ascii=False, indent=2, default=str)
+
+
+def load_recipe(file_path):
+    """
+    Lee una receta de un archivo JSON.
+
+    Args:
+        file_path (str): Ruta del archivo .json.
+
+    Returns:
+        dict: Receta leída.
+
+    Raises:
+        ValueError: Si el archivo no es una receta válida o tiene operaciones desconocidas.
+    """
+    with open(file_path, 'r', encoding='utf-8') as handle:
+        recipe = json.load(handle)
+    if not isinstance(recipe, dict) or not isinstance(recipe.get('steps'), list):
+        raise ValueError(f"{file_path} no es una receta válida")
+    if recipe.get('version', RECIPE_VERSION) > RECIPE_VERSION:
+        raise ValueError(f"La receta usa la versión {recipe['version']}, no soportada")
+    unknown = [step.get('operation') for step in recipe['steps']
+               if step.get('operation') not in REPLAYABLE_OPERATIONS]
+    if unknown:
+        raise ValueError(f"Operaciones desconocidas en la receta: {unknown}")
+    return recipe
+
+
+def apply_recipe(data_ops, recipe):
+    """
+    Aplica los pasos de una receta, en orden, a los datos cargados en `data_ops`.
+
+    Se llama a los métodos de `DataOperations` y no a los de `data_ops`, porque una subclase
+    con interfaz los redefine para pedir los parámetros al usuario.
+
+    Args:
+        data_ops (DataOperations): Operaciones con los datos ya cargados.
+        recipe (dict): Receta a aplicar.
+    """
+    for step in recipe['steps']:
+        method = getattr(DataOperations, REPLAYABLE_OPERATIONS[step['operation']])
+        method(data_ops, **(step.get('params') or {}))
+
+
+def output_path_for(file_path, output_dir, output_format='.csv'):
+    """
+    Ruta del archivo procesado: el nombre del original, sin compresión, con la extensión de salida.
+
+    Args:
+        file_path (str): Archivo de entrada.
+        output_dir (str): Directorio de salida.
+        output_format (str, optional): Extensión de salida. Por defecto '.csv'.
+
+    Returns:
+        str: Ruta del archivo de salida.
+    """
+    base_path = split_compression(file_path)[0]
+    name = os.path.splitext(os.path.basename(base_path))[0]
+    return os.path.join(output_dir, name + output_format)
+
+
+def process_file(file_path, recipe, output_path, read_options=None):
+    """
+    Lee un archivo, le aplica una receta sin interfaz y exporta el resultado.
+
+    Se define a nivel de módulo para que `ProcessPoolExecutor` pueda serializarla. Las
+    operaciones se ejecutan en modo diferido, de modo que los pasos compatibles se fusionan.
+
+    Args:
+        file_path (str): Archivo de entrada.
+        recipe (dict): Receta a aplicar.
+        output_path (str): Archivo de salida; su extensión define el formato.
+        read_options (dict, optional): Opciones de `DataOperations.read_file`.
+
+    Returns:
+        dict: 'file', 'output', 'rows_in' y 'rows_out'.
+
+    Raises:
+        RuntimeError: Si no se pudo exportar el resultado.
+    """
+    data_ops = DataOperations(lazy=True, interactive=False)
+    data = data_ops.read_file(file_path, **(read_options or {}))
+    rows_in = len(data)
+    data_ops._set_loaded_data(data, keep_original=False)
+    apply_recipe(data_ops, recipe)
+    if not data_ops.export_results(output_path):
+        errors = [message for kind, _, message in data_ops.notifications if kind == 'error']
+        raise RuntimeError(errors[-1] if errors else f"No se pudo exportar {output_path}")
+    return {'file': file_path, 'output': output_path, 'rows_in': rows_in, 'rows_out': len(data_ops.data)}
+
+
+def run_recipe(recipe, files, output_dir, output_format='.csv', max_workers=None,
+               read_options=None, progress_callback=None):
+    """
+    Aplica una receta a varios archivos en paralelo, un proceso por archivo.
+
+    Un archivo que falla no detiene el resto: su error se informa en el resultado.
+
+    Args:
+        recipe (dict): Receta a aplicar.
+        files (list): Archivos de entrada.
+        output_dir (str): Directorio donde se escriben los archivos procesados.
+        output_format (str, optional): Extensión de salida ('.csv', '.txt', '.xlsx',
+            '.parquet' o '.feather'). Por defecto '.csv'.
+        max_workers (int, optional): Número de procesos. Por defecto, el número de núcleos.
+        read_options (dict, optional): Opciones de `DataOperations.read_file` para cada archivo.
+        progress_callback (callable, optional): Función que recibe (archivos_procesados,
+            fraccion_procesada).
+
+    Returns:
+        tuple: (lista de resultados de `process_file` de los archivos procesados, dict
+        {archivo: mensaje de error} de los que fallaron).
+
+    Raises:
+        ValueError: Si el formato de salida no es soportado.
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Formato de salida no soportado: {output_format}")
+    os.makedirs(output_dir, exist_ok=True)
+    results, errors = [], {}
+
+    # 'spawn' evita bifurcar un proceso con hilos activos (por ejemplo, el de la interfaz)
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+        futures = {executor.submit(process_file, path, recipe,
+                                   output_path_for(path, output_dir, output_format), read_options): path
+                   for path in files}
+        for done, future in enumerate(as_completed(futures), 1):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                errors[futures[future]] = str(e)
+            if progress_callback:
+                progress_callback(done, done / len(files))
+    return results, errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Aplica una receta de transformaciones a archivos de corridas.")
+    parser.add_argument('receta', help='archivo JSON de la receta')
+    parser.add_argument('archivos', nargs='+', help='archivos o patrones glob de entrada')
+    parser.add_argument('--salida', required=True, help='directorio de salida')
+    parser.add_argument('--formato', default='csv', choices=[fmt[1:] for fmt in OUTPUT_FORMATS],
+                        help='formato de los archivos procesados')
+    parser.add_argument('--procesos', type=int, default=None, help='procesos de trabajo (por defecto, los núcleos)')
+    args = parser.parse_args(argv)
+
+    recipe = load_recipe(args.receta)
+    files = sorted({path for pattern in args.archivos for path in (glob.glob(pattern) or [pattern])})
+    start = time.perf_counter()
+    results, errors = run_recipe(
+        recipe, files, args.salida, '.' + args.formato, args.procesos,
+        progress_callback=lambda done, _: print(f"\r{done}/{len(files)} archivos", end='', flush=True))
+    print()
+
+    rows = sum(result['rows_out'] for result in results)
+    print(f"Procesados {len(results)} archivos ({rows:,} filas) en {time.perf_counter() - start:.2f} s")
+    for path, message in sorted(errors.items()):
+        print(f"Error en {path}: {message}", file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
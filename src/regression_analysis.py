@@ -43,6 +43,17 @@ class RegressionAnalysis:
         else:
             self.data_ops = None  # No hace nada si no es un DataFrame ni un objeto con el atributo 'data'
 
+    def _ensure_columns(self, *columns):
+        """Carga desde el archivo de origen las columnas que aún no estén en memoria.
+
+        Solo aplica si el objeto de datos admite carga diferida de columnas (`ensure_columns`).
+
+        Args:
+            *columns: Nombres de las columnas que se van a usar.
+        """
+        if hasattr(self.data_ops, 'ensure_columns'):
+            self.data_ops.ensure_columns([col for col in columns if col is not None])
+
     def calculate_metrics(self, y_true, y_pred):
         """Calcula métricas de regresión entre valores reales y predichos.
         
@@ -94,6 +105,7 @@ class RegressionAnalysis:
         Advertencias:
             Muestra diálogo de advertencia si no se seleccionan variables o no hay datos cargados.
         """
+        self._ensure_columns(var_x, var_y)
         if self.data_ops.data is not None and var_x in self.data_ops.data.columns and var_y in self.data_ops.data.columns:
             x = self.data_ops.data[var_x].values.reshape(-1, 1)
             y = self.data_ops.data[var_y].values
@@ -167,6 +179,7 @@ class RegressionAnalysis:
                                         minvalue=1, maxvalue=10)
 
             if degree is not None:
+                self._ensure_columns(var_x, var_y)
                 x = self.data_ops.data[var_x]
                 y = self.data_ops.data[var_y]
                 coef = np.polyfit(x, y, degree)
@@ -249,6 +262,7 @@ class RegressionAnalysis:
                                             minvalue=1, maxvalue=10)
 
             if degree is not None:
+                self._ensure_columns(var_x, var_y)
                 x = self.data_ops.data[var_x].values
                 y = self.data_ops.data[var_y].values
 
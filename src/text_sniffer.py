@@ -0,0 +1,150 @@
+import re
+from collections import Counter
+
+# Orden de preferencia: si varios candidatos aparecen de forma consistente, el primero gana.
+# Así, en "1,5;2,3" el ';' se toma como separador y la ',' como marca decimal.
+DELIMITER_CANDIDATES = ['\t', ';', '|', ',']
+WHITESPACE_DELIMITER = r'\s+'
+
+_QUOTED = re.compile(r'"[^"]*"')
+_COMMA_DECIMAL = re.compile(r'^[-+]?\d+,\d+([eE][-+]?\d+)?$')
+_NUMBER = re.compile(r'^[-+]?(\d+([.,]\d*)?|[.,]\d+)([eE][-+]?\d+)?$')
+
+
+def _detect_encoding(raw):
+    """
+    Detecta la codificación de una muestra de bytes.
+
+    Args:
+        raw (bytes): Primeros bytes del archivo.
+
+    Returns:
+        str: 'utf-8-sig', 'utf-16', 'utf-8' o 'cp1252' (codificación habitual de equipos con
+        configuración regional en español bajo Windows); 'latin-1' si ninguna otra aplica.
+    """
+    if raw.startswith(b'\xef\xbb\xbf'):
+        return 'utf-8-sig'
+    if raw.startswith((b'\xff\xfe', b'\xfe\xff')):
+        return 'utf-16'
+    try:
+        raw.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError as e:
+        # Un carácter multibyte cortado al final de la muestra no invalida UTF-8
+        if e.start >= len(raw) - 3 and e.reason == 'unexpected end of data':
+            return 'utf-8'
+    try:
+        raw.decode('cp1252')
+        return 'cp1252'
+    except UnicodeDecodeError:
+        return 'latin-1'
+
+
+def _field_count(line, delimiter):
+    """Cuenta las apariciones del delimitador fuera de campos entre comillas."""
+    return _QUOTED.sub('', line).count(delimiter)
+
+
+def _detect_delimiter(lines):
+    """
+    Elige el delimitador que aparece un número constante de veces en más líneas.
+
+    Args:
+        lines (list): Líneas de la muestra.
+
+    Returns:
+        tuple: (delimitador, número de apariciones por línea). Si ningún candidato aparece,
+        se retorna el separador de espacios en blanco.
+    """
+    best = None
+    for priority, delimiter in enumerate(DELIMITER_CANDIDATES):
+        counts = [_field_count(line, delimiter) for line in lines]
+        nonzero = [c for c in counts if c]
+        if not nonzero:
+            continue
+        mode, _ = Counter(nonzero).most_common(1)[0]
+        consistency = sum(c == mode for c in counts) / len(counts)
+        # Se exige alta consistencia; entre candidatos consistentes decide la prioridad
+        score = (round(consistency, 1), -priority)
+        if best is None or score > best[0]:
+            best = (score, delimiter, mode)
+
+    if best is None or best[0][0] < 0.5:
+        return WHITESPACE_DELIMITER, None
+    return best[1], best[2]
+
+
+def _split(line, delimiter):
+    """Divide una línea con el delimitador detectado, quitando comillas y espacios."""
+    if delimiter == WHITESPACE_DELIMITER:
+        fields = line.split()
+    else:
+        fields = line.split(delimiter)
+    return [field.strip().strip('"') for field in fields]
+
+
+def sniff_text_format(file_path, sample_bytes=65536, opener=open):
+    """
+    Detecta el formato de un archivo de texto delimitado a partir de una muestra pequeña.
+
+    Se leen como máximo `sample_bytes` bytes del inicio del archivo y se detectan la
+    codificación, el delimitador, la marca decimal, las líneas de preámbulo que escriben
+    algunos instrumentos antes de la tabla y si la primera fila de la tabla es un
+    encabezado. El resultado se pasa directamente a `pd.read_csv`, de modo que el archivo
+    completo se parsea una sola vez con el parser nativo.
+
+    Args:
+        file_path (str): Ruta del archivo.
+        sample_bytes (int, optional): Tamaño de la muestra en bytes. Por defecto 64 KiB.
+        opener (callable, optional): Función que abre el archivo en modo binario. Por defecto `open`.
+
+    Returns:
+        dict: Opciones para `pd.read_csv` con las claves 'sep', 'decimal', 'encoding',
+        'header' y 'skiprows'.
+    """
+    with opener(file_path, 'rb') as handle:
+        raw = handle.read(sample_bytes)
+        truncated = len(handle.read(1)) == 1
+
+    encoding = _detect_encoding(raw)
+    text = raw.decode(encoding, errors='ignore')
+    lines = text.splitlines()
+    if truncated and len(lines) > 1:
+        lines = lines[:-1]  # La última línea de la muestra puede estar incompleta
+    nonblank = [line for line in lines if line.strip()]
+
+    options = {'sep': ',', 'decimal': '.', 'encoding': encoding, 'header': 0, 'skiprows': 0}
+    if not nonblank:
+        return options
+
+    delimiter, mode = _detect_delimiter(nonblank)
+    options['sep'] = delimiter
+
+    # Preámbulo: líneas iniciales (contando las vacías, como lo hace el parser) que no
+    # tienen la cantidad de campos de la tabla
+    skiprows = 0
+    if mode is not None:
+        while skiprows < len(lines) - 1 and _field_count(lines[skiprows], delimiter) != mode:
+            skiprows += 1
+    else:
+        while not lines[skiprows].strip():
+            skiprows += 1
+    options['skiprows'] = skiprows
+    table = [line for line in lines[skiprows:] if line.strip()]
+
+    rows = [_split(line, delimiter) for line in table[:200]]
+    body = [field for row in rows[1:] for field in row if field]
+    if delimiter != ',' and body:
+        comma_decimals = sum(bool(_COMMA_DECIMAL.match(field)) for field in body)
+        dot_decimals = sum('.' in field and bool(_NUMBER.match(field)) for field in body)
+        if comma_decimals > dot_decimals:
+            options['decimal'] = ','
+
+    # La primera fila es encabezado si tiene menos campos numéricos que las siguientes
+    first_numeric = sum(bool(_NUMBER.match(field)) for field in rows[0] if field)
+    if len(rows) > 1 and body:
+        body_fraction = sum(bool(_NUMBER.match(field)) for field in body) / len(body)
+        if first_numeric and first_numeric / max(len(rows[0]), 1) >= body_fraction:
+            options['header'] = None
+
+    return options
@@ -0,0 +1,52 @@
+import gzip
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_operations import DataOperations
+
+
+@pytest.fixture
+def data_ops():
+    return DataOperations(interactive=False)
+
+
+@pytest.mark.parametrize('compressed', [False, True])
+def test_chunked_read_matches_plain_read(data_ops, tmp_path, compressed):
+    n = 50_000
+    frame = pd.DataFrame({'tiempo': np.arange(n), 'altura': np.random.default_rng(0).random(n),
+                          'canal': np.where(np.arange(n) % 7 == 0, 'a', 'b')})
+    path = tmp_path / 'corrida.csv'
+    frame.to_csv(path, index=False)
+    if compressed:
+        with open(path, 'rb') as source, gzip.open(tmp_path / 'corrida.csv.gz', 'wb') as target:
+            target.write(source.read())
+        path = tmp_path / 'corrida.csv.gz'
+
+    data = data_ops._read_csv_chunked(str(path), {}, chunksize=3000)
+    pd.testing.assert_frame_equal(data, pd.read_csv(path))
+
+
+def test_rows_beyond_the_first_chunk_estimate_are_kept(data_ops, tmp_path):
+    # Filas largas al principio: la estimación inicial se queda corta y los arreglos crecen
+    path = tmp_path / 'corrida.csv'
+    path.write_text('a,b\n' + ''.join(f'{i},{"x" * 200}\n' for i in range(100))
+                    + ''.join(f'{i},y\n' for i in range(20_000)))
+    data = data_ops._read_csv_chunked(str(path), {}, chunksize=100)
+    pd.testing.assert_frame_equal(data, pd.read_csv(path))
+
+
+def test_column_with_text_in_a_later_chunk_is_read_as_text(data_ops, tmp_path):
+    path = tmp_path / 'corrida.csv'
+    path.write_text('x,y\n' + ''.join(f'{i},{i / 2}\n' for i in range(10))
+                    + ''.join(f'abc,{i}\n' for i in range(10)) + '5,\n')
+    data = data_ops._read_csv_chunked(str(path), {}, chunksize=4)
+    pd.testing.assert_frame_equal(data, pd.read_csv(path))
+    assert data['x'].iloc[0] == '0'
+
+
+def test_nrows_limits_the_read(data_ops, tmp_path):
+    path = tmp_path / 'corrida.csv'
+    pd.DataFrame({'a': np.arange(10_000)}).to_csv(path, index=False)
+    assert len(data_ops._read_csv_chunked(str(path), {'nrows': 1234}, chunksize=500)) == 1234
@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.column_stats import ColumnStatsCache
+from src.data_operations import DataOperations
+from src.history import AffineDelta, CellFillDelta, RowDropDelta
+
+FIELDS = ['count', 'nulls', 'min', 'max', 'sum', 'm2', 'absmax', 'mean']
+
+
+def assert_matches_fresh(cache, data, columns):
+    # Un escalado propagado arrastra el redondeo de float64 en la escala de los datos originales
+    cached = cache.frame(data, columns)
+    fresh = ColumnStatsCache().frame(data, columns)
+    for field in FIELDS:
+        np.testing.assert_allclose(cached[field], fresh[field], rtol=1e-9, atol=1e-7, err_msg=field)
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    n = 400
+    frame = pd.DataFrame({
+        # Media grande y varianza pequeña, como una marca de tiempo
+        'tiempo': 1.7e5 + np.arange(n) * 1e-3,
+        'altura': rng.normal(50.0, 5.0, n),
+        'canal': rng.integers(0, 4, n),
+    })
+    frame.loc[rng.random(n) < 0.1, 'altura'] = np.nan
+    frame.loc[rng.random(n) < 0.05, 'tiempo'] = np.nan
+    frame = pd.concat([frame, frame.iloc[:20]], ignore_index=True)  # Filas duplicadas
+    return frame
+
+
+def test_cell_fill_is_merged_without_rereading(data):
+    cache = ColumnStatsCache()
+    cache.statistics(data, ['altura'])
+    null_mask = {'altura': data['altura'].isna().to_numpy()}
+    filled = data.copy()
+    filled['altura'] = filled['altura'].fillna(1000.0)  # Nuevo máximo
+
+    delta = CellFillDelta(filled, null_mask)
+    cache.apply(delta)
+    assert_matches_fresh(cache, filled, ['altura'])
+    cache.revert(delta)
+    assert_matches_fresh(cache, data, ['altura'])
+
+
+def test_removing_an_extreme_evicts_the_column(data):
+    cache = ColumnStatsCache()
+    cache.statistics(data, ['altura', 'canal'])
+    removed = (data['altura'] == data['altura'].max()).to_numpy()
+    delta = RowDropDelta(data, removed)
+    after = data[~removed].reset_index(drop=True)
+
+    cache.apply(delta)
+    assert 'altura' not in cache
+    assert_matches_fresh(cache, after, ['altura', 'canal'])
+
+
+def test_affine_scaling_is_propagated(data):
+    cache = ColumnStatsCache()
+    cache.statistics(data, ['tiempo', 'altura'])
+    delta = AffineDelta({'tiempo': (1.7e5, 0.4, data['tiempo'].dtype),
+                         'altura': (50.0, 5.0, data['altura'].dtype)})
+    after = delta.redo(data)
+
+    cache.apply(delta)
+    assert_matches_fresh(cache, after, ['tiempo', 'altura'])
+    cache.revert(delta)
+    assert_matches_fresh(cache, data, ['tiempo', 'altura'])
+
+
+@pytest.mark.parametrize('lazy', [False, True])
+def test_cache_follows_operations_undo_and_redo(data, lazy):
+    data_ops = DataOperations(lazy=lazy, interactive=False)
+    data_ops._set_loaded_data(data.copy())
+    columns = ['tiempo', 'altura', 'canal']
+    data_ops.column_statistics(columns)  # Llena la caché antes de operar
+
+    operations = [
+        lambda: data_ops.remove_duplicates(),
+        lambda: data_ops.normalize_data(['altura', 'canal'], 'Z-Score Scaling'),
+        lambda: data_ops.fill_null_values('mean', columns=['altura']),
+        lambda: data_ops.normalize_data(['tiempo'], 'Min-Max Scaling'),
+        lambda: data_ops.remove_null_values(),
+    ]
+    for operation in operations:
+        operation()
+        assert_matches_fresh(data_ops.column_stats, data_ops.data, columns)
+
+    while data_ops.can_undo():
+        data_ops.undo()
+        assert_matches_fresh(data_ops.column_stats, data_ops.data, columns)
+    pd.testing.assert_frame_equal(data_ops.data, data)
+
+    while data_ops.can_redo():
+        data_ops.redo()
+        assert_matches_fresh(data_ops.column_stats, data_ops.data, columns)
+
+
+def test_loading_new_data_invalidates_the_cache(data):
+    data_ops = DataOperations(interactive=False)
+    data_ops._set_loaded_data(data.copy())
+    data_ops.column_statistics(['altura'])
+
+    other = data.copy()
+    other['altura'] = other['altura'] * 2
+    data_ops._set_loaded_data(other)
+    assert_matches_fresh(data_ops.column_stats, data_ops.data, ['altura'])
@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+
+from src.file_cache import ParsedFileCache
+
+
+def test_entry_larger_than_cache_is_not_stored(tmp_path):
+    cache = ParsedFileCache(str(tmp_path / 'cache'), max_bytes=200_000)
+    small = {}
+    for i in range(3):
+        path = tmp_path / f'small{i}.csv'
+        pd.DataFrame({'a': np.arange(1000)}).to_csv(path, index=False)
+        small[i] = str(path)
+        cache.get_or_load(small[i], {}, lambda path=path: pd.read_csv(path))
+    big = tmp_path / 'big.csv'
+    pd.DataFrame({'a': np.random.default_rng(0).random(200_000)}).to_csv(big, index=False)
+
+    data = cache.get_or_load(str(big), {}, lambda: pd.read_csv(big))
+    assert len(data) == 200_000 and not cache.last_hit
+    assert cache.size_bytes() <= cache.max_bytes
+
+    cache.get_or_load(small[0], {}, lambda: pd.read_csv(small[0]))
+    assert cache.last_hit
+
+
+def test_eviction_keeps_the_new_entry(tmp_path):
+    cache = ParsedFileCache(str(tmp_path / 'cache'), max_bytes=30_000)
+    paths = []
+    for i in range(3):
+        path = tmp_path / f'run{i}.csv'
+        pd.DataFrame({'a': np.arange(2000, dtype=np.int64)}).to_csv(path, index=False)
+        paths.append(str(path))
+        cache.get_or_load(paths[-1], {}, lambda path=path: pd.read_csv(path))
+
+    cache.get_or_load(paths[-1], {}, lambda: pd.read_csv(paths[-1]))
+    assert cache.last_hit
+    assert cache.size_bytes() <= cache.max_bytes
@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.history import AffineDelta, CellFillDelta, RowDropDelta
+
+
+@pytest.fixture
+def data():
+    return pd.DataFrame({
+        'tiempo': np.arange(8, dtype=np.int64) * 10,
+        'altura': [1.0, np.nan, 3.0, 4.5, np.nan, 6.0, 7.0, np.nan],
+        'canal': list('abcdefgh'),
+    }, index=[3, 1, 4, 1, 5, 9, 2, 6])  # Índice desordenado y con repetidos
+
+
+def test_row_drop_round_trip(data):
+    removed = data['altura'].isna().to_numpy()
+    delta = RowDropDelta(data, removed)
+    after = data[~removed]
+
+    assert delta.rows_affected() == 3
+    pd.testing.assert_frame_equal(delta.undo(after), data)
+    pd.testing.assert_frame_equal(delta.redo(data), after)
+
+
+def test_row_drop_undo_restores_columns_fetched_later(data):
+    removed = np.zeros(len(data), dtype=bool)
+    removed[[0, 5]] = True
+    delta = RowDropDelta(data[['tiempo', 'altura']], removed)
+    after = data[~removed]
+
+    # 'canal' se trajo del archivo de origen después de eliminar las filas
+    delta.add_columns(data[['canal']].iloc[[0, 5]])
+    pd.testing.assert_frame_equal(delta.undo(after), data)
+
+
+def test_affine_round_trip_restores_integer_dtype(data):
+    delta = AffineDelta({'tiempo': (35.0, 22.9, data['tiempo'].dtype),
+                         'altura': (4.0, 2.5, data['altura'].dtype)})
+    after = delta.redo(data)
+
+    assert after['tiempo'].dtype == np.float64
+    np.testing.assert_allclose(after['altura'], (data['altura'] - 4.0) / 2.5)
+    pd.testing.assert_frame_equal(delta.undo(after), data)
+
+
+def test_cell_fill_round_trip(data):
+    null_mask = {'altura': data['altura'].isna().to_numpy()}
+    after = data.copy()
+    after['altura'] = after['altura'].fillna(after['altura'].mean())
+    delta = CellFillDelta(after, null_mask)
+
+    assert delta.count() == 3 and delta.rows_affected() == 3
+    pd.testing.assert_frame_equal(delta.undo(after), data)
+    pd.testing.assert_frame_equal(delta.redo(data), after)
+
+
+def test_cell_fill_from_cells_counts_rows_once():
+    delta = CellFillDelta.from_cells({'a': (np.array([0, 2]), np.array([1.0, 2.0])),
+                                      'b': (np.array([2, 3]), np.array([3.0, 4.0]))})
+    assert delta.count() == 4
+    assert delta.rows_affected() == 3
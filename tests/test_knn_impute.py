@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+from sklearn.impute import KNNImputer
+
+from src.knn_impute import knn_impute
+
+
+def imputed(block, n_neighbors):
+    minimum, maximum = np.nanmin(block, axis=0), np.nanmax(block, axis=0)
+    result = block.copy()
+    for col, (positions, values) in knn_impute(block, minimum, maximum, n_neighbors).items():
+        result[positions, col] = values
+    return result
+
+
+def reference(block, n_neighbors):
+    # knn_impute mide las distancias con las columnas escaladas a [0, 1]
+    minimum, maximum = np.nanmin(block, axis=0), np.nanmax(block, axis=0)
+    span = np.where(maximum > minimum, maximum - minimum, 1.0)
+    scaled = KNNImputer(n_neighbors=n_neighbors).fit_transform((block - minimum) / span)
+    return scaled * span + minimum
+
+
+def sensor_block(rows, columns, missing_rate, seed):
+    rng = np.random.default_rng(seed)
+    block = np.cumsum(rng.normal(size=(rows, 1)) + 0.1 * rng.normal(size=(rows, columns)), axis=0)
+    block[rng.random(block.shape) < missing_rate] = np.nan
+    return block
+
+
+@pytest.mark.parametrize('rows, columns, missing_rate, n_neighbors', [
+    (2000, 6, 0.3, 5),   # Pocas filas completas: la mayoría de los donantes tienen nulos
+    (3000, 4, 0.1, 3),   # Patrones con suficientes consultas para usar índices de vecinos
+    (200, 5, 0.5, 7),
+])
+def test_matches_knn_imputer_with_scattered_nans(rows, columns, missing_rate, n_neighbors):
+    block = sensor_block(rows, columns, missing_rate, seed=rows)
+    np.testing.assert_allclose(imputed(block, n_neighbors), reference(block, n_neighbors), rtol=0, atol=1e-9)
+
+
+def test_single_complete_row_is_not_the_only_donor():
+    block = sensor_block(60, 3, 0.6, seed=1)
+    block[0] = [1.0, 2.0, 3.0]
+    block[1:][~np.isnan(block[1:]).any(axis=1)] = np.nan  # Solo la fila 0 queda completa
+    np.testing.assert_allclose(imputed(block, 5), reference(block, 5), rtol=0, atol=1e-9)
+
+
+@pytest.mark.filterwarnings('ignore:All-NaN slice')
+def test_empty_column_is_left_missing():
+    block = sensor_block(100, 3, 0.2, seed=2)
+    block[:, 2] = np.nan
+    result = imputed(block, 5)
+    assert np.isnan(result[:, 2]).all()
+    assert not np.isnan(result[:, :2]).any()
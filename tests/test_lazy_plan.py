@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_operations import DataOperations
+
+
+@pytest.fixture
+def data():
+    return pd.DataFrame({
+        'tiempo': [0.0, 1.0, 2.0, 3.0, 4.0, 5.0],
+        'altura': [1.0, np.nan, 3.0, 3.0, 8.0, np.nan],
+        'presion': [10.0, 11.0, 12.0, 12.0, 14.0, 15.0],
+    })
+
+
+def apply_operations(data_ops):
+    data_ops.normalize_data(['altura', 'presion'], 'Min-Max Scaling')
+    data_ops.fill_null_values('mean', columns=['presion'])  # Sin nulos: no cambia nada
+    data_ops.fill_null_values('mean', columns=['altura'])
+    data_ops.normalize_data(['altura'], 'Z-Score Scaling')
+    return data_ops.data
+
+
+def history(data_ops):
+    return [(entry['operation'], entry['rows_affected']) for entry in data_ops.transformation_history]
+
+
+def test_lazy_plan_matches_eager_operations(data):
+    eager = DataOperations(interactive=False)
+    eager._set_loaded_data(data.copy())
+    lazy = DataOperations(lazy=True, interactive=False)
+    lazy._set_loaded_data(data.copy())
+
+    pd.testing.assert_frame_equal(apply_operations(lazy), apply_operations(eager))
+    assert history(lazy) == history(eager)
+
+
+def test_fill_without_nulls_is_not_recorded(data):
+    data_ops = DataOperations(lazy=True, interactive=False)
+    data_ops._set_loaded_data(data.copy())
+    data_ops.fill_null_values('mean', columns=['presion'])
+    data_ops.execute_plan()
+    assert data_ops.transformation_history == []
+    assert not data_ops.can_undo()
+
+
+def test_undo_reverts_the_fused_plan(data):
+    data_ops = DataOperations(lazy=True, interactive=False)
+    data_ops._set_loaded_data(data.copy())
+    apply_operations(data_ops)
+    while data_ops.can_undo():
+        data_ops.undo()
+    pd.testing.assert_frame_equal(data_ops.data, data)
@@ -0,0 +1,47 @@
+import time
+
+from src.live_ingest import LiveIngest
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_slow_stream_is_shown_after_the_sniff_timeout(tmp_path):
+    path = tmp_path / 'sensor.csv'
+    path.write_text('t;v\n0;1,5\n')
+    updates = []
+    ingest = LiveIngest(str(path), on_update=updates.append, refresh_interval=0.05,
+                        poll_interval=0.02, sniff_timeout=0.2)
+    ingest.start()
+    try:
+        assert wait_for(lambda: updates)
+        assert list(updates[-1].columns) == ['t', 'v']
+        assert updates[-1]['v'].tolist() == [1.5]
+
+        with open(path, 'a') as handle:
+            handle.write('1;2,5\n')
+        assert wait_for(lambda: len(updates[-1]) == 2)
+    finally:
+        data = ingest.stop(timeout=5)
+    assert data['v'].tolist() == [1.5, 2.5]
+
+
+def test_loading_a_file_is_refused_during_live_ingest(tmp_path):
+    from src.data_operations import DataOperations
+
+    path = tmp_path / 'sensor.csv'
+    path.write_text('a,b\n1,2\n')
+    data_ops = DataOperations(interactive=False)
+    data_ops.start_live_ingest(str(path))
+    try:
+        assert not data_ops.load_file(str(path))
+        assert data_ops.notifications[-1][0] == 'warning'
+    finally:
+        data_ops.stop_live_ingest()
+    assert data_ops.load_file(str(path))
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_operations import DataOperations
+from src.recipes import apply_recipe, recipe_from_history
+
+
+@pytest.fixture
+def data():
+    return pd.DataFrame({
+        'tiempo': [0.0, 1.0, 1.0, 2.0, 3.0],
+        'altura': [1.0, 2.0, 2.0000001, 4.0, 8.0],
+        'canal': [1, 2, 2, 3, 4],
+    })
+
+
+def recorded_recipe(data):
+    data_ops = DataOperations(interactive=False)
+    data_ops._set_loaded_data(data.copy())
+    data_ops.remove_duplicates(subset=['tiempo', 'altura'], tolerance=1e-3)
+    data_ops.normalize_data(['altura'], 'Min-Max Scaling')
+    data_ops.optimize_dtypes(float32_columns=['tiempo'])
+    return recipe_from_history(data_ops.transformation_history), data_ops.data
+
+
+def test_replay_through_ui_subclass(data, monkeypatch, tmp_path):
+    monkeypatch.setenv('HOME', str(tmp_path))  # La caché de archivos parseados va en ~/.cache
+    app = pytest.importorskip('app')
+    recipe, expected = recorded_recipe(data)
+
+    data_ops = app.DataOperationsWithUI(ui_container=None)
+    data_ops.interactive = False
+    data_ops._set_loaded_data(data.copy())
+    apply_recipe(data_ops, recipe)
+
+    pd.testing.assert_frame_equal(data_ops.data, expected)
+    assert [entry['operation'] for entry in data_ops.transformation_history] == \
+        ['remove_duplicates', 'normalize_data', 'optimize_dtypes']
+    assert np.isclose(data_ops.data['altura'].max(), 1.0)